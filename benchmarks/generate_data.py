@@ -0,0 +1,137 @@
+"""Fill a database with synthetic QC lab data for benchmarking.
+
+    python -m benchmarks.generate_data --url sqlite:///bench.db \
+        --tool-types 50 --tools 100000 --records 20000000 --years 5
+
+The schema is created/upgraded through the normal migrations first. Rows
+are inserted with chunked multi-row Core inserts, so generating millions
+of validation records takes minutes, not hours. Never point this at a
+production database.
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+
+CHUNK_SIZE = 10_000
+STATUSES = ["Active"] * 90 + ["Sent for Calibration"] * 6 + ["Retired"] * 4
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="database URL (default: QC_DB_URL / config.ini)")
+    parser.add_argument("--tool-types", type=int, default=50)
+    parser.add_argument("--technicians", type=int, default=25)
+    parser.add_argument("--tools", type=int, default=100_000)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _insert_chunks(conn, table, rows, total, label):
+    started = time.perf_counter()
+    done = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            conn.execute(table.insert(), chunk)
+            done += len(chunk)
+            chunk = []
+            print(f"\r  {label}: {done:,}/{total:,}", end="", flush=True)
+    if chunk:
+        conn.execute(table.insert(), chunk)
+        done += len(chunk)
+    print(f"\r  {label}: {done:,}/{total:,} in {time.perf_counter() - started:.1f}s")
+
+
+def generate(args):
+    # Imported after --url is applied so the engine picks it up
+    from database.db import get_engine, session_scope
+    from database import tool_summary
+    from database.calibration import calibration_due
+    from database.migrate import upgrade_database
+    from models.models import ToolType, LabTechnician, ToolRegistration, ValidationRecord
+
+    upgrade_database()
+    rng = random.Random(args.seed)
+    today = date.today()
+    history_days = 365 * args.years
+
+    tool_types = []
+    for i in range(1, args.tool_types + 1):
+        block_1 = round(rng.uniform(1, 100), 3)
+        blocks = [block_1, round(block_1 * 2, 3) if i % 2 else None, round(block_1 * 3, 3) if i % 3 == 0 else None]
+        tool_types.append(dict(
+            tool_type_id=i, tool_name=f"Tool Type {i:03d}",
+            block_1=blocks[0], block_2=blocks[1], block_3=blocks[2],
+            tolerance=round(rng.choice([0.001, 0.002, 0.005, 0.01]), 4),
+        ))
+
+    technicians = [
+        dict(technician_id=i, name=f"Technician {i:03d}", email=f"tech{i:03d}@example.com", password="password")
+        for i in range(1, args.technicians + 1)
+    ]
+
+    serials = [f"SN{n:08d}" for n in range(1, args.tools + 1)]
+    tool_type_of = {}
+
+    def tool_rows():
+        for serial in serials:
+            tool_type_id = rng.randint(1, args.tool_types)
+            tool_type_of[serial] = tool_type_id
+            last_calibration = today - timedelta(days=rng.randint(0, 240))
+            yield dict(
+                serial_number=serial,
+                tool_type_id=tool_type_id,
+                tool_status=rng.choice(STATUSES),
+                last_calibration=last_calibration,
+                calibration_due=calibration_due(last_calibration),
+                modified_by=rng.randint(1, args.technicians),
+            )
+
+    def record_rows():
+        types = {t["tool_type_id"]: t for t in tool_types}
+        for _ in range(args.records):
+            serial = rng.choice(serials)
+            tool_type = types[tool_type_of[serial]]
+            failed = rng.random() < args.fail_rate
+            readings = []
+            for block in (tool_type["block_1"], tool_type["block_2"], tool_type["block_3"]):
+                if block is None:
+                    readings.append(None)
+                    continue
+                spread = tool_type["tolerance"] * (3 if failed else 0.9)
+                readings.append(round(block + rng.uniform(-spread, spread), 5))
+            in_range = all(
+                r is None or abs(r - b) <= tool_type["tolerance"]
+                for r, b in zip(readings, (tool_type["block_1"], tool_type["block_2"], tool_type["block_3"]))
+            )
+            yield dict(
+                serial_number=serial,
+                validation_date=today - timedelta(days=rng.randint(0, history_days)),
+                technician_id=rng.randint(1, args.technicians),
+                reading_1=readings[0], reading_2=readings[1], reading_3=readings[2],
+                validation_status="Pass" if in_range else "Fail",
+            )
+
+    print(f"Generating into {get_engine().url.render_as_string(hide_password=True)}")
+    with get_engine().begin() as conn:
+        _insert_chunks(conn, ToolType.__table__, tool_types, len(tool_types), "tool types")
+        _insert_chunks(conn, LabTechnician.__table__, technicians, len(technicians), "technicians")
+        _insert_chunks(conn, ToolRegistration.__table__, tool_rows(), len(serials), "tools")
+        _insert_chunks(conn, ValidationRecord.__table__, record_rows(), args.records, "validation records")
+
+    print("Building tool status summary")
+    with session_scope() as db:
+        tool_summary.rebuild(db)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.url:
+        os.environ["QC_DB_URL"] = args.url
+    generate(args)
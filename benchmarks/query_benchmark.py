@@ -0,0 +1,142 @@
+"""Time each page's real query path against a (synthetic) database.
+
+    python -m benchmarks.query_benchmark --url sqlite:///bench.db --iterations 50
+    python -m benchmarks.query_benchmark --save baseline.json
+    python -m benchmarks.query_benchmark --compare baseline.json --tolerance 1.25
+
+Every case calls the same database/queries.py function the page uses,
+inside its own session, and reports p50/p95 latency. Write cases run in
+a transaction that is rolled back, so the data set is left unchanged.
+With --compare the run exits non-zero if any case's p95 regressed past
+the tolerance factor.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="database URL (default: QC_DB_URL / config.ini)")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--update-size", type=int, default=500, help="tools per mass calibration update")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed p95 slowdown factor")
+    return parser.parse_args()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def build_cases(db, rng, update_size):
+    """Return {name: callable(db)}; sample inputs are drawn from the data once up front."""
+    from sqlalchemy import func
+    from database import queries
+    from models.models import ToolRegistration, ToolType, ValidationRecord
+
+    serials = [s for (s,) in db.query(ToolRegistration.serial_number).limit(5000)]
+    tool_type_ids = [t for (t,) in db.query(ToolType.tool_type_id)]
+    newest, oldest = db.query(func.max(ValidationRecord.validation_date), func.min(ValidationRecord.validation_date)).one()
+    if not serials or not tool_type_ids or newest is None:
+        sys.exit("Database is empty; run benchmarks.generate_data first.")
+    span = max(1, (newest - oldest).days)
+
+    def random_day():
+        return oldest + timedelta(days=rng.randint(0, span))
+
+    def tool_history_first_page(db, serial):
+        tool = queries.get_tool(db, serial)
+        return queries.get_tool_history_page(db, serial, tool.tool_type_id)
+
+    return {
+        "serial lookup": lambda db: queries.get_tool_snapshot(db, rng.choice(serials), date.today()),
+        "daily records (first page)": lambda db: queries.get_daily_records_page(db, random_day()),
+        "tool history (first page)": lambda db: tool_history_first_page(db, rng.choice(serials)),
+        "mass calibration load": lambda db: queries.get_active_tools(db, rng.choice(tool_type_ids)),
+        "mass calibration update": lambda db: queries.update_tools(
+            db, rng.sample(serials, min(update_size, len(serials))), "Active", date.today(), None),
+        "upcoming calibrations": lambda db: queries.get_upcoming_calibrations_page(db, date.today(), 30),
+        "dashboard KPIs": lambda db: (
+            queries.count_validations_today(db, date.today()),
+            queries.count_calibration_due(db, date.today()),
+            queries.count_under_calibration(db),
+        ),
+    }
+
+
+def run(args):
+    from database.db import SessionLocal, get_engine
+
+    get_engine()
+    rng = random.Random(args.seed)
+    setup = SessionLocal()
+    try:
+        cases = build_cases(setup, rng, args.update_size)
+    finally:
+        setup.close()
+
+    results = {}
+    for name, case in cases.items():
+        samples = []
+        for _ in range(args.iterations):
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                case(db)
+                db.flush()
+                samples.append((time.perf_counter() - started) * 1000)
+            finally:
+                db.rollback()
+                db.close()
+        results[name] = {
+            "p50_ms": percentile(samples, 50),
+            "p95_ms": percentile(samples, 95),
+            "mean_ms": statistics.fmean(samples),
+            "max_ms": max(samples),
+            "iterations": len(samples),
+        }
+    return results
+
+
+def report(results, baseline=None, tolerance=1.25):
+    regressions = []
+    print(f"{'case':<28}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}{'max ms':>10}  vs baseline p95")
+    for name, r in results.items():
+        line = f"{name:<28}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['mean_ms']:>10.2f}{r['max_ms']:>10.2f}"
+        if baseline and name in baseline:
+            ratio = r["p95_ms"] / max(baseline[name]["p95_ms"], 1e-6)
+            flag = "  REGRESSION" if ratio > tolerance else ""
+            line += f"  x{ratio:.2f}{flag}"
+            if flag:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.url:
+        os.environ["QC_DB_URL"] = args.url
+    results = run(args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        sys.exit(f"p95 regressions: {', '.join(regressions)}")
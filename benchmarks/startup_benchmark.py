@@ -0,0 +1,163 @@
+"""Time how long the application takes to show the login window.
+
+    python -m benchmarks.startup_benchmark --url sqlite:///bench.db --runs 10
+    python -m benchmarks.startup_benchmark --exe dist/main/main --save baseline.json
+    python -m benchmarks.startup_benchmark --compare baseline.json --importtime
+
+Each run launches the application (python main.py, or a PyInstaller
+build with --exe) with QC_STARTUP_TRACE set, so it records its startup
+milestones (utils/startup_trace.py) and quits by itself once the login
+window has painted and the database layer has loaded in the background.
+Times are measured from the moment the process was launched, which for a
+one-file build includes unpacking the bundle. --importtime adds one
+source run under python -X importtime and lists the slowest top-level
+imports. With --compare the run exits non-zero if time to first paint
+regressed past the tolerance factor.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (milestone, what the time up to it covers)
+MILESTONES = [
+    ("main_started", "process launch, bundle unpack, interpreter"),
+    ("qt_imported", "PySide6 and the router"),
+    ("login_built", "QApplication and the login page"),
+    ("first_paint", "window shown and painted"),
+    ("database_ready", "SQLAlchemy, models and first connection (background)"),
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="database URL (default: QC_DB_URL / config.ini)")
+    parser.add_argument("--exe", help="built executable to launch instead of python main.py")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=120, help="seconds before a run is abandoned")
+    parser.add_argument("--importtime", action="store_true", help="also list the slowest imports")
+    parser.add_argument("--save", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed first-paint slowdown factor")
+    return parser.parse_args()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def launch_command(exe, extra_python_args=()):
+    if exe:
+        return [os.path.abspath(exe)]
+    return [sys.executable, *extra_python_args, os.path.join(REPO_DIR, "main.py")]
+
+
+def run_once(command, timeout):
+    """Launch once; returns (milestone -> ms since launch, trace info, stderr)."""
+    fd, trace_path = tempfile.mkstemp(suffix=".json", prefix="qc_startup_")
+    os.close(fd)
+    try:
+        env = dict(os.environ, QC_STARTUP_TRACE=trace_path)
+        launched = time.time()
+        proc = subprocess.run(command, env=env, cwd=REPO_DIR, capture_output=True, text=True, timeout=timeout)
+        with open(trace_path) as f:
+            content = f.read()
+        if not content:
+            sys.exit(f"No startup trace written (exit code {proc.returncode}):\n{proc.stderr[-2000:]}")
+        trace = json.loads(content)
+    finally:
+        os.remove(trace_path)
+    marks = {name: (at - launched) * 1000 for name, at in trace.pop("marks").items()}
+    return marks, trace, proc.stderr
+
+
+def run(args):
+    command = launch_command(args.exe)
+    samples = defaultdict(list)
+    info = None
+    for _ in range(args.runs):
+        marks, info, _ = run_once(command, args.timeout)
+        if "database_failed" in marks:
+            print("warning: the database could not be reached; database_ready is missing from this run")
+        for name, ms in marks.items():
+            samples[name].append(ms)
+
+    results = {}
+    for name, _ in MILESTONES:
+        if samples[name]:
+            results[name] = {
+                "p50_ms": percentile(samples[name], 50),
+                "p95_ms": percentile(samples[name], 95),
+                "mean_ms": statistics.fmean(samples[name]),
+                "runs": len(samples[name]),
+            }
+    return results, info
+
+
+def import_breakdown(timeout, top=15):
+    """Cumulative import time per top-level module, from one python -X importtime run."""
+    _, _, stderr = run_once(launch_command(None, ["-X", "importtime"]), timeout)
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name[1:].startswith("  "):
+            continue  # nested: already counted in its parent's cumulative time
+        totals[name.strip().split(".")[0]] += int(cumulative)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def report(results, info, baseline=None, tolerance=1.25):
+    regressions = []
+    print(f"{'milestone':<16}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}  covers")
+    for name, covers in MILESTONES:
+        if name not in results:
+            continue
+        r = results[name]
+        line = f"{name:<16}{r['p50_ms']:>10.0f}{r['p95_ms']:>10.0f}{r['mean_ms']:>10.0f}  {covers}"
+        if baseline and name in baseline:
+            ratio = r["p50_ms"] / max(baseline[name]["p50_ms"], 1e-6)
+            flag = "  REGRESSION" if ratio > tolerance and name == "first_paint" else ""
+            line += f"  x{ratio:.2f}{flag}"
+            if flag:
+                regressions.append(name)
+        print(line)
+    if info:
+        print(f"modules loaded at first paint: {info['modules_at_first_paint']}")
+        if info["heavy_before_first_paint"]:
+            print(f"imported before first paint (should be deferred): {', '.join(info['heavy_before_first_paint'])}")
+    return regressions
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.url:
+        os.environ["QC_DB_URL"] = args.url
+    results, info = run(args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    regressions = report(results, info, baseline, args.tolerance)
+
+    if args.importtime:
+        print("\nslowest imports (one source run, including the background preload):")
+        for name, micros in import_breakdown(args.timeout):
+            print(f"  {name:<32}{micros / 1000:>8.0f} ms")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        sys.exit(f"startup regressions: {', '.join(regressions)}")
@@ -0,0 +1,47 @@
+"""Calibration schedule rules, and which tools may be validated.
+
+tool_registrations.calibration_due is stored (and indexed) rather than
+computed, so due/overdue lists are a range scan. Every write that sets
+last_calibration must set calibration_due from it with calibration_due().
+"""
+from dateutil.relativedelta import relativedelta
+
+# A tool is overdue this long after its last calibration
+CALIBRATION_INTERVAL = relativedelta(months=6)
+
+# ...and should be sent for calibration a month before that
+SEND_BY_INTERVAL = relativedelta(months=5)
+
+
+def calibration_due(last_calibration):
+    return last_calibration + CALIBRATION_INTERVAL if last_calibration else None
+
+
+def send_by(last_calibration):
+    return last_calibration + SEND_BY_INTERVAL if last_calibration else None
+
+
+def blocking_reason(snapshot, today, pending_status=None):
+    """Why this tool cannot be validated today (same rules as ValidationPage), or None.
+
+    pending_status is the status of a validation for today still waiting in
+    the local journal, if any.
+    """
+    if snapshot is None:
+        return "Tool not found"
+    if snapshot.tool_type is None:
+        return "Tool has no tool type"
+    if snapshot.tool_status == "Retired":
+        return "Tool is retired"
+    if snapshot.tool_status == "Sent for Calibration":
+        return "Tool is under calibration"
+    if pending_status is not None:
+        if pending_status != "Fail":
+            return "Already validated today"
+    elif snapshot.validated_today and not (
+        snapshot.latest_validation_date == today and snapshot.latest_validation_status == "Fail"
+    ):
+        return "Already validated today"
+    if snapshot.calibration_due and today > snapshot.calibration_due:
+        return "Overdue for calibration"
+    return None
@@ -0,0 +1,171 @@
+"""Streaming export of validation records to CSV or Parquet.
+
+Rows come from a server-side cursor in chunks of EXPORT_CHUNK_SIZE
+(yield_per) and each chunk is written out before the next is fetched, so
+memory stays bounded however many records are exported. The file is
+written next to the target as "<name>.part" and only renamed into place
+once complete; a failed or cancelled export leaves nothing behind.
+
+Parquet needs pyarrow, which is optional (pip install pyarrow); CSV has
+no extra dependencies.
+
+Run as a DbExecutor job with on_progress, e.g.
+    get_db_executor().submit(export.export_records, export.daily_records_query(day), path, "csv",
+                             on_progress=..., on_result=...)
+"""
+import csv
+import importlib.util
+import os
+from typing import NamedTuple
+from sqlalchemy import select, func
+from models.models import ToolRegistration, ToolType, ValidationRecord, LabTechnician
+
+EXPORT_CHUNK_SIZE = 10000
+
+FORMATS = ("csv", "parquet")
+
+# (column name, pyarrow type name) in file order
+COLUMNS = [
+    ("validation_id", "int64"),
+    ("validation_date", "date32"),
+    ("serial_number", "string"),
+    ("tool_type", "string"),
+    ("block_1", "float64"),
+    ("reading_1", "float64"),
+    ("block_2", "float64"),
+    ("reading_2", "float64"),
+    ("block_3", "float64"),
+    ("reading_3", "float64"),
+    ("tolerance", "float64"),
+    ("validation_status", "string"),
+    ("technician", "string"),
+]
+
+
+class ExportResult(NamedTuple):
+    path: str
+    rows: int
+    cancelled: bool
+
+
+def _records_query():
+    # Same rows as the daily records and tool history pages: records of
+    # registered tools with a tool type. The technician is outer-joined
+    # because the pages show a blank name for an unknown technician_id.
+    return (
+        select(
+            ValidationRecord.validation_id,
+            ValidationRecord.validation_date,
+            ValidationRecord.serial_number,
+            ToolType.tool_name,
+            ToolType.block_1, ValidationRecord.reading_1,
+            ToolType.block_2, ValidationRecord.reading_2,
+            ToolType.block_3, ValidationRecord.reading_3,
+            ToolType.tolerance,
+            ValidationRecord.validation_status,
+            LabTechnician.name,
+        )
+        .select_from(ValidationRecord)
+        .join(ToolRegistration, ToolRegistration.serial_number == ValidationRecord.serial_number)
+        .join(ToolType, ToolType.tool_type_id == ToolRegistration.tool_type_id)
+        .outerjoin(LabTechnician, LabTechnician.technician_id == ValidationRecord.technician_id)
+    )
+
+
+def daily_records_query(selected_date):
+    """Every record of one day, in the order of the daily records table."""
+    return (
+        _records_query()
+        .where(ValidationRecord.validation_date == selected_date)
+        .order_by(ValidationRecord.validation_id)
+    )
+
+
+def tool_history_query(serial, start_date=None, end_date=None):
+    """A tool's records, newest first; either date bound may be None."""
+    query = _records_query().where(ValidationRecord.serial_number == serial)
+    if start_date is not None:
+        query = query.where(ValidationRecord.validation_date >= start_date)
+    if end_date is not None:
+        query = query.where(ValidationRecord.validation_date <= end_date)
+    return query.order_by(ValidationRecord.validation_date.desc(), ValidationRecord.validation_id.desc())
+
+
+def parquet_available():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in COLUMNS])
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    # One row group per chunk
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow); export to CSV instead.")
+        self._pa = pa
+        self._schema = pa.schema([(name, getattr(pa, type_name)()) for name, type_name in COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        columns = list(zip(*rows))
+        self._writer.write_table(self._pa.Table.from_arrays(
+            [self._pa.array(values, type=field.type) for values, field in zip(columns, self._schema)],
+            schema=self._schema,
+        ))
+
+    def close(self):
+        self._writer.close()
+
+
+def export_records(db, query, path, fmt, chunk_size=EXPORT_CHUNK_SIZE, cancelled=None, progress=None):
+    """Write the rows of query (one of the *_query() builders) to path as fmt ("csv" or "parquet").
+
+    progress(done, total) is called after every chunk; cancelled, if given,
+    is polled between chunks (e.g. threading.Event().is_set) and stops the
+    export without leaving a file. Returns an ExportResult.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    total = db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    if progress:
+        progress(0, total)
+
+    part_path = path + ".part"
+    writer = _ParquetWriter(part_path) if fmt == "parquet" else _CsvWriter(part_path)
+    done = 0
+    stopped = finished = False
+    try:
+        try:
+            result = db.execute(query.execution_options(yield_per=chunk_size))
+            for chunk in result.partitions():
+                if cancelled and cancelled():
+                    result.close()
+                    stopped = True
+                    break
+                writer.write(chunk)
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+        finally:
+            writer.close()
+        if not stopped:
+            os.replace(part_path, path)
+            finished = True
+    finally:
+        if not finished and os.path.exists(part_path):
+            os.remove(part_path)
+    return ExportResult(path, done, stopped)
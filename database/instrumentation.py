@@ -0,0 +1,107 @@
+"""Per-statement SQL latency tracking via engine cursor events.
+
+Every statement's latency and row count is recorded against the action
+that issued it (see action_tag), in an in-memory histogram. Statements
+slower than the configured threshold are also written to a rotating
+slow-query log. The diagnostics dialog reads the summary from here.
+"""
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from sqlalchemy import event
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+_current_action = ContextVar("current_action", default="untagged")
+_lock = threading.Lock()
+_histogram = [0] * (len(BUCKETS_MS) + 1)
+_stats = {}  # (action, statement) -> dict(count, total_ms, max_ms, rows)
+
+slow_query_logger = logging.getLogger("qc.slow_queries")
+slow_query_logger.propagate = False
+_slow_threshold_ms = None
+
+
+@contextmanager
+def action_tag(action):
+    """Attribute statements run inside the block to the given page/action name."""
+    token = _current_action.set(action)
+    try:
+        yield
+    finally:
+        _current_action.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+    rows = cursor.rowcount if cursor.rowcount is not None else -1
+    record_statement(_current_action.get(), statement, elapsed_ms, rows)
+
+
+def record_statement(action, statement, elapsed_ms, rows):
+    key = (action, " ".join(statement.split()))
+    with _lock:
+        _histogram[bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+        entry = _stats.get(key)
+        if entry is None:
+            entry = _stats[key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0}
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        if rows > 0:
+            entry["rows"] += rows
+
+    if _slow_threshold_ms is not None and elapsed_ms >= _slow_threshold_ms:
+        slow_query_logger.warning("%.1f ms | %s | rows=%s | %s", elapsed_ms, action, rows, key[1])
+
+
+def install(engine, slow_query_ms, log_path):
+    """Attach the cursor listeners to engine and route slow statements to log_path."""
+    global _slow_threshold_ms
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    if slow_query_ms > 0:
+        _slow_threshold_ms = slow_query_ms
+        if not slow_query_logger.handlers:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            handler = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=5, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            slow_query_logger.addHandler(handler)
+            slow_query_logger.setLevel(logging.WARNING)
+
+
+def top_offenders(limit=20):
+    """Statements sorted by total time spent, as a list of dicts."""
+    with _lock:
+        rows = [
+            dict(action=action, statement=statement, avg_ms=entry["total_ms"] / entry["count"], **entry)
+            for (action, statement), entry in _stats.items()
+        ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows[:limit]
+
+
+def latency_histogram():
+    """List of (bucket label, count) pairs."""
+    with _lock:
+        counts = list(_histogram)
+    labels = [f"<= {bound} ms" for bound in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]} ms"]
+    return list(zip(labels, counts))
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+        for i in range(len(_histogram)):
+            _histogram[i] = 0
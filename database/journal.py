@@ -0,0 +1,112 @@
+"""Local write-ahead journal for validation submissions.
+
+A validation is first written to a small SQLite file on the station and
+only then uploaded to the server by the background flusher
+(utils/journal_flusher.py), so a slow or unreachable server never loses
+readings or makes the technician wait. Every journaled record gets a
+submission_id (UUID) that is stored with the uploaded row; a retried
+upload skips ids the server already has.
+
+Records the server rejects (e.g. the tool was deleted meanwhile) stay in
+the journal marked rejected, with the error, instead of being retried.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import date
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_validations (
+    submission_id TEXT PRIMARY KEY,
+    serial_number TEXT NOT NULL,
+    validation_date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    rejected INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+)
+"""
+
+
+class SubmissionJournal:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        # Autocommit mode; every write below is a single statement or an explicit transaction
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")  # a record is on disk before append() returns
+        self._conn.execute(_SCHEMA)
+
+    def append(self, records):
+        """Journal validation records (dicts of ValidationRecord columns); returns their submission_ids."""
+        rows = []
+        for record in records:
+            record = dict(record, submission_id=str(uuid.uuid4()))
+            rows.append((
+                record["submission_id"], record["serial_number"], record["validation_date"].isoformat(),
+                json.dumps(record, default=date.isoformat), time.time(),
+            ))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO pending_validations (submission_id, serial_number, validation_date, payload, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [row[0] for row in rows]
+
+    def pending(self, limit):
+        """Oldest records awaiting upload, as dicts ready for insert."""
+        with self._lock:
+            payloads = self._conn.execute(
+                "SELECT payload FROM pending_validations WHERE rejected = 0 ORDER BY created_at LIMIT ?", (limit,)
+            ).fetchall()
+        records = []
+        for (payload,) in payloads:
+            record = json.loads(payload)
+            record["validation_date"] = date.fromisoformat(record["validation_date"])
+            records.append(record)
+        return records
+
+    def remove(self, submission_ids):
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM pending_validations WHERE submission_id = ?", [(i,) for i in submission_ids])
+
+    def reject(self, errors):
+        """errors: {submission_id: message} for records the server refused."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE pending_validations SET rejected = 1, last_error = ? WHERE submission_id = ?",
+                [(message, i) for i, message in errors.items()])
+
+    def counts(self):
+        """(waiting for upload, rejected)"""
+        with self._lock:
+            waiting, rejected = self._conn.execute(
+                "SELECT COALESCE(SUM(rejected = 0), 0), COALESCE(SUM(rejected), 0) FROM pending_validations"
+            ).fetchone()
+        return waiting, rejected
+
+    def latest_pending_status(self, serial_number, validation_date):
+        """Status of the newest not-yet-uploaded record for this tool and day, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM pending_validations"
+                " WHERE serial_number = ? AND validation_date = ? AND rejected = 0"
+                " ORDER BY created_at DESC LIMIT 1",
+                (serial_number, validation_date.isoformat()),
+            ).fetchone()
+        return json.loads(row[0])["validation_status"] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,23 @@
+"""Apply schema migrations: python -m database.migrate [revision]
+
+Equivalent to `alembic upgrade head`, using the application's database
+settings. Safe to run against an existing site: already-applied
+revisions are skipped.
+"""
+import os
+import sys
+from alembic import command
+from alembic.config import Config
+from database.config import app_dir
+
+
+def alembic_config():
+    return Config(os.path.join(app_dir(), "alembic.ini"))
+
+
+def upgrade_database(revision="head"):
+    command.upgrade(alembic_config(), revision)
+
+
+if __name__ == "__main__":
+    upgrade_database(sys.argv[1] if len(sys.argv) > 1 else "head")
@@ -0,0 +1,363 @@
+"""Query paths used by the pages.
+
+Every function takes an open session as its first argument so it can run
+inside session_scope() on the GUI thread or as a DbExecutor job. Results
+must be fully loaded before returning: the session is closed afterwards.
+"""
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+from sqlalchemy import tuple_, update, insert, select, func, case, distinct
+from sqlalchemy.exc import IntegrityError, DataError
+from sqlalchemy.orm import contains_eager
+from models.models import ToolRegistration, ToolType, ValidationRecord, LabTechnician, ToolStatusSummary
+from database import tool_summary
+from database.calibration import calibration_due
+from database.reference_cache import reference_cache, ToolTypeInfo
+
+
+def find_technician(db, name):
+    return db.query(LabTechnician).filter(LabTechnician.name == name).first()
+
+
+def get_tool_types(db):
+    return reference_cache.tool_types(db)
+
+
+def get_daily_records_page(db, selected_date, after_key=None, limit=200):
+    """One page of the daily records table for selected_date, keyed by validation_id.
+
+    Returns (validation_id, row) pairs in the column order of the daily
+    records table. The tool type's name, blocks and tolerance are joined in
+    (a small table, so the plan still walks the (validation_date,
+    validation_id) index from after_key); technician names come from the
+    reference cache.
+    """
+    query = db.query(
+        ValidationRecord.validation_id,
+        ValidationRecord.serial_number,
+        ToolType.tool_name,
+        ToolType.block_1,
+        ToolType.block_2,
+        ToolType.block_3,
+        ToolType.tolerance,
+        ValidationRecord.reading_1,
+        ValidationRecord.reading_2,
+        ValidationRecord.reading_3,
+        ValidationRecord.validation_status,
+        ValidationRecord.technician_id,
+    ).join(ToolRegistration, ToolRegistration.serial_number == ValidationRecord.serial_number) \
+     .join(ToolType, ToolType.tool_type_id == ToolRegistration.tool_type_id) \
+     .filter(ValidationRecord.validation_date == selected_date)
+    if after_key is not None:
+        query = query.filter(ValidationRecord.validation_id > after_key)
+    rows = query.order_by(ValidationRecord.validation_id).limit(limit).all()
+
+    records = []
+    for (validation_id, serial, tool_name, block_1, block_2, block_3, tolerance,
+         reading_1, reading_2, reading_3, status, technician_id) in rows:
+        records.append((validation_id, (
+            serial, tool_name,
+            block_1, reading_1, status,
+            block_2, reading_2, status,
+            block_3, reading_3, status,
+            tolerance, status,
+            reference_cache.technician_name(technician_id, db),
+        )))
+    return records
+
+
+def get_tool(db, serial):
+    """The tool with its tool type loaded, or None (only tools with a type are returned)."""
+    return (
+        db.query(ToolRegistration)
+        .join(ToolType)
+        .options(contains_eager(ToolRegistration.tool_type))
+        .filter(ToolRegistration.serial_number == serial)
+        .first()
+    )
+
+
+def get_tool_history_page(db, serial, tool_type_id, start_date=None, end_date=None, after_key=None, limit=200):
+    """One page of a tool's validation history, newest first.
+
+    Keyset pagination on (validation_date, validation_id): after_key is the
+    last key of the previous page, so every page is a range scan of the
+    (serial_number, validation_date, validation_id) index and costs the
+    same however far back the history goes. Either date bound may be None.
+    Rows are streamed from a server-side cursor rather than buffered.
+    """
+    # Primary-key lookup rather than the reference cache, which may not have this type yet
+    tool_type = db.get(ToolType, tool_type_id)
+    if tool_type is None:
+        raise ValueError(f"Tool type {tool_type_id} does not exist.")
+    query = db.query(
+        ValidationRecord.validation_date,
+        ValidationRecord.validation_id,
+        ValidationRecord.reading_1,
+        ValidationRecord.reading_2,
+        ValidationRecord.reading_3,
+        ValidationRecord.validation_status,
+        ValidationRecord.technician_id,
+    ).filter(ValidationRecord.serial_number == serial)
+    if start_date is not None:
+        query = query.filter(ValidationRecord.validation_date >= start_date)
+    if end_date is not None:
+        query = query.filter(ValidationRecord.validation_date <= end_date)
+    if after_key is not None:
+        query = query.filter(tuple_(ValidationRecord.validation_date, ValidationRecord.validation_id) < after_key)
+    query = (
+        query.order_by(ValidationRecord.validation_date.desc(), ValidationRecord.validation_id.desc())
+        .limit(limit)
+        .execution_options(stream_results=True, max_row_buffer=limit)
+    )
+
+    records = []
+    for validation_date, validation_id, reading_1, reading_2, reading_3, status, technician_id in query:
+        records.append(((validation_date, validation_id), (
+            validation_date.strftime('%Y-%m-%d'),
+            tool_type.block_1, reading_1, status,
+            tool_type.block_2, reading_2, status,
+            tool_type.block_3, reading_3, status,
+            tool_type.tolerance, status,
+            reference_cache.technician_name(technician_id, db),
+        )))
+    return records
+
+
+def get_active_tools(db, tool_type_id):
+    """Rows of (serial_number, tool_status, last_calibration, calibration_due) for the mass calibration list."""
+    # Only fetch tools that are NOT retired
+    return db.execute(
+        select(
+            ToolRegistration.serial_number,
+            ToolRegistration.tool_status,
+            ToolRegistration.last_calibration,
+            ToolRegistration.calibration_due,
+        )
+        .where(
+            ToolRegistration.tool_type_id == tool_type_id,
+            ToolRegistration.tool_status != "Retired",
+        )
+    ).all()
+
+
+# Serials per UPDATE ... IN (...) statement; well under SQLite's bound parameter limit
+UPDATE_CHUNK_SIZE = 500
+
+
+def update_tools(db, serial_numbers, new_status, new_date, modified_by, chunk_size=UPDATE_CHUNK_SIZE, progress=None):
+    """Apply a status and/or calibration date to the given tools; returns the number updated.
+
+    Sends one set-based UPDATE per chunk of serials, all in the caller's
+    transaction, so the cost grows with the number of chunks rather than
+    the number of tools. The count is the sum of the rows each statement
+    matched. progress(done, total), if given, is called after each chunk.
+    """
+    values = {"modified_by": modified_by}
+    if new_status:
+        values["tool_status"] = new_status
+    if new_date:
+        values["last_calibration"] = new_date
+        values["calibration_due"] = calibration_due(new_date)
+
+    serial_numbers = list(dict.fromkeys(serial_numbers))  # drop duplicates, keep order
+    total = len(serial_numbers)
+    updated = 0
+    for start in range(0, total, chunk_size):
+        chunk = serial_numbers[start:start + chunk_size]
+        result = db.execute(
+            update(ToolRegistration)
+            .where(ToolRegistration.serial_number.in_(chunk))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        updated += result.rowcount
+        if progress:
+            progress(start + len(chunk), total)
+    return updated
+
+
+class ToolSnapshot(NamedTuple):
+    """Everything the validation page needs about one tool, read in one statement."""
+    serial_number: str
+    tool_status: str
+    last_calibration: Optional[date]
+    tool_type: Optional[ToolTypeInfo]
+    latest_validation_date: Optional[date]
+    latest_validation_status: Optional[str]
+    validated_today: bool
+    calibration_due: Optional[date]
+
+
+def _snapshot_query():
+    return (
+        select(
+            ToolRegistration.serial_number,
+            ToolRegistration.tool_status,
+            ToolRegistration.last_calibration,
+            ToolRegistration.calibration_due,
+            ToolType.tool_type_id, ToolType.tool_name,
+            ToolType.block_1, ToolType.block_2, ToolType.block_3, ToolType.tolerance,
+            ToolStatusSummary.last_validation_date,
+            ToolStatusSummary.latest_result,
+        )
+        .outerjoin(ToolType, ToolType.tool_type_id == ToolRegistration.tool_type_id)
+        .outerjoin(ToolStatusSummary, ToolStatusSummary.serial_number == ToolRegistration.serial_number)
+    )
+
+
+def _to_snapshot(row, today):
+    serial_number, tool_status, last_calibration, due, tool_type_id, *type_fields, latest_date, latest_status = row
+    return ToolSnapshot(
+        serial_number, tool_status, last_calibration,
+        ToolTypeInfo(tool_type_id, *type_fields) if tool_type_id is not None else None,
+        latest_date, latest_status, latest_date == today, due,
+    )
+
+
+def get_tool_snapshot(db, serial, today):
+    """The ToolSnapshot for serial, or None if there is no such tool.
+
+    Tool, tool type and the tool's status summary (latest validation) come
+    back as one row of primary-key joins; no validation history is read.
+    """
+    row = db.execute(_snapshot_query().where(ToolRegistration.serial_number == serial)).first()
+    return _to_snapshot(row, today) if row is not None else None
+
+
+def get_tool_snapshots(db, serials, today, chunk_size=UPDATE_CHUNK_SIZE):
+    """{serial: ToolSnapshot} for the given serials that exist, one statement per chunk."""
+    serials = list(dict.fromkeys(serials))
+    snapshots = {}
+    for start in range(0, len(serials), chunk_size):
+        rows = db.execute(
+            _snapshot_query().where(ToolRegistration.serial_number.in_(serials[start:start + chunk_size]))
+        ).all()
+        snapshots.update((row.serial_number, _to_snapshot(row, today)) for row in rows)
+    return snapshots
+
+
+# Rows per multi-row INSERT for batch validation
+INSERT_CHUNK_SIZE = 500
+
+
+def add_validation_records(db, records, chunk_size=INSERT_CHUNK_SIZE):
+    """Insert many validation records (dicts of column values); returns one entry per
+    record: None if it was saved, else the error message.
+
+    Each chunk goes in as a multi-row INSERT inside a savepoint. If a chunk
+    is refused, its rows are retried one at a time so only the bad rows are
+    reported and the rest of the batch is still saved. Connection errors
+    and timeouts are not row problems and propagate.
+    """
+    errors = [None] * len(records)
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        try:
+            with db.begin_nested():
+                db.execute(insert(ValidationRecord), chunk)
+        except (IntegrityError, DataError):
+            for offset, record in enumerate(chunk):
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(ValidationRecord), [record])
+                except (IntegrityError, DataError) as e:
+                    errors[start + offset] = str(getattr(e, "orig", None) or e).splitlines()[0]
+    tool_summary.refresh(db, [record["serial_number"] for record, error in zip(records, errors) if error is None])
+    return errors
+
+
+def add_journaled_records(db, records):
+    """Upload records from a station's journal (each with a submission_id).
+
+    Records whose submission_id is already on the server (an upload retried
+    after its commit went through) are skipped. Returns {submission_id:
+    error} for the records the database refused.
+    """
+    submission_ids = [record["submission_id"] for record in records]
+    saved = set(db.scalars(
+        select(ValidationRecord.submission_id).where(ValidationRecord.submission_id.in_(submission_ids))
+    ))
+    new = [record for record in records if record["submission_id"] not in saved]
+    errors = add_validation_records(db, new)
+    return {record["submission_id"]: error for record, error in zip(new, errors) if error}
+
+
+# Dashboard KPIs: each runs as its own job so the dashboard can issue them in parallel
+
+# Statuses of tools that are away being calibrated (mass calibration / tool update pages)
+CALIBRATION_STATUSES = ("Under Calibration", "Sent for Calibration")
+
+
+def count_validations_today(db, today):
+    """(tools validated today, tools with a failed validation today); an index range scan on the date."""
+    validated, failed = db.execute(
+        select(
+            func.count(distinct(ValidationRecord.serial_number)),
+            func.count(distinct(case(
+                (ValidationRecord.validation_status == "Fail", ValidationRecord.serial_number)
+            ))),
+        ).where(ValidationRecord.validation_date == today)
+    ).one()
+    return validated, failed
+
+
+def count_calibration_due(db, today, within_days=30):
+    """(in-service tools due within within_days, in-service tools already overdue)."""
+    horizon = today + timedelta(days=within_days)
+    due_soon, overdue = db.execute(
+        select(
+            func.count(case((ToolRegistration.calibration_due >= today, 1))),
+            func.count(case((ToolRegistration.calibration_due < today, 1))),
+        )
+        .where(
+            ToolRegistration.calibration_due <= horizon,
+            ToolRegistration.tool_status.not_in(("Retired",) + CALIBRATION_STATUSES),
+        )
+    ).one()
+    return due_soon, overdue
+
+
+def count_under_calibration(db):
+    return db.scalar(
+        select(func.count()).select_from(ToolRegistration)
+        .where(ToolRegistration.tool_status.in_(CALIBRATION_STATUSES))
+    )
+
+
+def get_upcoming_calibrations_page(db, today, within_days, include_overdue=True, after_key=None, limit=200):
+    """One page of in-service tools due for calibration within within_days (and, with
+    include_overdue, those already past due), soonest first.
+
+    Keyed by (calibration_due, serial_number), so every page is a range scan
+    on ix_tool_registrations_calibration_due from after_key. Returns
+    (key, row) pairs in the column order of the upcoming calibrations table;
+    tool type names come from the reference cache.
+    """
+    due = ToolRegistration.calibration_due
+    horizon = today + timedelta(days=within_days)
+    query = db.query(
+        ToolRegistration.serial_number,
+        ToolRegistration.tool_type_id,
+        ToolRegistration.tool_status,
+        ToolRegistration.last_calibration,
+        due,
+    ).filter(
+        due <= horizon if include_overdue else due.between(today, horizon),
+        ToolRegistration.tool_status.not_in(("Retired",) + CALIBRATION_STATUSES),
+    )
+    if after_key is not None:
+        query = query.filter(tuple_(due, ToolRegistration.serial_number) > tuple_(*after_key))
+    rows = query.order_by(due, ToolRegistration.serial_number).limit(limit).all()
+
+    page = []
+    for serial, tool_type_id, status, last_calibration, calibration_due_date in rows:
+        tool_type = reference_cache.tool_type_by_id(tool_type_id, db)
+        days = (calibration_due_date - today).days
+        page.append(((calibration_due_date, serial), (
+            serial, tool_type.tool_name if tool_type else "", status,
+            last_calibration.strftime("%Y-%m-%d") if last_calibration else "N/A",
+            calibration_due_date.strftime("%Y-%m-%d"),
+            str(days) if days >= 0 else f"Overdue by {-days}",
+        )))
+    return page
@@ -0,0 +1,161 @@
+"""Validation records from instrument export files.
+
+Digital micrometers and height gauges export readings as CSV/text files
+into a folder the station watches (utils/reading_watcher.py). Each file is
+read as a stream, one line per validation:
+
+    serial_number, reading_1[, reading_2[, reading_3]]
+
+with or without a header row (header names: serial_number / serial / sn,
+reading_1..3 / r1..r3; a single "reading" or "value" column is reading 1).
+Semicolon- and tab-separated files are accepted too.
+
+Rows are processed in chunks: one snapshot query per chunk maps serials to
+tools and their tool type blocks, pass/fail is evaluated for the whole
+chunk at once (utils/tolerance.py), and rows for tools that cannot be
+validated today are rejected with the same rules as the validation pages.
+The accepted records are returned for the caller to journal; nothing is
+written to the database here.
+"""
+import csv
+from typing import NamedTuple
+import numpy as np
+from database import queries
+from database.calibration import blocking_reason
+from utils.tolerance import evaluate, parse_reading
+
+INGEST_CHUNK_SIZE = 500
+
+FILE_EXTENSIONS = (".csv", ".txt")
+
+HEADER_ALIASES = {
+    "serial_number": "serial_number", "serial": "serial_number", "sn": "serial_number", "serial_no": "serial_number",
+    "reading_1": "reading_1", "r1": "reading_1", "reading": "reading_1", "value": "reading_1",
+    "reading_2": "reading_2", "r2": "reading_2",
+    "reading_3": "reading_3", "r3": "reading_3",
+}
+POSITIONAL = ["serial_number", "reading_1", "reading_2", "reading_3"]
+
+
+class RejectedReading(NamedTuple):
+    line: int
+    serial_number: str
+    reason: str
+
+
+class IngestResult(NamedTuple):
+    records: list   # ValidationRecord column dicts, ready for the journal
+    rejected: list  # RejectedReading
+
+
+def _normalize_header(name):
+    return HEADER_ALIASES.get(name.strip().lower().replace(" ", "_"))
+
+
+def read_readings(path):
+    """Yield (line, serial_number, [reading_1, reading_2, reading_3] or error message) per data line."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(f, dialect)
+
+        columns = POSITIONAL
+        first_row = True
+        for line, values in enumerate(reader, start=1):
+            values = [v.strip() for v in values]
+            if not any(values):
+                continue
+            if first_row:
+                # The header, if any, is the first non-blank row (exports may start with blank lines)
+                first_row = False
+                header = [_normalize_header(v) for v in values]
+                if "serial_number" in header:
+                    columns = header
+                    continue
+            row = dict(zip(columns, values))
+            serial = row.get("serial_number", "")
+            try:
+                readings = [parse_reading(row[c]) if row.get(c) else None for c in POSITIONAL[1:]]
+            except ValueError:
+                yield line, serial, "reading is not a number"
+                continue
+            yield line, serial, readings
+
+
+def _evaluate_chunk(db, chunk, technician_id, today, pending_status, seen, result):
+    snapshots = queries.get_tool_snapshots(db, [serial for _, serial, _ in chunk], today)
+
+    # Judge every row of a known tool type at once...
+    typed = [(i, snapshots[serial].tool_type) for i, (_, serial, _) in enumerate(chunk)
+             if serial in snapshots and snapshots[serial].tool_type is not None]
+    statuses = {}
+    if typed:
+        evaluation = evaluate(
+            np.array([chunk[i][2] for i, _ in typed], dtype=np.float64),
+            np.array([[t.block_1, t.block_2, t.block_3] for _, t in typed], dtype=np.float64),
+            [t.tolerance for _, t in typed],
+            missing=[[reading is None for reading in chunk[i][2]] for i, _ in typed],
+        )
+        statuses = {i: "Pass" if passed else "Fail" for (i, _), passed in zip(typed, evaluation.passed)}
+
+    # ...then apply the validation rules in file order: an earlier line of this
+    # file counts like a validation of today still waiting in the journal
+    for i, (line, serial, readings) in enumerate(chunk):
+        snapshot = snapshots.get(serial)
+        reason = blocking_reason(snapshot, today, seen.get(serial) or pending_status(serial, today))
+        if reason is None:
+            tool_type = snapshot.tool_type
+            blocks = [tool_type.block_1, tool_type.block_2, tool_type.block_3]
+            if any(block is not None and reading is None for block, reading in zip(blocks, readings)):
+                reason = "missing reading for a block"
+        if reason is not None:
+            result.rejected.append(RejectedReading(line, serial, reason))
+            continue
+        seen[serial] = statuses[i]
+        result.records.append({
+            "serial_number": serial,
+            "validation_date": today,
+            "technician_id": technician_id,
+            # Only blocks the tool type defines are stored
+            "reading_1": readings[0] if tool_type.block_1 is not None else None,
+            "reading_2": readings[1] if tool_type.block_2 is not None else None,
+            "reading_3": readings[2] if tool_type.block_3 is not None else None,
+            "validation_status": statuses[i],
+        })
+
+
+def ingest_file(db, path, technician_id, today, pending_status=lambda serial, day: None,
+                chunk_size=INGEST_CHUNK_SIZE):
+    """Parse and evaluate one instrument file; returns an IngestResult.
+
+    pending_status(serial, day) gives the status of a validation still in
+    the station's journal (SubmissionJournal.latest_pending_status).
+    """
+    result = IngestResult([], [])
+    seen = {}
+    chunk = []
+    for line, serial, readings in read_readings(path):
+        if not serial:
+            result.rejected.append(RejectedReading(line, serial, "missing serial number"))
+        elif isinstance(readings, str):
+            result.rejected.append(RejectedReading(line, serial, readings))
+        else:
+            chunk.append((line, serial, readings))
+        if len(chunk) >= chunk_size:
+            _evaluate_chunk(db, chunk, technician_id, today, pending_status, seen, result)
+            chunk = []
+    if chunk:
+        _evaluate_chunk(db, chunk, technician_id, today, pending_status, seen, result)
+    result.rejected.sort(key=lambda r: r.line)
+    return result
+
+
+def write_rejected(path, rejected):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(("line", "serial_number", "reason"))
+        writer.writerows(rejected)
@@ -0,0 +1,110 @@
+"""Re-check stored pass/fail results: python -m database.reevaluate [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+
+Reads validation records in keyset chunks and evaluates each chunk in one
+vectorized pass (utils/tolerance.py) against the current tool type specs,
+then reports the records whose stored status disagrees. Read-only.
+"""
+import argparse
+import time
+from datetime import date
+from typing import NamedTuple
+import numpy as np
+from models.models import ToolRegistration, ValidationRecord
+from database.reference_cache import reference_cache
+from utils.tolerance import BLOCKS, evaluate
+
+
+class Reevaluation(NamedTuple):
+    records: int
+    passed: int
+    failed: int
+    skipped: int          # tool without a (known) tool type
+    mismatched_ids: list  # validation_ids whose stored status differs
+
+
+def spec_arrays(tool_types):
+    """Block values (size, BLOCKS) and tolerances (size,) indexed by tool_type_id."""
+    size = max((t.tool_type_id for t in tool_types), default=0) + 1
+    blocks = np.full((size, BLOCKS), np.nan)
+    tolerances = np.full(size, np.nan)
+    for t in tool_types:
+        blocks[t.tool_type_id] = np.array([t.block_1, t.block_2, t.block_3], dtype=np.float64)
+        tolerances[t.tool_type_id] = t.tolerance
+    return blocks, tolerances
+
+
+def reevaluate(db, start_date=None, end_date=None, chunk_size=50000, progress=None):
+    """Evaluate every record in the date range; progress(done, total) after each chunk."""
+    blocks_by_type, tolerance_by_type = spec_arrays(reference_cache.tool_types(db))
+
+    query = db.query(
+        ValidationRecord.validation_id,
+        ToolRegistration.tool_type_id,
+        ValidationRecord.reading_1,
+        ValidationRecord.reading_2,
+        ValidationRecord.reading_3,
+        ValidationRecord.validation_status,
+    ).join(ToolRegistration, ToolRegistration.serial_number == ValidationRecord.serial_number)
+    if start_date is not None:
+        query = query.filter(ValidationRecord.validation_date >= start_date)
+    if end_date is not None:
+        query = query.filter(ValidationRecord.validation_date <= end_date)
+    total = query.count() if progress else None
+
+    records = passed = skipped = 0
+    mismatched = []
+    after_key = None
+    while True:
+        chunk = query
+        if after_key is not None:
+            chunk = chunk.filter(ValidationRecord.validation_id > after_key)
+        rows = chunk.order_by(ValidationRecord.validation_id).limit(chunk_size).all()
+        if not rows:
+            break
+        after_key = rows[-1][0]
+
+        ids, type_ids, reading_1, reading_2, reading_3, statuses = zip(*rows)
+        ids = np.array(ids, dtype=np.int64)
+        type_ids = np.array([-1 if t is None else t for t in type_ids], dtype=np.int64)
+        known = (type_ids >= 0) & (type_ids < len(tolerance_by_type))
+        known[known] = ~np.isnan(tolerance_by_type[type_ids[known]])
+
+        readings = np.array([reading_1, reading_2, reading_3], dtype=np.float64).T[known]
+        missing = np.array([[r is None for r in column] for column in (reading_1, reading_2, reading_3)]).T[known]
+        type_ids = type_ids[known]
+        evaluation = evaluate(readings, blocks_by_type[type_ids], tolerance_by_type[type_ids], missing)
+
+        stored_pass = np.array(statuses, dtype=object)[known] == "Pass"
+        mismatched.extend(ids[known][evaluation.passed != stored_pass].tolist())
+        records += len(rows)
+        skipped += int(np.count_nonzero(~known))
+        passed += int(np.count_nonzero(evaluation.passed))
+        if progress:
+            progress(records, total)
+
+    return Reevaluation(records, passed, records - skipped - passed, skipped, mismatched)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", type=date.fromisoformat)
+    parser.add_argument("--end", type=date.fromisoformat)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--show", type=int, default=20, help="mismatched validation_ids to list")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    from database.db import session_scope
+
+    args = parse_args()
+    started = time.perf_counter()
+    with session_scope() as db:
+        result = reevaluate(db, args.start, args.end, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    print(f"{result.records} records in {elapsed:.1f}s: {result.passed} pass, {result.failed} fail, "
+          f"{result.skipped} skipped, {len(result.mismatched_ids)} differ from the stored status")
+    if result.mismatched_ids:
+        print("validation_ids:", ", ".join(map(str, result.mismatched_ids[:args.show])),
+              "..." if len(result.mismatched_ids) > args.show else "")
@@ -0,0 +1,174 @@
+import bisect
+import threading
+import time
+from typing import NamedTuple, Optional
+from database.db import session_scope
+from models.models import ToolType, LabTechnician, ToolRegistration
+
+
+class ToolTypeInfo(NamedTuple):
+    """Immutable copy of a tool_types row, safe to share between threads and sessions."""
+    tool_type_id: int
+    tool_name: str
+    block_1: float
+    block_2: Optional[float]
+    block_3: Optional[float]
+    tolerance: float
+
+
+class ReferenceCache:
+    """Process-wide cache of tool types, technician names and tool serial numbers.
+
+    Pages read dropdown and lookup data from here instead of querying on
+    every open. Pages that write these tables call the matching
+    invalidate_* method; entries also expire after max_age seconds so
+    changes made from other stations show up eventually. A lookup for an
+    unknown id reloads the table, but at most once every miss_reload
+    seconds, so a page full of orphaned ids costs one query, not one per row.
+
+    Loaders accept an optional open session (e.g. inside a DbExecutor job);
+    without one they open their own session_scope.
+    """
+
+    def __init__(self, max_age=600, miss_reload=30):
+        self.max_age = max_age
+        self.miss_reload = miss_reload
+        self._lock = threading.RLock()
+        self._tool_types = None      # list of ToolTypeInfo, ordered by name
+        self._tool_types_by_id = {}
+        self._tool_types_at = 0.0
+        self._technicians = None     # technician_id -> name
+        self._technicians_at = 0.0
+        self._serials = None         # serial numbers sorted case-insensitively
+        self._serial_keys = []       # the same, lowercased, for bisect
+        self._serials_at = 0.0
+
+    def _fresh(self, loaded_at):
+        return time.monotonic() - loaded_at < self.max_age
+
+    def _reload_on_miss(self, loaded_at):
+        # Unknown keys are usually rows added since the load, but can also be
+        # orphans; don't reload again for those until miss_reload has passed
+        return time.monotonic() - loaded_at >= self.miss_reload
+
+    def _load(self, loader, db):
+        if db is not None:
+            return loader(db)
+        with session_scope() as own_db:
+            return loader(own_db)
+
+    # Tool types
+    def tool_types(self, db=None):
+        with self._lock:
+            if self._tool_types is None or not self._fresh(self._tool_types_at):
+                self._tool_types = [ToolTypeInfo(*row) for row in self._load(
+                    lambda s: s.query(
+                        ToolType.tool_type_id, ToolType.tool_name,
+                        ToolType.block_1, ToolType.block_2, ToolType.block_3, ToolType.tolerance,
+                    ).order_by(ToolType.tool_name).all(), db
+                )]
+                self._tool_types_by_id = {t.tool_type_id: t for t in self._tool_types}
+                self._tool_types_at = time.monotonic()
+            return list(self._tool_types)
+
+    def tool_types_cached(self):
+        """Tool types if already loaded and fresh, else None (never touches the database)."""
+        with self._lock:
+            if self._tool_types is not None and self._fresh(self._tool_types_at):
+                return list(self._tool_types)
+            return None
+
+    def tool_type_by_id(self, tool_type_id, db=None):
+        if tool_type_id is None:
+            return None
+        with self._lock:
+            self.tool_types(db)
+            if tool_type_id not in self._tool_types_by_id and self._reload_on_miss(self._tool_types_at):
+                # Added (possibly from another station) since the cache was loaded
+                self.invalidate_tool_types()
+                self.tool_types(db)
+            return self._tool_types_by_id.get(tool_type_id)
+
+    def tool_type_by_name(self, tool_name, db=None):
+        with self._lock:
+            match = next((t for t in self.tool_types(db) if t.tool_name == tool_name), None)
+            if match is None and self._reload_on_miss(self._tool_types_at):
+                self.invalidate_tool_types()
+                match = next((t for t in self.tool_types(db) if t.tool_name == tool_name), None)
+            return match
+
+    def invalidate_tool_types(self):
+        with self._lock:
+            self._tool_types = None
+
+    # Technicians
+    def technician_names(self, db=None):
+        with self._lock:
+            if self._technicians is None or not self._fresh(self._technicians_at):
+                self._technicians = dict(self._load(
+                    lambda s: s.query(LabTechnician.technician_id, LabTechnician.name).all(), db
+                ))
+                self._technicians_at = time.monotonic()
+            return self._technicians
+
+    def technician_name(self, technician_id, db=None):
+        if technician_id is None:
+            return ""
+        with self._lock:
+            names = self.technician_names(db)
+            if technician_id not in names and self._reload_on_miss(self._technicians_at):
+                # Registered since the cache was loaded
+                self.invalidate_technicians()
+                names = self.technician_names(db)
+            return names.get(technician_id, "")
+
+    def invalidate_technicians(self):
+        with self._lock:
+            self._technicians = None
+
+    # Serial numbers (prefix index for autocomplete)
+    def serial_numbers(self, db=None):
+        with self._lock:
+            if self._serials is None or not self._fresh(self._serials_at):
+                serials = sorted(
+                    (serial for (serial,) in self._load(lambda s: s.query(ToolRegistration.serial_number).all(), db)),
+                    key=str.lower,
+                )
+                self._serials = serials
+                self._serial_keys = [serial.lower() for serial in serials]
+                self._serials_at = time.monotonic()
+            return self._serials
+
+    def serials_with_prefix(self, prefix, limit=50):
+        """Up to limit serials starting with prefix (case-insensitive), or None if the
+        index is not loaded (never touches the database)."""
+        with self._lock:
+            if self._serials is None or not self._fresh(self._serials_at):
+                return None
+            key = prefix.lower()
+            start = bisect.bisect_left(self._serial_keys, key)
+            matches = []
+            for i in range(start, min(start + limit, len(self._serial_keys))):
+                if not self._serial_keys[i].startswith(key):
+                    break
+                matches.append(self._serials[i])
+            return matches
+
+    def invalidate_serials(self):
+        with self._lock:
+            self._serials = None
+
+    def warm(self, db=None):
+        """Load everything; submitted as a background job right after login."""
+        self.tool_types(db)
+        self.technician_names(db)
+        self.serial_numbers(db)
+
+    def invalidate(self):
+        self.invalidate_tool_types()
+        self.invalidate_technicians()
+        self.invalidate_serials()
+
+
+# Create an instance of ReferenceCache
+reference_cache = ReferenceCache()
@@ -0,0 +1,255 @@
+"""Bulk tool registration from a CSV or XLSX file.
+
+The file is read and validated in one streaming pass. Valid rows are
+inserted in chunks: Postgres gets COPY, other databases a multi-row
+executemany INSERT. Each chunk runs in a savepoint; if the database
+refuses a chunk, its rows are retried one at a time, so only the bad rows
+are rejected and the rest of the load goes in. Every rejected row is
+reported with its line number and the reason.
+
+Expected columns (header names are case-insensitive, spaces allowed):
+    serial_number, tool_type, last_calibration[, tool_status]
+Dates may be YYYY-MM-DD or YYYY/MM/DD (or date cells in XLSX). A missing
+tool_status means Active.
+
+XLSX needs openpyxl, which is optional (pip install openpyxl).
+"""
+import csv
+import importlib.util
+import io
+import os
+from datetime import date, datetime
+from typing import NamedTuple
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError, DataError
+from database import tool_summary
+from database.calibration import calibration_due
+from models.models import ToolRegistration, ToolType
+
+IMPORT_CHUNK_SIZE = 1000
+
+TOOL_STATUSES = ("Active", "Retired", "Sent for Calibration", "Under Calibration")
+
+# Accepted header spellings -> field
+HEADER_ALIASES = {
+    "serial_number": "serial_number", "serial": "serial_number", "serial_no": "serial_number",
+    "tool_type": "tool_type", "tool_name": "tool_type", "type": "tool_type",
+    "last_calibration": "last_calibration", "last_calibration_date": "last_calibration",
+    "calibration_date": "last_calibration",
+    "tool_status": "tool_status", "status": "tool_status",
+}
+REQUIRED_FIELDS = ("serial_number", "tool_type", "last_calibration")
+COLUMNS = ("serial_number", "tool_type", "last_calibration", "tool_status")
+
+
+class RejectedRow(NamedTuple):
+    line: int
+    values: dict
+    reason: str
+
+
+class ImportResult(NamedTuple):
+    imported: int
+    rejected: list
+
+
+def xlsx_available():
+    return importlib.util.find_spec("openpyxl") is not None
+
+
+def _normalize_header(name):
+    key = str(name or "").strip().lower().replace(" ", "_")
+    return HEADER_ALIASES.get(key, key)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        total = max(sum(1 for _ in f) - 1, 0)
+        f.seek(0)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        yield total, [_normalize_header(h) for h in header]
+        for line, values in enumerate(reader, start=2):
+            if any(v.strip() for v in values):
+                yield line, values
+
+
+def _read_xlsx(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise RuntimeError("Importing .xlsx files needs openpyxl (pip install openpyxl); save the sheet as CSV instead.")
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        yield max((sheet.max_row or 1) - 1, 0), [_normalize_header(h) for h in header]
+        for line, values in enumerate(rows, start=2):
+            if any(v not in (None, "") for v in values):
+                yield line, ["" if v is None else v for v in values]
+    finally:
+        workbook.close()
+
+
+def _parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError(f"invalid date '{text}' (use YYYY-MM-DD)")
+
+
+def _validate(values, tool_types, seen, today):
+    """The insert row for one file row; raises ValueError with the reason it is rejected."""
+    serial = str(values.get("serial_number", "")).strip()
+    if not serial:
+        raise ValueError("missing serial number")
+    if serial in seen:
+        raise ValueError("serial number repeated in the file")
+    tool_type_id = tool_types.get(str(values.get("tool_type", "")).strip().lower())
+    if tool_type_id is None:
+        raise ValueError(f"unknown tool type '{values.get('tool_type', '')}'")
+    if values.get("last_calibration") in (None, ""):
+        raise ValueError("missing last calibration date")
+    last_calibration = _parse_date(values["last_calibration"])
+    if last_calibration > today:
+        raise ValueError("last calibration date is in the future")
+    status = str(values.get("tool_status") or "Active").strip()
+    status = next((s for s in TOOL_STATUSES if s.lower() == status.lower()), None)
+    if status is None:
+        raise ValueError(f"unknown status '{values['tool_status']}'")
+    seen.add(serial)
+    return {
+        "serial_number": serial,
+        "tool_type_id": tool_type_id,
+        "tool_status": status,
+        "last_calibration": last_calibration,
+        "calibration_due": calibration_due(last_calibration),
+    }
+
+
+def _copy(db, rows):
+    # Postgres COPY through the session's own connection, so it is part of the savepoint
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = list(rows[0])
+    for row in rows:
+        writer.writerow(["" if row[c] is None else row[c] for c in columns])
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY tool_registrations ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def _insert_chunk(db, chunk, rejected):
+    """Insert chunk [(line, values, row)]; returns the serials saved, adding refused rows to rejected."""
+    if not chunk:
+        return []
+    use_copy = db.get_bind().dialect.name == "postgresql"
+    dbapi = db.get_bind().dialect.dbapi
+    row_errors = (IntegrityError, DataError, dbapi.IntegrityError, dbapi.DataError)
+
+    # Serials already registered are rejected up front instead of failing the chunk
+    existing = set(db.scalars(
+        select(ToolRegistration.serial_number)
+        .where(ToolRegistration.serial_number.in_([row["serial_number"] for _, _, row in chunk]))
+    ))
+    new = []
+    for line, values, row in chunk:
+        if row["serial_number"] in existing:
+            rejected.append(RejectedRow(line, values, "serial number already registered"))
+        else:
+            new.append((line, values, row))
+    if not new:
+        return []
+
+    try:
+        with db.begin_nested():
+            if use_copy:
+                _copy(db, [row for _, _, row in new])
+            else:
+                db.execute(insert(ToolRegistration), [row for _, _, row in new])
+        return [row["serial_number"] for _, _, row in new]
+    except row_errors:
+        pass
+
+    saved = []
+    for line, values, row in new:
+        try:
+            with db.begin_nested():
+                db.execute(insert(ToolRegistration), [row])
+            saved.append(row["serial_number"])
+        except (IntegrityError, DataError) as e:
+            rejected.append(RejectedRow(line, values, str(getattr(e, "orig", None) or e).splitlines()[0]))
+    return saved
+
+
+def import_tools(db, path, modified_by, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """Register every valid tool in the file at path; returns an ImportResult.
+
+    Runs in the caller's transaction; progress(done, total) is called after
+    every chunk. A file without the required columns raises ValueError.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    reader = _read_xlsx(path) if extension in (".xlsx", ".xlsm") else _read_csv(path)
+    total, header = next(reader)
+    missing = [field for field in REQUIRED_FIELDS if field not in header]
+    if missing:
+        raise ValueError(f"The file has no {', '.join(missing)} column(s); expected {', '.join(COLUMNS)}.")
+
+    # One query for every tool type name in the file; read in this session rather
+    # than from the reference cache, which may predate a type added just now
+    tool_types = {
+        tool_name.strip().lower(): tool_type_id
+        for tool_type_id, tool_name in db.execute(select(ToolType.tool_type_id, ToolType.tool_name))
+    }
+    today = date.today()
+    seen = set()
+    rejected = []
+    imported = done = 0
+    chunk = []
+
+    def flush():
+        nonlocal imported
+        saved = _insert_chunk(db, chunk, rejected)
+        tool_summary.refresh(db, saved)
+        imported += len(saved)
+        chunk.clear()
+
+    for line, raw in reader:
+        values = {field: value for field, value in zip(header, raw) if field in COLUMNS}
+        try:
+            row = _validate(values, tool_types, seen, today)
+        except ValueError as e:
+            rejected.append(RejectedRow(line, values, str(e)))
+        else:
+            row["modified_by"] = modified_by
+            chunk.append((line, values, row))
+        done += 1
+        if len(chunk) >= chunk_size:
+            flush()
+            if progress:
+                progress(done, total)
+    flush()
+    if progress:
+        progress(done, total)
+    rejected.sort(key=lambda r: r.line)
+    return ImportResult(imported, rejected)
+
+
+def write_rejected(path, rejected):
+    """Save rejected rows as CSV (line, the row's columns, reason) for fixing and re-importing."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(("line",) + COLUMNS + ("reason",))
+        for r in rejected:
+            writer.writerow([r.line] + [r.values.get(c, "") for c in COLUMNS] + [r.reason])
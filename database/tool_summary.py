@@ -0,0 +1,99 @@
+"""Per-tool status summary: last validation and latest result.
+
+tool_status_summary holds one row per tool so status lookups are a
+primary-key read instead of a search through validation history. Every
+write path that changes one of its inputs calls refresh() for the tools
+it touched, inside the same transaction:
+
+- queries.add_validation_records (journal uploads from validation stations)
+- tool registration and the tool update page
+
+Data loaded by other means (imports, manual SQL) can be folded in with
+    python -m database.tool_summary
+which rebuilds every row.
+"""
+from sqlalchemy import select, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
+from models.models import ToolRegistration, ToolStatusSummary, ValidationRecord
+
+REFRESH_CHUNK_SIZE = 500
+
+
+def latest_validation_id():
+    """Correlated subquery: the newest validation_id (by date, then id) of the outer tool_registrations row."""
+    history = aliased(ValidationRecord)
+    return (
+        select(history.validation_id)
+        .where(history.serial_number == ToolRegistration.serial_number)
+        .order_by(history.validation_date.desc(), history.validation_id.desc())
+        .limit(1)
+        .correlate(ToolRegistration)
+        .scalar_subquery()
+    )
+
+
+def _upsert(db, rows):
+    # ON CONFLICT DO UPDATE: two stations refreshing the same new tool must not collide on the key
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    statement = insert(ToolStatusSummary).values(rows)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[ToolStatusSummary.serial_number],
+        set_={
+            column: statement.excluded[column]
+            for column in ("last_validation_id", "last_validation_date", "latest_result")
+        },
+    ))
+
+
+def refresh(db, serial_numbers, chunk_size=REFRESH_CHUNK_SIZE):
+    """Recompute the summary rows of these tools; rows of serials that no longer exist are removed."""
+    serial_numbers = list(dict.fromkeys(serial_numbers))
+    for start in range(0, len(serial_numbers), chunk_size):
+        chunk = serial_numbers[start:start + chunk_size]
+        rows = db.execute(
+            select(
+                ToolRegistration.serial_number,
+                ValidationRecord.validation_id,
+                ValidationRecord.validation_date,
+                ValidationRecord.validation_status,
+            )
+            .select_from(ToolRegistration)
+            .outerjoin(ValidationRecord, ValidationRecord.validation_id == latest_validation_id())
+            .where(ToolRegistration.serial_number.in_(chunk))
+        ).all()
+
+        found = {row.serial_number for row in rows}
+        missing = [serial for serial in chunk if serial not in found]
+        if missing:
+            db.execute(delete(ToolStatusSummary).where(ToolStatusSummary.serial_number.in_(missing)))
+        if rows:
+            _upsert(db, [
+                {
+                    "serial_number": row.serial_number,
+                    "last_validation_id": row.validation_id,
+                    "last_validation_date": row.validation_date,
+                    "latest_result": row.validation_status,
+                }
+                for row in rows
+            ])
+
+
+def rebuild(db, chunk_size=REFRESH_CHUNK_SIZE, progress=None):
+    """Recompute every tool's row; progress(done, total) after each chunk."""
+    db.execute(delete(ToolStatusSummary).where(
+        ToolStatusSummary.serial_number.not_in(select(ToolRegistration.serial_number))
+    ))
+    serial_numbers = db.scalars(select(ToolRegistration.serial_number)).all()
+    for start in range(0, len(serial_numbers), chunk_size):
+        refresh(db, serial_numbers[start:start + chunk_size], chunk_size)
+        if progress:
+            progress(min(start + chunk_size, len(serial_numbers)), len(serial_numbers))
+
+
+if __name__ == "__main__":
+    from database.db import session_scope
+
+    with session_scope() as db:
+        rebuild(db, progress=lambda done, total: print(f"\r{done}/{total} tools", end="", flush=True))
+    print()
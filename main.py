@@ -1,9 +1,20 @@
-from PySide6.QtWidgets import QApplication
-from pages.login import LoginPage
+import time
+started = time.time()  # before Qt is imported, for the startup trace
+
 import sys
+from PySide6.QtWidgets import QApplication
+from utils import startup_trace
+from utils.app_log import setup_logging
+from utils.router import get_main_window, navigate
 
 if __name__ == "__main__":
+    startup_trace.mark("main_started", at=started)
+    startup_trace.mark("qt_imported")
+    setup_logging()
     app = QApplication(sys.argv)
-    window = LoginPage()
+    window = get_main_window()
+    login_page = navigate("login")
+    startup_trace.watch_first_paint(login_page)
+    startup_trace.mark("login_built")
     window.showNormal()
     sys.exit(app.exec())
@@ -1,4 +1,7 @@
 # -*- mode: python ; coding: utf-8 -*-
+# One-file build. Simple to hand out, but every launch unpacks the whole
+# bundle to a temp folder first; main_onedir.spec starts considerably faster.
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +9,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=collect_submodules('pages'),  # utils/router.py imports pages by name
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
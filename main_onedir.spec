@@ -0,0 +1,52 @@
+# -*- mode: python ; coding: utf-8 -*-
+# One-folder build for stations: dist/main/ holds the executable next to
+# its libraries, so a launch starts Python straight away instead of first
+# unpacking the bundle (as the one-file main.spec does). Libraries are not
+# UPX-compressed, which would make Windows decompress every Qt DLL on load.
+#
+#     pyinstaller main_onedir.spec
+#     python -m benchmarks.startup_benchmark --exe dist/main/main
+from PyInstaller.utils.hooks import collect_submodules
+
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=collect_submodules('pages'),  # utils/router.py imports pages by name
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['tkinter'],
+    noarchive=False,
+    optimize=1,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='main',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='main',
+)
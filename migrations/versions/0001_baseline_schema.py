@@ -0,0 +1,69 @@
+"""Baseline schema: the four tables as originally deployed
+
+Existing sites already have these tables, so each one is only created
+when missing; upgrading an existing database simply records this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "tool_types" not in existing:
+        op.create_table(
+            "tool_types",
+            sa.Column("tool_type_id", sa.Integer, primary_key=True),
+            sa.Column("tool_name", sa.String, nullable=False),
+            sa.Column("block_1", sa.Float, nullable=False),
+            sa.Column("block_2", sa.Float, nullable=True),
+            sa.Column("block_3", sa.Float, nullable=True),
+            sa.Column("tolerance", sa.Float, nullable=False),
+        )
+
+    if "lab_technicians" not in existing:
+        op.create_table(
+            "lab_technicians",
+            sa.Column("technician_id", sa.Integer, primary_key=True),
+            sa.Column("name", sa.String),
+            sa.Column("email", sa.String, unique=True),
+            sa.Column("password", sa.String),
+        )
+
+    if "tool_registrations" not in existing:
+        op.create_table(
+            "tool_registrations",
+            sa.Column("serial_number", sa.String, primary_key=True),
+            sa.Column("tool_type_id", sa.Integer, sa.ForeignKey("tool_types.tool_type_id")),
+            sa.Column("tool_status", sa.String),
+            sa.Column("last_calibration", sa.Date),
+            sa.Column("last_modified", sa.TIMESTAMP, server_default=sa.func.now()),
+            sa.Column("modified_by", sa.Integer, sa.ForeignKey("lab_technicians.technician_id")),
+        )
+
+    if "validation_records" not in existing:
+        op.create_table(
+            "validation_records",
+            sa.Column("validation_id", sa.Integer, primary_key=True),
+            sa.Column("serial_number", sa.String, sa.ForeignKey("tool_registrations.serial_number")),
+            sa.Column("validation_date", sa.Date),
+            sa.Column("technician_id", sa.Integer, sa.ForeignKey("lab_technicians.technician_id")),
+            sa.Column("reading_1", sa.Float),
+            sa.Column("reading_2", sa.Float, nullable=True),
+            sa.Column("reading_3", sa.Float, nullable=True),
+            sa.Column("validation_status", sa.String),
+        )
+
+
+def downgrade():
+    # Never drop production data from a baseline downgrade
+    pass
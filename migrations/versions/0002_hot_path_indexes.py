@@ -0,0 +1,66 @@
+"""Indexes and unique constraints for the hot lookup paths
+
+- validation_records (serial_number, validation_date): validation page and tool history
+- validation_records (validation_date): daily records report
+- tool_registrations (tool_type_id, tool_status): mass calibration tool list
+- tool_types.tool_name: unique, looked up by name on every tool type page
+- lab_technicians.name: login
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+from alembic.util import CommandError
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _create_index(name, table, columns):
+    # Postgres builds the index without blocking validation submits on large tables
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def _check_unique_tool_names():
+    # Refuse to start rather than fail halfway with a raw IntegrityError. Duplicates
+    # are not merged here: tools and history point at each row by id, so which
+    # one to keep is a decision for whoever owns the data.
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT tool_name, COUNT(*) FROM tool_types GROUP BY tool_name HAVING COUNT(*) > 1 ORDER BY tool_name"
+    )).all()
+    if duplicates:
+        names = ", ".join(f"'{name}' ({count} rows)" for name, count in duplicates)
+        raise CommandError(
+            f"tool_types has duplicate tool_name values: {names}. Rename or merge them "
+            "(pointing tool_registrations at the kept row) and run the migration again."
+        )
+
+
+def upgrade():
+    _check_unique_tool_names()
+
+    _create_index("ix_validation_records_serial_date", "validation_records", ["serial_number", "validation_date"])
+    _create_index("ix_validation_records_validation_date", "validation_records", ["validation_date"])
+    _create_index("ix_tool_registrations_type_status", "tool_registrations", ["tool_type_id", "tool_status"])
+    _create_index("ix_lab_technicians_name", "lab_technicians", ["name"])
+
+    with op.batch_alter_table("tool_types") as batch_op:
+        batch_op.create_unique_constraint("uq_tool_types_tool_name", ["tool_name"])
+
+
+def downgrade():
+    with op.batch_alter_table("tool_types") as batch_op:
+        batch_op.drop_constraint("uq_tool_types_tool_name", type_="unique")
+
+    op.drop_index("ix_lab_technicians_name", table_name="lab_technicians")
+    op.drop_index("ix_tool_registrations_type_status", table_name="tool_registrations")
+    op.drop_index("ix_validation_records_validation_date", table_name="validation_records")
+    op.drop_index("ix_validation_records_serial_date", table_name="validation_records")
@@ -0,0 +1,34 @@
+"""Index the daily records report for keyset paging
+
+The daily records view pages through one day ordered by validation_id.
+(validation_date, validation_id) serves both the date filter and the
+ordering, so it replaces the single-column validation_date index.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index("ix_validation_records_date_id", "validation_records",
+                            ["validation_date", "validation_id"], postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index("ix_validation_records_validation_date", table_name="validation_records",
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.create_index("ix_validation_records_date_id", "validation_records",
+                        ["validation_date", "validation_id"], if_not_exists=True)
+        op.drop_index("ix_validation_records_validation_date", table_name="validation_records", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_validation_records_validation_date", "validation_records", ["validation_date"])
+    op.drop_index("ix_validation_records_date_id", table_name="validation_records")
@@ -0,0 +1,35 @@
+"""Index tool history for keyset paging
+
+Tool history pages through one serial ordered by (validation_date,
+validation_id) descending. Extending the (serial_number, validation_date)
+index with validation_id makes each page an exact index range, and it
+still serves the validation page's serial/date lookups.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = ["serial_number", "validation_date", "validation_id"]
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index("ix_validation_records_serial_date_id", "validation_records", columns,
+                            postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index("ix_validation_records_serial_date", table_name="validation_records",
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.create_index("ix_validation_records_serial_date_id", "validation_records", columns, if_not_exists=True)
+        op.drop_index("ix_validation_records_serial_date", table_name="validation_records", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_validation_records_serial_date", "validation_records", ["serial_number", "validation_date"])
+    op.drop_index("ix_validation_records_serial_date_id", table_name="validation_records")
@@ -0,0 +1,39 @@
+"""Idempotency key for journaled validation submissions
+
+Stations write validations to a local journal first and upload them in
+the background (database/journal.py). Each journaled record carries a
+client-generated submission_id; the unique index lets an upload that is
+retried after a lost acknowledgement skip records already saved.
+Existing rows keep NULL.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = [c["name"] for c in sa.inspect(op.get_bind()).get_columns("validation_records")]
+    if "submission_id" not in columns:
+        op.add_column("validation_records", sa.Column("submission_id", sa.String(36), nullable=True))
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index("uq_validation_records_submission_id", "validation_records", ["submission_id"],
+                            unique=True, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index("uq_validation_records_submission_id", "validation_records", ["submission_id"],
+                        unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("uq_validation_records_submission_id", table_name="validation_records")
+    with op.batch_alter_table("validation_records") as batch_op:
+        batch_op.drop_column("submission_id")
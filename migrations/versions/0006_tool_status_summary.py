@@ -0,0 +1,72 @@
+"""Per-tool status summary table
+
+One row per tool with its last validation (id, date, result),
+maintained by the application on every write
+(database/tool_summary.py). Backfilled here from existing data.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 5000
+
+
+def upgrade():
+    bind = op.get_bind()
+    if "tool_status_summary" not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            "tool_status_summary",
+            sa.Column("serial_number", sa.String,
+                      sa.ForeignKey("tool_registrations.serial_number", onupdate="CASCADE", ondelete="CASCADE"),
+                      primary_key=True),
+            sa.Column("last_validation_id", sa.Integer, nullable=True),
+            sa.Column("last_validation_date", sa.Date, nullable=True),
+            sa.Column("latest_result", sa.String, nullable=True),
+        )
+
+    # Backfill tools that have no summary row yet
+    tools = sa.table("tool_registrations", sa.column("serial_number", sa.String))
+    records = sa.table("validation_records", sa.column("validation_id", sa.Integer),
+                       sa.column("serial_number", sa.String), sa.column("validation_date", sa.Date),
+                       sa.column("validation_status", sa.String))
+    history = records.alias("history")
+    summary = sa.table("tool_status_summary", sa.column("serial_number", sa.String),
+                       sa.column("last_validation_id", sa.Integer), sa.column("last_validation_date", sa.Date),
+                       sa.column("latest_result", sa.String))
+    latest_id = (
+        sa.select(history.c.validation_id)
+        .where(history.c.serial_number == tools.c.serial_number)
+        .order_by(history.c.validation_date.desc(), history.c.validation_id.desc())
+        .limit(1)
+        .correlate(tools)
+        .scalar_subquery()
+    )
+    result = bind.execution_options(stream_results=True).execute(
+        sa.select(tools.c.serial_number, records.c.validation_id, records.c.validation_date, records.c.validation_status)
+        .select_from(tools)
+        .outerjoin(records, records.c.validation_id == latest_id)
+        .where(~sa.exists().where(summary.c.serial_number == tools.c.serial_number))
+    )
+    rows = [
+        {
+            "serial_number": serial,
+            "last_validation_id": validation_id,
+            "last_validation_date": validation_date,
+            "latest_result": status,
+        }
+        for serial, validation_id, validation_date, status in result
+    ]
+    for start in range(0, len(rows), BACKFILL_CHUNK_SIZE):
+        bind.execute(summary.insert(), rows[start:start + BACKFILL_CHUNK_SIZE])
+
+
+def downgrade():
+    op.drop_table("tool_status_summary")
@@ -0,0 +1,58 @@
+"""Calibration due date stored on tool_registrations
+
+Adds an indexed calibration_due column to tool_registrations, so "due in
+the next N days" is one range scan over tool_registrations with the
+tool's status and type at hand. The
+application sets it whenever last_calibration changes
+(database/calibration.py). Backfilled here from last_calibration.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+from dateutil.relativedelta import relativedelta
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of the rule in database/calibration.py at the time of this revision
+CALIBRATION_INTERVAL = relativedelta(months=6)
+
+
+def _create_index(name, table, columns):
+    # Postgres builds the index without blocking tool updates on large tables
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def upgrade():
+    bind = op.get_bind()
+    columns = [c["name"] for c in sa.inspect(bind).get_columns("tool_registrations")]
+    if "calibration_due" not in columns:
+        op.add_column("tool_registrations", sa.Column("calibration_due", sa.Date, nullable=True))
+
+    # One UPDATE per distinct calibration date (a few hundred), not one per tool
+    tools = sa.table("tool_registrations", sa.column("last_calibration", sa.Date),
+                     sa.column("calibration_due", sa.Date))
+    dates = bind.execute(
+        sa.select(tools.c.last_calibration).where(tools.c.last_calibration.is_not(None)).distinct()
+    ).scalars().all()
+    for last_calibration in dates:
+        bind.execute(
+            tools.update().where(tools.c.last_calibration == last_calibration)
+            .values(calibration_due=last_calibration + CALIBRATION_INTERVAL)
+        )
+    _create_index("ix_tool_registrations_calibration_due", "tool_registrations", ["calibration_due"])
+
+
+def downgrade():
+    op.drop_index("ix_tool_registrations_calibration_due", table_name="tool_registrations")
+    with op.batch_alter_table("tool_registrations") as batch_op:
+        batch_op.drop_column("calibration_due")
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, TIMESTAMP, Index, UniqueConstraint
 from database.db import Base
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 class ToolType(Base):
     __tablename__ = "tool_types"
+    __table_args__ = (
+        UniqueConstraint("tool_name", name="uq_tool_types_tool_name"),
+    )
     
     tool_type_id = Column(Integer, primary_key=True)
     tool_name = Column(String, nullable=False)
@@ -18,6 +21,9 @@ class ToolType(Base):
 
 class LabTechnician(Base):
     __tablename__ = "lab_technicians"
+    __table_args__ = (
+        Index("ix_lab_technicians_name", "name"),  # login lookup
+    )
     technician_id = Column(Integer, primary_key=True)
     name = Column(String)
     email = Column(String, unique=True)
@@ -25,16 +31,26 @@ class LabTechnician(Base):
 
 class ToolRegistration(Base):
     __tablename__ = "tool_registrations"
+    __table_args__ = (
+        Index("ix_tool_registrations_type_status", "tool_type_id", "tool_status"),  # mass calibration
+        Index("ix_tool_registrations_calibration_due", "calibration_due"),  # upcoming/overdue lists
+    )
     serial_number = Column(String, primary_key=True)
     tool_type_id = Column(Integer, ForeignKey("tool_types.tool_type_id"))
     tool_status = Column(String)
     last_calibration = Column(Date)
+    calibration_due = Column(Date, nullable=True)  # last_calibration + 6 months, see database/calibration.py
     last_modified = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
     modified_by = Column(Integer, ForeignKey("lab_technicians.technician_id"))
     tool_type = relationship("ToolType", back_populates="tools")
 
 class ValidationRecord(Base):
     __tablename__ = "validation_records"
+    __table_args__ = (
+        Index("ix_validation_records_serial_date_id", "serial_number", "validation_date", "validation_id"),  # tool lookup/history paging
+        Index("ix_validation_records_date_id", "validation_date", "validation_id"),  # daily report paging
+        Index("uq_validation_records_submission_id", "submission_id", unique=True),  # journal upload idempotency
+    )
     validation_id = Column(Integer, primary_key=True)
     serial_number = Column(String, ForeignKey("tool_registrations.serial_number"))
     validation_date = Column(Date)
@@ -43,4 +59,18 @@ class ValidationRecord(Base):
     reading_2 = Column(Float, nullable=True)  # <- allow NULL
     reading_3 = Column(Float, nullable=True)  # <- allow NULL
     validation_status = Column(String)
+    submission_id = Column(String(36), nullable=True)  # set on records uploaded from a station's journal
     technician = relationship("LabTechnician", backref="validations")
+
+
+class ToolStatusSummary(Base):
+    # One row per tool, kept current by database/tool_summary.py whenever a
+    # validation is saved or a tool is registered/updated
+    __tablename__ = "tool_status_summary"
+    serial_number = Column(
+        String, ForeignKey("tool_registrations.serial_number", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    last_validation_id = Column(Integer, nullable=True)
+    last_validation_date = Column(Date, nullable=True)
+    latest_result = Column(String, nullable=True)
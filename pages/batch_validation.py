@@ -0,0 +1,285 @@
+from PySide6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QAbstractItemView
+)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QBrush
+from database import queries
+from utils.workers import get_db_executor
+from utils.journal_flusher import get_journal_flusher
+from utils.journal_status import JournalStatusLabel
+from utils.app_context import app_context
+from utils.records_model import status_brush
+from utils.tolerance import evaluate_one, parse_reading
+from database.calibration import blocking_reason
+from datetime import date
+from utils.router import navigate
+
+SERIAL_COLUMN = 0
+TYPE_COLUMN = 1
+READING_COLUMNS = [2, 3, 4]
+RESULT_COLUMN = 5
+STATUS_COLUMN = 6
+
+READY = "Ready"
+
+
+class BatchValidationPage(QMainWindow):
+    """Validate many tools in one sitting.
+
+    Scanned serials are queued as grid rows and looked up in the background;
+    readings are typed straight into the grid and judged as soon as a row
+    is complete. Submit journals every complete row locally, like the
+    single-tool page, and the journal flusher uploads them in the
+    background; the label under the grid shows uploads still waiting and
+    any the server rejected.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Batch Validation")
+
+        self.snapshots = {}    # serial -> ToolSnapshot (or None if not found)
+        self._updating = False  # set while the page itself writes cells
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(30, 20, 30, 20)
+
+        title = QLabel("Batch Validation")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 20px; font-weight: bold;")
+        layout.addWidget(title)
+
+        # Scan row
+        scan_layout = QHBoxLayout()
+        self.scan_input = QLineEdit()
+        self.scan_input.setPlaceholderText("Scan or type a tool serial number and press Enter")
+        self.scan_input.returnPressed.connect(self.add_scanned_serial)
+        scan_layout.addWidget(self.scan_input)
+
+        self.remove_button = QPushButton("Remove Selected")
+        self.remove_button.clicked.connect(self.remove_selected_rows)
+        scan_layout.addWidget(self.remove_button)
+        layout.addLayout(scan_layout)
+
+        # Grid
+        self.table = QTableWidget(0, 7)
+        self.table.setHorizontalHeaderLabels(
+            ["Serial Number", "Tool Type", "Block 1", "Block 2", "Block 3", "Result", "Status"]
+        )
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed
+        )
+        self.table.itemChanged.connect(self.on_item_changed)
+        layout.addWidget(self.table)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        # Submissions journaled locally but not yet on the server
+        self.pending_label = JournalStatusLabel()
+        layout.addWidget(self.pending_label)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        self.submit_button = QPushButton("Submit Batch")
+        self.submit_button.clicked.connect(self.submit_batch)
+        button_layout.addWidget(self.submit_button)
+
+        self.dashboard_button = QPushButton("Back to Dashboard")
+        self.dashboard_button.clicked.connect(self.open_dashboard)
+        button_layout.addWidget(self.dashboard_button)
+        layout.addLayout(button_layout)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+        self.pending_label.refresh()
+        self.scan_input.setFocus()
+
+    # Rows
+    def find_row(self, serial):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, SERIAL_COLUMN).text() == serial:
+                return row
+        return None
+
+    def set_cell(self, row, column, text, editable=False, brush=None):
+        item = QTableWidgetItem(text)
+        item.setTextAlignment(Qt.AlignCenter)
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if editable:
+            flags |= Qt.ItemIsEditable
+        item.setFlags(flags)
+        if brush is not None:
+            item.setForeground(brush)
+        self._updating = True
+        self.table.setItem(row, column, item)
+        self._updating = False
+
+    def set_status(self, row, text, ok=True):
+        self.set_cell(row, STATUS_COLUMN, text, brush=None if ok else QBrush(Qt.red))
+
+    def add_scanned_serial(self):
+        serial = self.scan_input.text().strip()
+        self.scan_input.clear()
+        if not serial:
+            return
+
+        existing = self.find_row(serial)
+        if existing is not None:
+            self.table.selectRow(existing)
+            return
+
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.set_cell(row, SERIAL_COLUMN, serial)
+        for column in [TYPE_COLUMN, *READING_COLUMNS, RESULT_COLUMN]:
+            self.set_cell(row, column, "")
+        self.set_status(row, "Looking up...")
+
+        today = date.today()
+        get_db_executor().submit(
+            queries.get_tool_snapshot, serial, today,
+            on_result=lambda snapshot: self.on_snapshot(serial, today, snapshot),
+            on_error=lambda e: self.on_lookup_failed(serial, e),
+            owner=self,
+            action="BatchValidationPage.add_scanned_serial",
+        )
+
+    def on_snapshot(self, serial, today, snapshot):
+        row = self.find_row(serial)
+        if row is None:
+            return  # removed while the lookup ran
+        self.snapshots[serial] = snapshot
+
+        pending_status = get_journal_flusher().journal.latest_pending_status(serial, today)
+        reason = blocking_reason(snapshot, today, pending_status)
+        if snapshot is not None and snapshot.tool_type is not None:
+            self.set_cell(row, TYPE_COLUMN, snapshot.tool_type.tool_name)
+        if reason:
+            self.set_status(row, reason, ok=False)
+            return
+
+        tool_type = snapshot.tool_type
+        for column, block in zip(READING_COLUMNS, [tool_type.block_1, tool_type.block_2, tool_type.block_3]):
+            self.set_cell(row, column, "" if block is not None else "-", editable=block is not None)
+        self.set_status(row, READY)
+
+        # Readings go in straight after the scan unless the technician is busy elsewhere
+        if self.table.state() != QAbstractItemView.EditingState and self.scan_input.text() == "":
+            self.edit_next_reading(row)
+
+    def on_lookup_failed(self, serial, error):
+        row = self.find_row(serial)
+        if row is not None:
+            self.set_status(row, f"Lookup failed: {error}", ok=False)
+
+    def remove_selected_rows(self):
+        rows = sorted({index.row() for index in self.table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self.snapshots.pop(self.table.item(row, SERIAL_COLUMN).text(), None)
+            self.table.removeRow(row)
+        self.scan_input.setFocus()
+
+    # Readings
+    def row_readings(self, row):
+        """Readings per block: float, None (no such block) or "" (missing). Raises ValueError."""
+        readings = []
+        for column in READING_COLUMNS:
+            item = self.table.item(row, column)
+            if not item.flags() & Qt.ItemIsEditable:
+                readings.append(None)
+            else:
+                text = item.text().strip()
+                readings.append(parse_reading(text) if text else "")
+        return readings
+
+    def edit_next_reading(self, row):
+        for column in READING_COLUMNS:
+            item = self.table.item(row, column)
+            if item.flags() & Qt.ItemIsEditable and not item.text().strip():
+                self.table.setCurrentCell(row, column)
+                self.table.editItem(item)
+                return True
+        return False
+
+    def on_item_changed(self, item):
+        if self._updating or item.column() not in READING_COLUMNS:
+            return
+        row = item.row()
+        self.evaluate_row(row)
+        # Move on once the current editor has closed
+        QTimer.singleShot(0, lambda: self.advance_from(row))
+
+    def advance_from(self, row):
+        if row >= self.table.rowCount() or not self.edit_next_reading(row):
+            self.scan_input.setFocus()
+
+    def evaluate_row(self, row):
+        snapshot = self.snapshots.get(self.table.item(row, SERIAL_COLUMN).text())
+        self.set_cell(row, RESULT_COLUMN, "")
+        try:
+            readings = self.row_readings(row)
+        except ValueError:
+            self.set_status(row, "Invalid reading", ok=False)
+            return None
+        self.set_status(row, READY)
+        if "" in readings:
+            return None
+
+        tool_type = snapshot.tool_type
+        _, final = evaluate_one(readings, [tool_type.block_1, tool_type.block_2, tool_type.block_3], tool_type.tolerance)
+        self.set_cell(row, RESULT_COLUMN, final, brush=status_brush(final))
+        return final
+
+    # Submit
+    def submit_batch(self):
+        technician = app_context.get_logged_in_user()
+        if not technician:
+            QMessageBox.warning(self, "Error", "No technician logged in.")
+            return
+
+        today = date.today()
+        serials, records = [], []
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, STATUS_COLUMN).text() != READY:
+                continue
+            final = self.table.item(row, RESULT_COLUMN).text()
+            if not final:
+                continue  # readings not complete yet
+            serial = self.table.item(row, SERIAL_COLUMN).text()
+            reading_1, reading_2, reading_3 = self.row_readings(row)
+            serials.append(serial)
+            records.append({
+                "serial_number": serial,
+                "validation_date": today,
+                "technician_id": technician.technician_id,
+                "reading_1": reading_1,
+                "reading_2": reading_2,
+                "reading_3": reading_3,
+                "validation_status": final,
+            })
+
+        if not records:
+            self.summary_label.setText("No complete rows to submit.")
+            return
+
+        # Journaled locally and uploaded in the background, so a slow server never blocks the batch
+        try:
+            get_journal_flusher().submit(records)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save batch locally (nothing was saved):\n{str(e)}")
+            return
+
+        for serial in serials:
+            self.snapshots.pop(serial, None)
+            self.table.removeRow(self.find_row(serial))
+        self.summary_label.setText(f"Saved {len(records)} validation records.")
+        self.scan_input.setFocus()
+
+    def open_dashboard(self):
+        navigate("dashboard")
@@ -2,10 +2,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout, QPushButton, QMessageBox, QLineEdit, QDialog, QLabel, QHBoxLayout
 )
 
-from database.db import get_db
+from database.db import session_scope
 from models.models import LabTechnician
 from utils.app_context import app_context
-from sqlalchemy.orm import Session
 
 class ForgotPasswordDialog(QDialog):
     def __init__(self):
@@ -43,16 +42,13 @@ class ForgotPasswordDialog(QDialog):
             QMessageBox.warning(self, "Error", "Passwords do not match.")
             return
 
-        # Get DB session
-        db_gen = get_db()
-        db = next(db_gen)
+        with session_scope() as db:
+            technician = db.query(LabTechnician).filter_by(email=email).first()
+            if technician:
+                technician.password = new_pw  # Ideally hash this
 
-        technician = db.query(LabTechnician).filter_by(email=email).first()
         if technician:
-            technician.password = new_pw  # Ideally hash this
-            db.commit()
             QMessageBox.information(self, "Success", "Password reset successfully.")
             self.accept()
         else:
             QMessageBox.warning(self, "Error", "Email not found.")
-        db_gen.close()
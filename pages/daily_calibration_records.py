@@ -1,18 +1,20 @@
 from PySide6.QtWidgets import ( 
     QWidget, QVBoxLayout, QLabel, QDateEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView, QScrollArea, QHBoxLayout, QLineEdit
+    QTableView, QMessageBox, QHeaderView, QScrollArea, QHBoxLayout, QLineEdit
 )
 from PySide6.QtGui import QShortcut
 from PySide6.QtCore import Qt, QDate
-from sqlalchemy.orm import Session
-from database.db import get_db
-from models.models import ToolRegistration, ToolType, ValidationRecord, LabTechnician
+from database import queries
+from utils.records_model import PagedRecordsModel
+from utils.record_filter import RecordFilterProxyModel
+from utils.export_controls import ExportControls
+from database import export
+from utils.router import navigate
 
 class DailyCalibrationRecordsPage(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Daily Validation Records")
-        self.setMinimumSize(1000, 600)
 
         layout = QVBoxLayout()
 
@@ -39,6 +41,8 @@ class DailyCalibrationRecordsPage(QWidget):
         self.dashboard_button = QPushButton("Back to Dashboard")
         self.dashboard_button.clicked.connect(self.open_dashboard)
         self.button_layout.addWidget(self.dashboard_button)
+        self.export_controls = ExportControls(self.export_query, "DailyCalibrationRecordsPage.export")
+        self.button_layout.addWidget(self.export_controls)
         layout.addLayout(self.button_layout)
         
         # Search bar for searching records
@@ -48,19 +52,32 @@ class DailyCalibrationRecordsPage(QWidget):
         layout.addWidget(self.search_input)
 
 
-        # Table widget
-        self.table = QTableWidget()
-        self.table.setColumnCount(14)
-        self.table.setHorizontalHeaderLabels([
-            "Serial No", "Tool Type", 
-            "Block 1", "Reading 1", "Pass/Fail 1",
-            "Block 2", "Reading 2", "Pass/Fail 2",
-            "Block 3", "Reading 3", "Pass/Fail 3",
-            "Tolerance", "Final Result", "Technician"
-        ])
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollPerPixel)
-        self.table.setVerticalScrollMode(QTableWidget.ScrollPerPixel)
-        self.table.setSizeAdjustPolicy(QTableWidget.AdjustToContents)
+        # Records view: rows are paged in from the database as the user scrolls
+        self.model = PagedRecordsModel(
+            [
+                "Serial No", "Tool Type", 
+                "Block 1", "Reading 1", "Pass/Fail 1",
+                "Block 2", "Reading 2", "Pass/Fail 2",
+                "Block 3", "Reading 3", "Pass/Fail 3",
+                "Tolerance", "Final Result", "Technician"
+            ],
+            status_columns=[4, 7, 10, 12],  # Pass/Fail 1-3 and Final Result
+            bold_columns=[12],
+            parent=self,
+        )
+        self.model.first_page_loaded.connect(self.on_first_page_loaded)
+        self.model.load_failed.connect(self.show_load_error)
+
+        # Search filter over a lowercase index built as rows arrive
+        self.proxy_model = RecordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setHorizontalScrollMode(QTableView.ScrollPerPixel)
+        self.table.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.verticalHeader().setDefaultSectionSize(24)  # fixed row height, no per-row measuring
         layout.addWidget(self.table)
 
         # Shortcut for Ctrl + F to focus on search input
@@ -75,86 +92,26 @@ class DailyCalibrationRecordsPage(QWidget):
 
     def search_records(self):
         """Search for records in the table based on the user's input."""
-        search_text = self.search_input.text().lower()
-        row_count = self.table.rowCount()
-
-        for row in range(row_count):
-            match_found = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match_found = True
-                    break  # If a match is found in any column, stop checking further columns.
-
-            self.table.setRowHidden(row, not match_found)  # Hide rows that don't match the search
+        self.proxy_model.search(self.search_input.text())  # debounced
 
     def load_records(self):
         selected_date = self.date_edit.date().toString("yyyy-MM-dd")  # Get date from QDateEdit
-        try:
-            # Get session
-            db_gen = get_db()
-            db = next(db_gen)
-
-            # SQLAlchemy ORM query to fetch daily calibration records
-            records = db.query(
-                ToolRegistration.serial_number,
-                ToolType.tool_name.label("tool_type_name"),
-                ToolType.block_1,
-                ValidationRecord.reading_1,
-                ValidationRecord.validation_status.label("pass_fail_1"),
-                ToolType.block_2,
-                ValidationRecord.reading_2,
-                ValidationRecord.validation_status.label("pass_fail_2"),
-                ToolType.block_3,
-                ValidationRecord.reading_3,
-                ValidationRecord.validation_status.label("pass_fail_3"),
-                ToolType.tolerance,
-                ValidationRecord.validation_status.label("final_result"),
-                LabTechnician.name.label("technician_name")
-            ).join(ToolType, ToolRegistration.tool_type_id == ToolType.tool_type_id) \
-             .join(ValidationRecord, ToolRegistration.serial_number == ValidationRecord.serial_number) \
-             .join(LabTechnician, ValidationRecord.technician_id == LabTechnician.technician_id) \
-             .filter(ValidationRecord.validation_date == selected_date) \
-             .all()
-
-            self.table.setRowCount(len(records))
-
-            # Populate the table with records
-            for row_index, row_data in enumerate(records):
-                for col_index, value in enumerate(row_data):
-                    item = QTableWidgetItem(str(value))
-                    item.setTextAlignment(Qt.AlignCenter)
-
-                    # Apply color to Pass/Fail columns
-                    if col_index in [4, 7, 10]:  # Pass/Fail 1-3 columns
-                        if value == 'Pass':
-                            item.setForeground(Qt.green)
-                        elif value == 'Fail':
-                            item.setForeground(Qt.red)
-
-                    # Make Final Result bold and green
-                    if col_index == 12:  # Final Result column
-                        if value == 'Pass':
-                            item.setForeground(Qt.green)
-                        elif value == 'Fail':
-                            item.setForeground(Qt.red)
-                        font = item.font()
-                        font.setBold(True)
-                        item.setFont(font)
-
-                    self.table.setItem(row_index, col_index, item)
-
-
-            if not records:
-                QMessageBox.information(self, "No Records", "No validation records found for this date.")
-
-            db_gen.close()
-
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Error loading records:\n{str(e)}")
+        # Pages are fetched on a worker thread as the view scrolls
+        self.model.load(
+            queries.get_daily_records_page, selected_date,
+            action="DailyCalibrationRecordsPage.load_records",
+        )
+
+    def export_query(self):
+        selected_date = self.date_edit.date().toPython()
+        return export.daily_records_query(selected_date), f"validation_records_{selected_date:%Y-%m-%d}"
+
+    def on_first_page_loaded(self, count):
+        if not count:
+            QMessageBox.information(self, "No Records", "No validation records found for this date.")
+
+    def show_load_error(self, error):
+        QMessageBox.critical(self, "Database Error", f"Error loading records:\n{str(error)}")
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
@@ -1,17 +1,26 @@
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QToolButton, QMenu
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QLabel, QPushButton, QToolButton, QMenu
 )
 from PySide6.QtCore import Qt
-from pages.tool_management import ToolManagementPage
-from pages.validation import ValidationPage
-from pages.tool_validation_records import ToolValidationRecordsPage
-from pages.daily_calibration_records import DailyCalibrationRecordsPage
+from PySide6.QtGui import QShortcut, QKeySequence
+from utils.app_context import app_context
+from utils.journal_flusher import get_journal_flusher
+from utils.kpi_cache import kpi_cache
+from utils.router import get_main_window, navigate
+
+# (Kpis field, caption, value colour)
+KPI_TILES = [
+    ("validated_today", "Validated Today", "black"),
+    ("failed_today", "Failures Today", "red"),
+    ("due_soon", "Due Within 30 Days", "darkorange"),
+    ("overdue", "Overdue", "red"),
+    ("under_calibration", "Under Calibration", "black"),
+]
 
 class DashboardPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("QC Calibration")
-        self.setFixedSize(1000, 600)
         
         # Main layout
         self.layout = QVBoxLayout()
@@ -23,6 +32,35 @@ class DashboardPage(QMainWindow):
         self.welcome_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.welcome_label)
 
+        # KPI panel, filled in from the shared cache (queried in the background when stale)
+        self.kpi_layout = QGridLayout()
+        self.kpi_values = {}
+        for column, (field, caption, color) in enumerate(KPI_TILES):
+            tile = QFrame()
+            tile.setFrameShape(QFrame.StyledPanel)
+            tile_layout = QVBoxLayout(tile)
+            value_label = QLabel("–")
+            value_label.setAlignment(Qt.AlignCenter)
+            value_label.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {color};")
+            caption_label = QLabel(caption)
+            caption_label.setAlignment(Qt.AlignCenter)
+            tile_layout.addWidget(value_label)
+            tile_layout.addWidget(caption_label)
+            self.kpi_layout.addWidget(tile, 0, column)
+            self.kpi_values[field] = value_label
+        self.layout.addLayout(self.kpi_layout)
+
+        self.kpi_status_layout = QHBoxLayout()
+        self.kpi_status_label = QLabel("")
+        self.kpi_status_label.setStyleSheet("color: gray;")
+        self.kpi_refresh_button = QToolButton()
+        self.kpi_refresh_button.setText("Refresh")
+        self.kpi_refresh_button.clicked.connect(lambda: self.load_kpis(force=True))
+        self.kpi_status_layout.addStretch()
+        self.kpi_status_layout.addWidget(self.kpi_status_label)
+        self.kpi_status_layout.addWidget(self.kpi_refresh_button)
+        self.layout.addLayout(self.kpi_status_layout)
+
         # Navigation buttons layout
         self.button_layout = QVBoxLayout()
 
@@ -36,10 +74,21 @@ class DashboardPage(QMainWindow):
         self.validation_records_button.clicked.connect(self.open_validation_records)
         self.button_layout.addWidget(self.validation_records_button)
 
+        # Batch Validation Button
+        self.batch_validation_button = QPushButton("Batch Validation")
+        self.batch_validation_button.clicked.connect(self.open_batch_validation)
+        self.button_layout.addWidget(self.batch_validation_button)
+
+        # Instrument Readings Button
+        self.instrument_readings_button = QPushButton("Instrument Readings")
+        self.instrument_readings_button.clicked.connect(self.open_instrument_readings)
+        self.button_layout.addWidget(self.instrument_readings_button)
+
         # View Records Button with Dropdown Menu
         self.view_records_menu = QMenu()
         self.view_records_menu.addAction("Tool Validation Records", self.open_tool_validation_records)
         self.view_records_menu.addAction("Daily Validation Records", self.open_daily_calibration_records)
+        self.view_records_menu.addAction("Upcoming Calibrations", self.open_upcoming_calibrations)
 
         self.view_records_button = QPushButton("View Records")
         self.view_records_button.setMenu(self.view_records_menu)
@@ -57,43 +106,72 @@ class DashboardPage(QMainWindow):
         container.setLayout(self.layout)
         self.setCentralWidget(container)
 
+        # Hidden SQL diagnostics
+        self.diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        self.diagnostics_shortcut.activated.connect(self.open_diagnostics)
+
+        # Validations reach the server in the background; refresh the figures when they land
+        get_journal_flusher().flushed.connect(self.on_records_uploaded)
+
+    def on_enter(self):
+        # Cached figures are shown at once; stale ones are reloaded in the background
+        self.load_kpis()
+
+    def on_records_uploaded(self, count):
+        kpi_cache.invalidate()
+        if self.isVisible():
+            self.load_kpis()
+
+    def load_kpis(self, force=False):
+        if force or kpi_cache.cached() is None:
+            self.kpi_status_label.setText("Updating…")
+            self.kpi_refresh_button.setEnabled(False)
+        kpi_cache.load(self.show_kpis, self.on_kpis_failed, force=force)
+
+    def show_kpis(self, kpis):
+        for field, label in self.kpi_values.items():
+            label.setText(str(getattr(kpis, field)))
+        self.kpi_status_label.setText(f"Updated {kpi_cache.updated:%H:%M}")
+        self.kpi_refresh_button.setEnabled(True)
+
+    def on_kpis_failed(self, error):
+        # The dashboard stays usable without the numbers
+        self.kpi_status_label.setText(f"Could not load figures: {error}")
+        self.kpi_refresh_button.setEnabled(True)
+
+    def open_diagnostics(self):
+        from pages.diagnostics import DiagnosticsDialog
+        dialog = DiagnosticsDialog(self)
+        dialog.exec()
+
     def open_tool_management(self):
-        self.tool_management_page = ToolManagementPage()
-        if self.isFullScreen():
-            self.tool_management_page.showFullScreen()
-        else:
-            self.tool_management_page.show()
-        self.close()
-        
+        navigate("tool_management")
+
     def open_validation_records(self):
-        self.validation_records_page = ValidationPage()
-        if self.isFullScreen():
-            self.validation_records_page.showFullScreen()
-        else:
-            self.validation_records_page.show()
-        self.close()
+        navigate("validation")
+
+    def open_batch_validation(self):
+        navigate("batch_validation")
+
+    def open_instrument_readings(self):
+        navigate("instrument_readings")
 
     def open_tool_validation_records(self):
-        self.tool_validation_records_page = ToolValidationRecordsPage()
-        if self.isFullScreen():
-            self.tool_validation_records_page.showFullScreen()
-        else:
-            self.tool_validation_records_page.show()
-        self.close()
+        navigate("tool_validation_records")
 
     def open_daily_calibration_records(self):
-        self.daily_calibration_records_page = DailyCalibrationRecordsPage()
-        if self.isFullScreen():
-            self.daily_calibration_records_page.showFullScreen()
-        else:
-            self.daily_calibration_records_page.show()
-        self.close()
+        navigate("daily_calibration_records")
+
+    def open_upcoming_calibrations(self):
+        navigate("upcoming_calibrations")
 
     def logout(self):
-        from pages.login import LoginPage
-        self.login_page = LoginPage()
-        if self.isFullScreen():
-            self.login_page.showFullScreen()
-        else:
-            self.login_page.show()
-        self.close()
+        app_context.set_logged_in_user(None)
+        # Stop turning instrument files into validations for the user who left
+        from utils.reading_watcher import get_reading_watcher
+        watcher = get_reading_watcher()
+        if watcher is not None and watcher.is_running():
+            watcher.stop()
+        # The next user gets freshly built pages, not the previous user's state
+        get_main_window().reset(keep=("login",))
+        navigate("login")
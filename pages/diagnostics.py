@@ -0,0 +1,77 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PySide6.QtCore import Qt
+from database import instrumentation
+from database.db import get_pool_stats
+
+
+class DiagnosticsDialog(QDialog):
+    """Hidden SQL diagnostics: slowest statements, latency histogram and pool usage.
+
+    Opened from the dashboard with Ctrl+Shift+D.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("SQL Diagnostics")
+        self.resize(1000, 600)
+
+        layout = QVBoxLayout()
+
+        title = QLabel("Top Queries by Total Time")
+        title.setStyleSheet("font-weight: bold;")
+        layout.addWidget(title)
+
+        self.offenders_table = QTableWidget()
+        self.offenders_table.setColumnCount(7)
+        self.offenders_table.setHorizontalHeaderLabels([
+            "Action", "Calls", "Total (ms)", "Avg (ms)", "Max (ms)", "Rows", "Statement"
+        ])
+        self.offenders_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.offenders_table.horizontalHeader().setStretchLastSection(True)
+        self.offenders_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.offenders_table)
+
+        self.histogram_label = QLabel("")
+        layout.addWidget(self.histogram_label)
+
+        self.pool_label = QLabel("")
+        layout.addWidget(self.pool_label)
+
+        button_layout = QHBoxLayout()
+        self.refresh_button = QPushButton("Refresh")
+        self.refresh_button.clicked.connect(self.refresh)
+        self.reset_button = QPushButton("Reset Statistics")
+        self.reset_button.clicked.connect(self.reset_stats)
+        button_layout.addWidget(self.refresh_button)
+        button_layout.addWidget(self.reset_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.refresh()
+
+    def refresh(self):
+        offenders = instrumentation.top_offenders()
+        self.offenders_table.setRowCount(len(offenders))
+        for row, entry in enumerate(offenders):
+            values = [
+                entry["action"], entry["count"], f"{entry['total_ms']:.1f}",
+                f"{entry['avg_ms']:.2f}", f"{entry['max_ms']:.1f}", entry["rows"], entry["statement"]
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if col < 6:
+                    item.setTextAlignment(Qt.AlignCenter)
+                self.offenders_table.setItem(row, col, item)
+
+        histogram = "   ".join(f"{label}: {count}" for label, count in instrumentation.latency_histogram())
+        self.histogram_label.setText(f"Latency histogram — {histogram}")
+
+        pool = get_pool_stats()
+        self.pool_label.setText("Connection pool — " + ", ".join(f"{k}: {v}" for k, v in pool.items()))
+
+    def reset_stats(self):
+        instrumentation.reset()
+        self.refresh()
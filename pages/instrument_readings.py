@@ -0,0 +1,98 @@
+import os
+from PySide6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import QDesktopServices
+from utils.reading_watcher import get_reading_watcher
+from utils.router import navigate
+
+LOG_COLUMNS = ["Time", "File", "Saved", "Rejected", "Note"]
+
+
+class InstrumentReadingsPage(QMainWindow):
+    """Status of the instrument ingest folder: on/off and the files handled so far."""
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Instrument Readings")
+        self.watcher = get_reading_watcher()
+
+        layout = QVBoxLayout()
+
+        title = QLabel("Instrument Readings")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        layout.addWidget(title)
+
+        self.folder_label = QLabel()
+        self.folder_label.setWordWrap(True)
+        layout.addWidget(self.folder_label)
+
+        controls = QHBoxLayout()
+        self.toggle_button = QPushButton()
+        self.toggle_button.clicked.connect(self.toggle_watching)
+        controls.addWidget(self.toggle_button)
+        self.open_folder_button = QPushButton("Open Folder")
+        self.open_folder_button.clicked.connect(self.open_folder)
+        controls.addWidget(self.open_folder_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        # Most recent first
+        self.log_table = QTableWidget(0, len(LOG_COLUMNS))
+        self.log_table.setHorizontalHeaderLabels(LOG_COLUMNS)
+        self.log_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.log_table.verticalHeader().setVisible(False)
+        self.log_table.horizontalHeader().setSectionResizeMode(len(LOG_COLUMNS) - 1, QHeaderView.Stretch)
+        layout.addWidget(self.log_table)
+
+        self.back_button = QPushButton("Back to Dashboard")
+        self.back_button.clicked.connect(self.open_dashboard)
+        layout.addWidget(self.back_button)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+
+        if self.watcher is None:
+            self.folder_label.setText(
+                "No ingest folder is configured for this station. Set ingest_folder in config.ini "
+                "to have instrument export files turned into validations automatically."
+            )
+            self.toggle_button.setEnabled(False)
+            self.open_folder_button.setEnabled(False)
+            self.toggle_button.setText("Start Watching")
+            return
+
+        self.watcher.running_changed.connect(self.show_running)
+        self.watcher.file_ingested.connect(self.add_log_entry)
+        self.show_running(self.watcher.is_running())
+        for entry in reversed(self.watcher.log):
+            self.add_log_entry(entry)
+
+    def show_running(self, running):
+        state = "watching" if running else "stopped"
+        self.folder_label.setText(f"Ingest folder ({state}): {self.watcher.folder}")
+        self.toggle_button.setText("Stop Watching" if running else "Start Watching")
+
+    def toggle_watching(self):
+        if self.watcher.is_running():
+            self.watcher.stop()
+        else:
+            self.watcher.start()
+
+    def open_folder(self):
+        QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.abspath(self.watcher.folder)))
+
+    def add_log_entry(self, entry):
+        self.log_table.insertRow(0)
+        values = [entry.time.strftime("%H:%M:%S"), entry.file_name, str(entry.saved), str(entry.rejected), entry.message]
+        for column, value in enumerate(values):
+            self.log_table.setItem(0, column, QTableWidgetItem(value))
+        while self.log_table.rowCount() > self.watcher.log.maxlen:
+            self.log_table.removeRow(self.log_table.rowCount() - 1)
+
+    def open_dashboard(self):
+        navigate("dashboard")
@@ -2,17 +2,26 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel,
     QLineEdit, QPushButton, QMessageBox, QHBoxLayout
 )
-from PySide6.QtCore import Qt
-from models.models import LabTechnician
-from database.db import get_db
+from PySide6.QtCore import Qt, QTimer
+from utils.workers import get_db_executor
 from utils.app_context import app_context 
+from utils.router import navigate
+from utils import startup_trace
+
+
+def preload_database(db):
+    # The query layer pulls in SQLAlchemy and the models, which is most of the
+    # startup cost; load it on a pool thread while the user types, and open
+    # the first pooled connection so the Login click does not wait for either
+    from database import queries, reference_cache  # noqa: F401
+    db.connection()
+
 
 class LoginPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("QC Calibration")
         
-        self.setFixedSize(1000, 600)
 
         # Outer layout to center the form
         self.outer_layout = QHBoxLayout()
@@ -73,32 +82,56 @@ class LoginPage(QMainWindow):
         container = QWidget()
         container.setLayout(self.outer_layout)
         self.setCentralWidget(container)
-        
+
+        # Once the window has had a chance to paint
+        QTimer.singleShot(0, self.start_preload)
+
+    def start_preload(self):
+        get_db_executor().submit(
+            preload_database,
+            on_result=lambda _: startup_trace.database_loaded(True),
+            on_error=lambda _: startup_trace.database_loaded(False),  # login() reports it if it persists
+            action="LoginPage.preload_database",
+        )
+
+    def on_enter(self):
+        self.password_input.clear()
+
     def login(self):
         username = self.username_input.text()
         password = self.password_input.text()
 
-        db = next(get_db())
-        user = db.query(LabTechnician).filter(LabTechnician.name == username).first()
-
+        from database import queries
+        get_db_executor().submit(
+            queries.find_technician, username,
+            on_result=lambda user: self.finish_login(user, password),
+            on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Login failed:\n{str(e)}"),
+            busy_widgets=[self.login_button],
+            owner=self,
+            action="LoginPage.login",
+        )
+
+    def finish_login(self, user, password):
         if user and user.password == password:
             app_context.set_logged_in_user(user)  # Set the logged-in user in AppContext
+            # Prefetch tool types and technician names so pages open without queries
+            from database.reference_cache import reference_cache
+            get_db_executor().submit(reference_cache.warm, action="LoginPage.warm_reference_cache")
+            # Pick up instrument export files if this station has an ingest folder
+            from utils.reading_watcher import get_reading_watcher
+            watcher = get_reading_watcher()
+            if watcher is not None:
+                watcher.start()
             self.open_dashboard()
         else:
             QMessageBox.warning(self, "Login Failed", "Incorrect name or password.")
 
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.dashboard = DashboardPage()
-        self.dashboard.show()
-        self.close()
+        navigate("dashboard")
 
     def open_register(self):
-        from pages.register import RegisterPage
-        self.register_page = RegisterPage()
-        self.register_page.show()
-        self.close()
+        navigate("register")
 
     def open_forgot_password_dialog(self):
         from pages.change_password import ForgotPasswordDialog
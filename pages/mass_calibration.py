@@ -1,20 +1,22 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QComboBox, QTableWidget,
-    QTableWidgetItem, QHBoxLayout, QPushButton, QMessageBox,
-    QDateEdit, QHeaderView, QCheckBox, QLineEdit, QSizePolicy
+    QWidget, QVBoxLayout, QLabel, QComboBox, QTableView,
+    QHBoxLayout, QPushButton, QMessageBox,
+    QDateEdit, QHeaderView, QCheckBox, QLineEdit, QSizePolicy, QProgressBar
 )
-from PySide6.QtCore import Qt, QDate
-from database.db import get_db
-from sqlalchemy.orm import Session
-from models.models import ToolType, ToolRegistration
+from PySide6.QtCore import Qt, QDate, QSortFilterProxyModel
+from database import queries
+from database.reference_cache import reference_cache
+from utils.workers import get_db_executor
+from utils.tool_list_model import CheckableToolsModel, SERIAL_COLUMN
 from utils.app_context import app_context
+from utils.kpi_cache import kpi_cache
+from utils.router import navigate
 
 
 class MassCalibrationPage(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mass Calibration Update")
-        self.setMinimumSize(900, 600)
 
         layout = QVBoxLayout()
 
@@ -50,10 +52,16 @@ class MassCalibrationPage(QWidget):
 
         layout.addLayout(top_row_layout)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Select", "Serial Number", "Status", "Last Calibration Date"])
+        # Table: checked serials live in the model, the search is a proxy filter on top
+        self.model = CheckableToolsModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.setFilterKeyColumn(SERIAL_COLUMN)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.table)
 
@@ -86,6 +94,11 @@ class MassCalibrationPage(QWidget):
         self.update_button.clicked.connect(self.update_selected_tools)
         layout.addWidget(self.update_button)
 
+        # Progress of a running update, one step per chunk of tools
+        self.update_progress = QProgressBar()
+        self.update_progress.setVisible(False)
+        layout.addWidget(self.update_progress)
+
         # Back to Dashboard Button
         self.button_layout = QHBoxLayout()
         self.dashboard_button = QPushButton("Back to Dashboard")
@@ -94,26 +107,33 @@ class MassCalibrationPage(QWidget):
         layout.addLayout(self.button_layout)
 
         self.setLayout(layout)
+
+    def on_enter(self):
         self.load_tool_types()
 
     def load_tool_types(self):
-        try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
-
-            self.tool_type_dropdown.clear()
-            self.tool_type_map = {}
+        tool_types = reference_cache.tool_types_cached()
+        if tool_types is not None:
+            self.populate_tool_types(tool_types)
+            return
 
-            tool_types = db.query(ToolType).all()
-            for tool_type in tool_types:
-                display = f"{tool_type.tool_name}"
-                self.tool_type_dropdown.addItem(display)
-                self.tool_type_map[display] = tool_type.tool_type_id
+        get_db_executor().submit(
+            queries.get_tool_types,
+            on_result=self.populate_tool_types,
+            on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to load tool types:\n{str(e)}"),
+            owner=self,
+            action="MassCalibrationPage.load_tool_types",
+        )
 
-            db_gen.close()
+    def populate_tool_types(self, tool_types):
+        self.tool_type_map = {}
+        for tool_type in tool_types:
+            display = f"{tool_type.tool_name}"
+            self.tool_type_map[display] = tool_type.tool_type_id
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load tool types:\n{str(e)}")
+        # Filling the dropdown fires currentIndexChanged -> load_tools, so the map must be ready first
+        self.tool_type_dropdown.clear()
+        self.tool_type_dropdown.addItems(list(self.tool_type_map))
 
     def load_tools(self):
         selected_text = self.tool_type_dropdown.currentText()
@@ -121,42 +141,29 @@ class MassCalibrationPage(QWidget):
             return
 
         tool_type_id = self.tool_type_map[selected_text]
-
-        try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
-
-            # Only fetch tools that are NOT retired
-            self.all_tools = db.query(ToolRegistration).filter(
-                ToolRegistration.tool_type_id == tool_type_id,
-                ToolRegistration.tool_status != "Retired"
-            ).all()
-            db_gen.close()
-
-            self.display_tools(self.all_tools)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load tools:\n{str(e)}")
-
-
-    def display_tools(self, tools):
-        self.table.setRowCount(len(tools))
-        for row, tool in enumerate(tools):
-            checkbox = QCheckBox()
-            self.table.setCellWidget(row, 0, checkbox)
-
-            self.table.setItem(row, 1, QTableWidgetItem(tool.serial_number))
-            self.table.setItem(row, 2, QTableWidgetItem(tool.tool_status))
-            self.table.setItem(row, 3, QTableWidgetItem(
-                tool.last_calibration.strftime("%Y-%m-%d") if tool.last_calibration else "N/A"
-            ))
+        get_db_executor().submit(
+            queries.get_active_tools, tool_type_id,
+            on_result=lambda tools: self.set_tools(tools, tool_type_id),
+            on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to load tools:\n{str(e)}"),
+            busy_widgets=[self.update_button],
+            owner=self,
+            action="MassCalibrationPage.load_tools",
+        )
+
+    def set_tools(self, tools, tool_type_id):
+        # Ignore late results for a tool type that is no longer selected
+        if self.tool_type_map.get(self.tool_type_dropdown.currentText()) != tool_type_id:
+            return
+        self.model.set_tools(tools)
 
     def filter_tools(self, text):
-        if not hasattr(self, 'all_tools'):
-            return
+        self.proxy_model.setFilterFixedString(text)
 
-        filtered = [tool for tool in self.all_tools if text.lower() in tool.serial_number.lower()]
-        self.display_tools(filtered)
+    def visible_serials(self):
+        return [
+            self.proxy_model.index(row, SERIAL_COLUMN).data()
+            for row in range(self.proxy_model.rowCount())
+        ]
 
     def update_selected_tools(self):
         new_status = self.status_dropdown.currentText() if self.update_status_checkbox.isChecked() else None
@@ -167,41 +174,52 @@ class MassCalibrationPage(QWidget):
             QMessageBox.warning(self, "No User", "No logged-in user found.")
             return
 
-        try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
-
-            updated = 0
-            for row in range(self.table.rowCount()):
-                checkbox = self.table.cellWidget(row, 0)
-                if checkbox.isChecked():
-                    serial_number = self.table.item(row, 1).text()
-                    tool = db.query(ToolRegistration).filter_by(serial_number=serial_number).first()
-                    if tool:
-                        if new_status:
-                            tool.tool_status = new_status
-                        if new_date:
-                            tool.last_calibration = new_date
-                        tool.modified_by = current_user.technician_id
-                        updated += 1
-
-            db.commit()
-            db_gen.close()
+        # Checked tools hidden by the search are included too
+        serial_numbers = self.model.selected_serials()
+        if not serial_numbers:
+            QMessageBox.warning(self, "No Tools", "Select at least one tool to update.")
+            return
 
+        self.update_progress.setRange(0, len(serial_numbers))
+        self.update_progress.setValue(0)
+        self.update_progress.setVisible(True)
+        get_db_executor().submit(
+            queries.update_tools, serial_numbers, new_status, new_date, current_user.technician_id,
+            on_result=lambda updated: self.on_tools_updated(serial_numbers, new_status, new_date, updated),
+            on_error=self.on_update_failed,
+            on_progress=lambda done, total: self.update_progress.setValue(done),
+            busy_widgets=[self.update_button, self.select_all_button],
+            owner=self,
+            action="MassCalibrationPage.update_selected_tools",
+        )
+
+    def on_tools_updated(self, serial_numbers, new_status, new_date, updated):
+        self.update_progress.setVisible(False)
+        kpi_cache.invalidate()  # due/overdue and under-calibration counts
+        # Patch only the updated rows; retired tools drop off the active list
+        if new_status == "Retired":
+            self.model.remove_tools(serial_numbers)
+        else:
+            self.model.update_tools(serial_numbers, new_status, new_date)
+            self.model.set_checked(serial_numbers, False)
+
+        if updated == len(serial_numbers):
             QMessageBox.information(self, "Success", f"Updated {updated} tools.")
-            self.load_tools()
+        else:
+            QMessageBox.warning(
+                self, "Partially Updated",
+                f"Updated {updated} of {len(serial_numbers)} selected tools; the rest no longer exist."
+            )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update tools:\n{str(e)}")
+    def on_update_failed(self, error):
+        self.update_progress.setVisible(False)
+        QMessageBox.critical(self, "Error", f"Failed to update tools (no changes were saved):\n{str(error)}")
 
     def select_all_tools(self):
-        all_selected = all(self.table.cellWidget(row, 0).isChecked() for row in range(self.table.rowCount()))
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            checkbox.setChecked(not all_selected)
+        # Toggles the tools matching the current search
+        serials = self.visible_serials()
+        all_selected = all(serial in self.model.selected for serial in serials)
+        self.model.set_checked(serials, not all_selected)
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
@@ -4,16 +4,15 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from models.models import LabTechnician
-from database.db import get_db
-
-from pages.login import LoginPage  # Avoid circular import
+from database.db import session_scope
+from database.reference_cache import reference_cache
+from utils.router import navigate
 
 class RegisterPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("QC Calibration")
         
-        self.setFixedSize(1000, 600)
 
         # Outer layout to center the form
         self.outer_layout = QHBoxLayout()
@@ -83,25 +82,20 @@ class RegisterPage(QMainWindow):
             QMessageBox.warning(self, "Error", "Please fill in all fields.")
             return
 
-        db = next(get_db())
-        existing_user = db.query(LabTechnician).filter(LabTechnician.email == email).first()
+        with session_scope() as db:
+            existing_user = db.query(LabTechnician).filter(LabTechnician.email == email).first()
+            if not existing_user:
+                db.add(LabTechnician(name=name, email=email, password=password))
 
         if existing_user:
             QMessageBox.warning(self, "Error", "Email already registered.")
             return
 
-        new_user = LabTechnician(name=name, email=email, password=password)
-        db.add(new_user)
-        db.commit()
+        reference_cache.invalidate_technicians()
 
         QMessageBox.information(self, "Success", "Account created successfully!")
 
-        self.login_page = LoginPage()
-        self.login_page.show()
-        self.close()
+        navigate("login")
 
     def back_to_login(self):
-        self.login_page = LoginPage()
-        self.login_page.show()
-        self.close()
-
+        navigate("login")
@@ -0,0 +1,151 @@
+import os
+from PySide6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import Qt
+from database import tool_import
+from database.reference_cache import reference_cache
+from utils.app_context import app_context
+from utils.kpi_cache import kpi_cache
+from utils.workers import get_db_executor
+from utils.router import navigate
+
+# Rejected rows listed on the page; the saved report always has all of them
+MAX_LISTED_REJECTIONS = 1000
+
+
+class ImportToolsPage(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Import Tools")
+        self.path = None
+        self.rejected = []
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(50, 30, 50, 30)
+
+        title = QLabel("Import Tools")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        layout.addWidget(title)
+
+        help_label = QLabel(
+            "CSV or XLSX with columns: serial_number, tool_type, last_calibration (YYYY-MM-DD), "
+            "and optionally tool_status (default Active)."
+        )
+        help_label.setWordWrap(True)
+        layout.addWidget(help_label)
+
+        # File choice
+        file_layout = QHBoxLayout()
+        self.file_label = QLabel("No file selected")
+        file_layout.addWidget(self.file_label, 1)
+        self.choose_button = QPushButton("Choose File…")
+        self.choose_button.clicked.connect(self.choose_file)
+        file_layout.addWidget(self.choose_button)
+        self.import_button = QPushButton("Import")
+        self.import_button.setEnabled(False)
+        self.import_button.clicked.connect(self.start_import)
+        file_layout.addWidget(self.import_button)
+        layout.addLayout(file_layout)
+
+        self.progress = QProgressBar()
+        self.progress.setVisible(False)
+        layout.addWidget(self.progress)
+
+        self.result_label = QLabel("")
+        layout.addWidget(self.result_label)
+
+        # Rejected rows
+        self.rejected_table = QTableWidget(0, 3)
+        self.rejected_table.setHorizontalHeaderLabels(["Line", "Serial Number", "Reason"])
+        self.rejected_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.rejected_table.verticalHeader().setVisible(False)
+        self.rejected_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        layout.addWidget(self.rejected_table)
+
+        button_layout = QHBoxLayout()
+        self.save_rejected_button = QPushButton("Save Rejected Rows…")
+        self.save_rejected_button.setEnabled(False)
+        self.save_rejected_button.clicked.connect(self.save_rejected)
+        button_layout.addWidget(self.save_rejected_button)
+        self.back_button = QPushButton("Back to Tool Management")
+        self.back_button.clicked.connect(self.open_tool_management)
+        button_layout.addWidget(self.back_button)
+        layout.addLayout(button_layout)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+
+    def choose_file(self):
+        filters = "CSV files (*.csv)"
+        if tool_import.xlsx_available():
+            filters = "Tool lists (*.csv *.xlsx);;" + filters + ";;Excel workbooks (*.xlsx)"
+        path, _ = QFileDialog.getOpenFileName(self, "Import Tools", "", filters)
+        if path:
+            self.path = path
+            self.file_label.setText(os.path.basename(path))
+            self.import_button.setEnabled(True)
+
+    def start_import(self):
+        user = app_context.get_logged_in_user()
+        if user is None:
+            QMessageBox.warning(self, "Error", "No user is logged in.")
+            return
+
+        self.rejected = []
+        self.rejected_table.setRowCount(0)
+        self.save_rejected_button.setEnabled(False)
+        self.result_label.setText("Importing…")
+        self.progress.setRange(0, 0)
+        self.progress.setVisible(True)
+        get_db_executor().submit(
+            tool_import.import_tools, self.path, user.technician_id,
+            on_progress=self.show_progress,
+            on_result=self.on_imported,
+            on_error=self.on_import_failed,
+            busy_widgets=[self.import_button, self.choose_button],
+            owner=self,
+            action="ImportToolsPage.import_tools",
+        )
+
+    def show_progress(self, done, total):
+        self.progress.setRange(0, max(total, done, 1))
+        self.progress.setValue(done)
+
+    def on_imported(self, result):
+        self.progress.setVisible(False)
+        if result.imported:
+            reference_cache.invalidate_serials()
+            kpi_cache.invalidate()
+        self.rejected = result.rejected
+        self.result_label.setText(f"Imported {result.imported} tool(s); {len(result.rejected)} row(s) rejected.")
+
+        listed = result.rejected[:MAX_LISTED_REJECTIONS]
+        self.rejected_table.setRowCount(len(listed))
+        for i, rejected in enumerate(listed):
+            self.rejected_table.setItem(i, 0, QTableWidgetItem(str(rejected.line)))
+            self.rejected_table.setItem(i, 1, QTableWidgetItem(str(rejected.values.get("serial_number", ""))))
+            self.rejected_table.setItem(i, 2, QTableWidgetItem(rejected.reason))
+        self.save_rejected_button.setEnabled(bool(result.rejected))
+
+    def on_import_failed(self, error):
+        # Nothing was committed: the import runs in one transaction
+        self.progress.setVisible(False)
+        self.result_label.setText("Import failed; no tools were registered.")
+        QMessageBox.critical(self, "Import Failed", f"Error importing tools:\n{str(error)}")
+
+    def save_rejected(self):
+        suggested = os.path.splitext(self.path)[0] + "_rejected.csv"
+        path, _ = QFileDialog.getSaveFileName(self, "Save Rejected Rows", suggested, "CSV files (*.csv)")
+        if not path:
+            return
+        try:
+            tool_import.write_rejected(path, self.rejected)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to save rejected rows:\n{str(e)}")
+
+    def open_tool_management(self):
+        navigate("tool_management")
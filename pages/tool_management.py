@@ -3,13 +3,13 @@ from PySide6.QtWidgets import (
     QPushButton, QMenu, QHBoxLayout, QSpacerItem, QSizePolicy
 )
 from PySide6.QtCore import Qt
+from utils.router import navigate
 
 
 class ToolManagementPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("QC Calibration")
-        self.setFixedSize(1000, 600)
 
         # Create the outer layout that holds everything
         self.outer_layout = QVBoxLayout()
@@ -45,6 +45,7 @@ class ToolManagementPage(QMainWindow):
         self.tool_registration_menu = QMenu()
         self.tool_registration_menu.addAction("Register New Tool", self.open_register_tool)
         self.tool_registration_menu.addAction("Update Tool", self.open_update_tool)
+        self.tool_registration_menu.addAction("Import Tools from File", self.open_import_tools)
         self.tool_registration_menu.addAction("Mass Calibration", self.open_mass_calibration)
 
         self.tool_registration_button = QPushButton("Manage Tool")
@@ -73,38 +74,22 @@ class ToolManagementPage(QMainWindow):
 
     # Tool Type Pages
     def open_add_tool_type(self):
-        from pages.tool_type_add import AddToolTypePage
-        self.page = AddToolTypePage()
-        self.page.show()
-        self.close()
+        navigate("add_tool_type")
 
     def open_update_tool_type(self):
-        from pages.tool_type_update import UpdateToolTypePage
-        self.page = UpdateToolTypePage()
-        self.page.show()
-        self.close()
+        navigate("update_tool_type")
 
-    # Tool Registration Pages
     def open_register_tool(self):
-        from pages.tool_register import RegisterToolPage
-        self.page = RegisterToolPage()
-        self.page.show()
-        self.close()
+        navigate("register_tool")
 
     def open_update_tool(self):
-        from pages.tool_update import UpdateToolPage
-        self.page = UpdateToolPage()
-        self.page.show()
-        self.close()
+        navigate("update_tool")
+
+    def open_import_tools(self):
+        navigate("import_tools")
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
 
     def open_mass_calibration(self):
-        from pages.mass_calibration import MassCalibrationPage
-        self.page = MassCalibrationPage()
-        self.page.show()
-        self.close()
+        navigate("mass_calibration")
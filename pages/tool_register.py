@@ -3,16 +3,20 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QDateEdit
 )
 from PySide6.QtCore import Qt, QDate
-from database.db import get_db
-from models.models import ToolType, ToolRegistration
+from database.db import session_scope
+from database.reference_cache import reference_cache
+from database import tool_summary
+from database.calibration import calibration_due
+from models.models import ToolRegistration
 from utils.app_context import app_context
+from utils.kpi_cache import kpi_cache
 from datetime import datetime
+from utils.router import navigate
 
 class RegisterToolPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Register New Tool")
-        self.setFixedSize(1000, 600)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(50, 50, 50, 50)
@@ -33,7 +37,6 @@ class RegisterToolPage(QMainWindow):
         self.tool_type_dropdown = QComboBox()
         layout.addWidget(QLabel("Tool Type"))
         layout.addWidget(self.tool_type_dropdown)
-        self.populate_tool_types()
 
         # Last Calibration Date
         layout.addWidget(QLabel("Last Calibration Date"))
@@ -55,10 +58,14 @@ class RegisterToolPage(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+    def on_enter(self):
+        # Tool types may have been added or removed since the last visit
+        self.populate_tool_types()
+
     def populate_tool_types(self):
-        db = next(get_db())
-        tool_types = db.query(ToolType).all()
+        tool_types = reference_cache.tool_types()
         self.tool_type_map = {tool.tool_name: tool.tool_type_id for tool in tool_types}
+        self.tool_type_dropdown.clear()
         for tool_name in self.tool_type_map:
             self.tool_type_dropdown.addItem(tool_name)
 
@@ -89,24 +96,24 @@ class RegisterToolPage(QMainWindow):
             tool_type_id=tool_type_id,
             tool_status=tool_status,
             last_calibration=last_calibration,
+            calibration_due=calibration_due(last_calibration),
             modified_by=modified_by
         )
 
         try:
-            db = next(get_db())
-            db.add(new_tool)
-            db.commit()
+            with session_scope() as db:
+                db.add(new_tool)
+                db.flush()
+                tool_summary.refresh(db, [serial_number])
+            reference_cache.invalidate_serials()
+            kpi_cache.invalidate()
             QMessageBox.information(self, "Success", "Tool registered successfully!")
             self.clear_form()
         except Exception as e:
-            db.rollback()
             QMessageBox.critical(self, "Error", f"Failed to register tool: {str(e)}")
 
     def clear_form(self):
         self.serial_input.clear()
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.dashboard = DashboardPage()
-        self.dashboard.show()
-        self.close()
+        navigate("dashboard")
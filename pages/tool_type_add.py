@@ -3,15 +3,16 @@ from PySide6.QtWidgets import (
     QLineEdit, QPushButton, QMessageBox, QHBoxLayout
 )
 from PySide6.QtCore import Qt
-from database.db import get_db
+from database.db import session_scope
+from database.reference_cache import reference_cache
 from models.models import ToolType
+from utils.router import navigate
 
 
 class AddToolTypePage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Add New Tool Type")
-        self.setFixedSize(1000, 600)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(50, 50, 50, 50)
@@ -82,38 +83,34 @@ class AddToolTypePage(QMainWindow):
             QMessageBox.warning(self, "Error", "Blocks and Tolerance must be valid numbers.")
             return
 
-        db = next(get_db())
+        try:
+            with session_scope() as db:
+                # Check if tool type already exists
+                existing_tool_type = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+                if not existing_tool_type:
+                    # Create new ToolType object
+                    db.add(ToolType(
+                        tool_name=tool_name,
+                        block_1=block1,
+                        block_2=block2,
+                        block_3=block3,
+                        tolerance=tolerance
+                    ))
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", f"Failed to add tool type: {str(e)}")
+            return
 
-        # Check if tool type already exists
-        existing_tool_type = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
         if existing_tool_type:
             QMessageBox.warning(self, "Error", "Tool type with this name already exists.")
             return
 
-        # Create new ToolType object
-        new_tool_type = ToolType(
-            tool_name=tool_name,
-            block_1=block1,
-            block_2=block2,
-            block_3=block3,
-            tolerance=tolerance
-        )
-
-        try:
-            db.add(new_tool_type)
-            db.commit()
-            QMessageBox.information(self, "Success", "Tool Type added successfully!")
-            self.tool_name_input.clear()
-            self.block1_input.clear()
-            self.block2_input.clear()
-            self.block3_input.clear()
-            self.tolerance_input.clear()
-        except Exception as e:
-            db.rollback()
-            QMessageBox.critical(self, "Database Error", f"Failed to add tool type: {str(e)}")
+        reference_cache.invalidate_tool_types()
+        QMessageBox.information(self, "Success", "Tool Type added successfully!")
+        self.tool_name_input.clear()
+        self.block1_input.clear()
+        self.block2_input.clear()
+        self.block3_input.clear()
+        self.tolerance_input.clear()
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
\ No newline at end of file
+        navigate("dashboard")
@@ -3,14 +3,15 @@ from PySide6.QtWidgets import (
     QLabel, QComboBox, QLineEdit, QPushButton, QMessageBox
 )
 from PySide6.QtCore import Qt
-from database.db import get_db
+from database.db import session_scope
+from database.reference_cache import reference_cache
 from models.models import ToolType
+from utils.router import navigate
 
 class UpdateToolTypePage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Update Tool Type")
-        self.setFixedSize(1000, 600)
 
         # Main layout
         layout = QVBoxLayout()
@@ -28,7 +29,6 @@ class UpdateToolTypePage(QMainWindow):
 
         self.tool_type_dropdown = QComboBox()
         self.tool_type_dropdown.addItem("Select Tool Type")  # Placeholder option
-        self.populate_tool_type_dropdown()
 
         self.tool_type_dropdown.currentIndexChanged.connect(self.load_tool_data)
         tool_selection_layout.addWidget(self.tool_type_dropdown)
@@ -122,6 +122,9 @@ class UpdateToolTypePage(QMainWindow):
         if event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
             self.submit_change()
 
+    def on_enter(self):
+        self.populate_tool_type_dropdown()
+
     def populate_tool_type_dropdown(self):
         # Clear the existing items from the dropdown
         self.tool_type_dropdown.clear()
@@ -129,9 +132,8 @@ class UpdateToolTypePage(QMainWindow):
         # Add the placeholder option again
         self.tool_type_dropdown.addItem("Select Tool Type")  
         
-        # Populate the dropdown with tool type names from the database
-        db = next(get_db())
-        tool_types = db.query(ToolType).all()
+        # Populate the dropdown with tool type names (cached)
+        tool_types = reference_cache.tool_types()
         for tool_type in tool_types:
             self.tool_type_dropdown.addItem(tool_type.tool_name)
 
@@ -140,8 +142,7 @@ class UpdateToolTypePage(QMainWindow):
         if tool_name == "Select Tool Type" or not tool_name:
             return
 
-        db = next(get_db())
-        tool = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+        tool = reference_cache.tool_type_by_name(tool_name)
 
         if tool:
             # Populate the middle section with data from the database
@@ -165,36 +166,43 @@ class UpdateToolTypePage(QMainWindow):
             QMessageBox.warning(self, "Error", "No tool type selected.")
             return
 
-        db = next(get_db())
-        tool = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+        # Get and process input data
+        new_block1 = self.block1_input.text().strip()
+        new_block2 = self.block2_input.text().strip()
+        new_block3 = self.block3_input.text().strip()
+        new_tolerance = self.tolerance_input.text().strip()
+
+        # Required fields
+        if not new_block1 or not new_tolerance:
+            QMessageBox.warning(self, "Error", "Block 1 and Tolerance are required.")
+            return
+
+        # Parse everything before touching the row so a bad value never half-applies
+        try:
+            new_block1 = float(new_block1)
+            new_block2 = float(new_block2) if new_block2 else None
+            new_block3 = float(new_block3) if new_block3 else None
+            new_tolerance = float(new_tolerance)
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Block values and Tolerance must be valid numbers.")
+            return
+
+        try:
+            with session_scope() as db:
+                tool = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+                if tool:
+                    tool.block_1 = new_block1
+                    tool.block_2 = new_block2
+                    tool.block_3 = new_block3
+                    tool.tolerance = new_tolerance
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to update tool: {str(e)}")
+            return
 
+        reference_cache.invalidate_tool_types()
         if tool:
-            try:
-                # Get and process input data
-                new_block1 = self.block1_input.text().strip()
-                new_block2 = self.block2_input.text().strip()
-                new_block3 = self.block3_input.text().strip()
-                new_tolerance = self.tolerance_input.text().strip()
-
-                # Required fields
-                if not new_block1 or not new_tolerance:
-                    QMessageBox.warning(self, "Error", "Block 1 and Tolerance are required.")
-                    return
-
-                tool.block_1 = float(new_block1)
-                tool.block_2 = float(new_block2) if new_block2 else None
-                tool.block_3 = float(new_block3) if new_block3 else None
-                tool.tolerance = float(new_tolerance)
-
-                db.commit()
-                QMessageBox.information(self, "Success", "Tool information updated successfully!")
-                self.load_tool_data()  # Refresh the displayed data
-
-            except ValueError:
-                QMessageBox.warning(self, "Error", "Block values and Tolerance must be valid numbers.")
-            except Exception as e:
-                db.rollback()
-                QMessageBox.critical(self, "Error", f"Failed to update tool: {str(e)}")
+            QMessageBox.information(self, "Success", "Tool information updated successfully!")
+            self.load_tool_data()  # Refresh the displayed data
         else:
             QMessageBox.warning(self, "Error", "Tool type not found.")
 
@@ -209,12 +217,13 @@ class UpdateToolTypePage(QMainWindow):
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            db = next(get_db())
-            tool = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+            with session_scope() as db:
+                tool = db.query(ToolType).filter(ToolType.tool_name == tool_name).first()
+                if tool:
+                    db.delete(tool)
 
+            reference_cache.invalidate_tool_types()
             if tool:
-                db.delete(tool)
-                db.commit()
                 QMessageBox.information(self, "Success", f"Tool type '{tool_name}' deleted successfully!")
                 self.clear_tool_data()  # Clear the current tool data
                 self.populate_tool_type_dropdown()  # Refresh the dropdown
@@ -233,7 +242,4 @@ class UpdateToolTypePage(QMainWindow):
         self.tolerance_input.clear()
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
@@ -4,15 +4,21 @@ from PySide6.QtWidgets import (
     QGridLayout, QGroupBox
 )
 from PySide6.QtCore import Qt, QDateTime
-from database.db import get_db
-from models.models import ToolType, ToolRegistration
+from sqlalchemy.orm import joinedload
+from database.db import session_scope
+from database.reference_cache import reference_cache
+from database import tool_summary
+from database.calibration import calibration_due
+from models.models import ToolRegistration
 from utils.app_context import app_context
+from utils.kpi_cache import kpi_cache
+from utils.serial_completer import SerialCompleter
+from utils.router import navigate
 
 class UpdateToolPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Update Tool")
-        self.setFixedSize(1000, 600)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(50, 50, 50, 50)
@@ -31,6 +37,7 @@ class UpdateToolPage(QMainWindow):
         top_layout.addWidget(self.search_input)
         # Connect the 'Enter' key press to the search function
         self.search_input.returnPressed.connect(self.load_tool_data)
+        self.serial_completer = SerialCompleter(self.search_input)
 
         layout.addLayout(top_layout)
 
@@ -62,7 +69,6 @@ class UpdateToolPage(QMainWindow):
         form_layout.addWidget(QLabel("Tool Type:"), 2, 0)
         self.type_label = QLabel("-")
         self.type_dropdown = QComboBox()
-        self.populate_tool_type_dropdown()
         form_layout.addWidget(self.type_label, 2, 1)
         form_layout.addWidget(self.type_dropdown, 2, 2)
 
@@ -99,9 +105,11 @@ class UpdateToolPage(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+    def on_enter(self):
+        self.populate_tool_type_dropdown()
+
     def populate_tool_type_dropdown(self):
-        db = next(get_db())
-        tool_types = db.query(ToolType).all()
+        tool_types = reference_cache.tool_types()
         self.tool_type_map = {t.tool_name: t.tool_type_id for t in tool_types}
         self.type_dropdown.clear()
         self.type_dropdown.addItem("")  # placeholder
@@ -109,8 +117,13 @@ class UpdateToolPage(QMainWindow):
 
     def load_tool_data(self):
         serial_number = self.search_input.text()
-        db = next(get_db())
-        tool = db.query(ToolRegistration).filter(ToolRegistration.serial_number == serial_number).first()
+        with session_scope() as db:
+            tool = (
+                db.query(ToolRegistration)
+                .options(joinedload(ToolRegistration.tool_type))
+                .filter(ToolRegistration.serial_number == serial_number)
+                .first()
+            )
 
         if tool:
             self.serial_label.setText(tool.serial_number)
@@ -128,51 +141,56 @@ class UpdateToolPage(QMainWindow):
 
     def submit_change(self):
         original_serial = self.search_input.text()
-        db = next(get_db())
-        tool = db.query(ToolRegistration).filter(ToolRegistration.serial_number == original_serial).first()
+        if app_context.get_logged_in_user() is None:  # Check if user is logged in
+            QMessageBox.warning(self, "Error", "No user is logged in.")
+            return  # Exit the method if no user is logged in
+
+        logged_in_user = app_context.get_logged_in_user()
+
+        with session_scope() as db:
+            tool = db.query(ToolRegistration).filter(ToolRegistration.serial_number == original_serial).first()
+
+            updated = False
+            if tool:
+                new_serial = self.serial_input.text()
+                new_type_name = self.type_dropdown.currentText()
+                new_type_id = self.tool_type_map.get(new_type_name)
+                new_date_str = self.date_input.text()
+                new_status = self.status_dropdown.currentText()
+
+                if new_serial and new_serial != tool.serial_number:
+                    tool.serial_number = new_serial
+                    updated = True
+                if new_type_id and new_type_id != tool.tool_type_id:
+                    tool.tool_type_id = new_type_id
+                    updated = True
+                if new_date_str:
+                    new_date = QDateTime.fromString(new_date_str, "yyyy/MM/dd").toPython()
+                    if new_date != tool.last_calibration:
+                        tool.last_calibration = new_date
+                        tool.calibration_due = calibration_due(new_date)
+                        updated = True
+                if new_status and new_status != tool.tool_status:
+                    tool.tool_status = new_status
+                    updated = True
+
+                if updated:
+                    tool.last_modified = QDateTime.currentDateTime().toPython()
+                    tool.modified_by = logged_in_user.technician_id  # Access the logged-in user’s ID safely
+                    db.flush()
+                    tool_summary.refresh(db, [original_serial, tool.serial_number])
 
         if not tool:
             QMessageBox.warning(self, "Error", "Original tool not found.")
             return
 
-        updated = False
-        new_serial = self.serial_input.text()
-        new_type_name = self.type_dropdown.currentText()
-        new_type_id = self.tool_type_map.get(new_type_name)
-        new_date_str = self.date_input.text()
-        new_status = self.status_dropdown.currentText()
-
-        if new_serial and new_serial != tool.serial_number:
-            tool.serial_number = new_serial
-            updated = True
-        if new_type_id and new_type_id != tool.tool_type_id:
-            tool.tool_type_id = new_type_id
-            updated = True
-        if new_date_str:
-            new_date = QDateTime.fromString(new_date_str, "yyyy/MM/dd").toPython()
-            if new_date != tool.last_calibration:
-                tool.last_calibration = new_date
-                updated = True
-        if new_status and new_status != tool.tool_status:
-            tool.tool_status = new_status
-            updated = True
-
         if updated:
-            tool.last_modified = QDateTime.currentDateTime().toPython()
-            if app_context.get_logged_in_user() is None:  # Check if user is logged in
-                QMessageBox.warning(self, "Error", "No user is logged in.")
-                return  # Exit the method if no user is logged in
-
-            logged_in_user = app_context.get_logged_in_user()
-            tool.modified_by = logged_in_user.technician_id  # Access the logged-in user’s ID safely
-            db.commit()
+            reference_cache.invalidate_serials()  # the serial number may have changed
+            kpi_cache.invalidate()
             QMessageBox.information(self, "Success", "Tool information updated.")
             self.load_tool_data()
         else:
             QMessageBox.information(self, "No Change", "No modifications detected.")
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
@@ -1,19 +1,21 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView, QHBoxLayout, QDateEdit
+    QTableView, QMessageBox, QHeaderView, QHBoxLayout, QDateEdit, QCheckBox
 )
 from PySide6.QtCore import Qt, QDate
-from models.models import ToolRegistration, ToolType, ValidationRecord, LabTechnician
-from sqlalchemy.orm import joinedload
-from sqlalchemy import and_
-from database.db import get_db
-from datetime import datetime, timedelta
+from database import queries
+from utils.records_model import PagedRecordsModel
+from utils.record_filter import RecordFilterProxyModel
+from utils.workers import get_db_executor
+from utils.serial_completer import SerialCompleter
+from utils.export_controls import ExportControls
+from database import export
+from utils.router import navigate
 
 class ToolValidationRecordsPage(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Tool Validation Records")
-        self.setMinimumSize(1000, 600)
 
         self.layout = QVBoxLayout()
 
@@ -26,6 +28,7 @@ class ToolValidationRecordsPage(QWidget):
         # Serial number input
         self.serial_input = QLineEdit()
         self.serial_input.setPlaceholderText("Enter Tool Serial Number")
+        self.serial_completer = SerialCompleter(self.serial_input)
         self.layout.addWidget(self.serial_input)
 
         # Date range inputs (placed in the same row)
@@ -48,6 +51,11 @@ class ToolValidationRecordsPage(QWidget):
         self.end_date_edit.setDisplayFormat("yyyy-MM-dd")
         date_range_layout.addWidget(self.end_date_edit)
 
+        # Audits need the whole history: ignore the start date
+        self.full_history_checkbox = QCheckBox("Full history")
+        self.full_history_checkbox.toggled.connect(lambda checked: self.start_date_edit.setEnabled(not checked))
+        date_range_layout.addWidget(self.full_history_checkbox)
+
         self.layout.addLayout(date_range_layout)
 
         # Load button
@@ -60,6 +68,8 @@ class ToolValidationRecordsPage(QWidget):
         self.dashboard_button = QPushButton("Back to Dashboard")
         self.dashboard_button.clicked.connect(self.open_dashboard)
         self.button_layout.addWidget(self.dashboard_button)
+        self.export_controls = ExportControls(self.export_query, "ToolValidationRecordsPage.export")
+        self.button_layout.addWidget(self.export_controls)
         self.layout.addLayout(self.button_layout)
         
         # Search bar for searching records
@@ -73,16 +83,29 @@ class ToolValidationRecordsPage(QWidget):
         self.tool_info_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.tool_info_label)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(13)
-        self.table.setHorizontalHeaderLabels([
-            "Date",
-            "Block 1", "Reading 1", "Pass/Fail 1",
-            "Block 2", "Reading 2", "Pass/Fail 2",
-            "Block 3", "Reading 3", "Pass/Fail 3",
-            "Tolerance", "Final Result", "Technician"
-        ])
+        # Table: history is paged in newest-first as the user scrolls
+        self.model = PagedRecordsModel(
+            [
+                "Date",
+                "Block 1", "Reading 1", "Pass/Fail 1",
+                "Block 2", "Reading 2", "Pass/Fail 2",
+                "Block 3", "Reading 3", "Pass/Fail 3",
+                "Tolerance", "Final Result", "Technician"
+            ],
+            status_columns=[3, 6, 9, 11],
+            parent=self,
+        )
+        self.model.first_page_loaded.connect(self.on_first_page_loaded)
+        self.model.load_failed.connect(self.show_load_error)
+
+        # Search filter over a lowercase index built as rows arrive
+        self.proxy_model = RecordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.layout.addWidget(self.table)
 
@@ -90,18 +113,7 @@ class ToolValidationRecordsPage(QWidget):
 
     def search_records(self):
         """Search for records in the table based on the user's input."""
-        search_text = self.search_input.text().lower()
-        row_count = self.table.rowCount()
-
-        for row in range(row_count):
-            match_found = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match_found = True
-                    break  # If a match is found in any column, stop checking further columns.
-
-            self.table.setRowHidden(row, not match_found)  # Hide rows that don't match the search
+        self.proxy_model.search(self.search_input.text())  # debounced
 
     def load_records(self):
         serial = self.serial_input.text().strip()
@@ -111,80 +123,53 @@ class ToolValidationRecordsPage(QWidget):
             return
 
         # Get the selected date range
-        start_date = self.start_date_edit.date().toPython()
+        start_date = None if self.full_history_checkbox.isChecked() else self.start_date_edit.date().toPython()
         end_date = self.end_date_edit.date().toPython()
         
-        if start_date > end_date:
+        if start_date and start_date > end_date:
             QMessageBox.warning(self, "Date Error", "Start date cannot be later than end date.")
             return
 
-        # Ensure the range does not exceed 6 months
-        if (end_date - start_date).days > 190:
-            QMessageBox.warning(self, "Date Error", "The date range cannot exceed 6 months.")
+        get_db_executor().submit(
+            queries.get_tool, serial,
+            on_result=lambda tool: self.load_history(serial, tool, start_date, end_date),
+            on_error=self.show_load_error,
+            busy_widgets=[self.load_button],
+            owner=self,
+            action="ToolValidationRecordsPage.load_records",
+        )
+
+    def export_query(self):
+        serial = self.serial_input.text().strip()
+        if not serial:
+            QMessageBox.warning(self, "Input Error", "Please enter a tool serial number.")
+            return None
+        start_date = None if self.full_history_checkbox.isChecked() else self.start_date_edit.date().toPython()
+        end_date = self.end_date_edit.date().toPython()
+        if start_date and start_date > end_date:
+            QMessageBox.warning(self, "Date Error", "Start date cannot be later than end date.")
+            return None
+        return export.tool_history_query(serial, start_date, end_date), f"validation_records_{serial}"
+
+    def load_history(self, serial, tool, start_date, end_date):
+        if not tool:
+            self.model.clear()
+            self.tool_info_label.clear()
+            QMessageBox.warning(self, "Not Found", f"No tool found with serial number '{serial}'")
             return
 
-        try:
-            db_gen = get_db()        # Get generator
-            db = next(db_gen)        # Get session object
-
-            # Get tool and tool type
-            tool = db.query(ToolRegistration).join(ToolType).filter(ToolRegistration.serial_number == serial).first()
-
-            if not tool:
-                QMessageBox.warning(self, "Not Found", f"No tool found with serial number '{serial}'")
-                return
-
-            self.tool_info_label.setText(f"Tool Serial Number: {serial} | Tool Type: {tool.tool_type.tool_name}")
-
-            # Get validation records within the selected date range
-            records = (
-                db.query(ValidationRecord)
-                .options(joinedload(ValidationRecord.technician))  # eager load technician
-                .filter(
-                    and_(
-                        ValidationRecord.serial_number == tool.serial_number,
-                        ValidationRecord.validation_date >= start_date,
-                        ValidationRecord.validation_date <= end_date
-                    )
-                )
-                .order_by(ValidationRecord.validation_date.desc())
-                .all()
-            )
-
-            self.table.setRowCount(len(records))
-
-            for row_index, record in enumerate(records):
-                row_data = [
-                    record.validation_date.strftime('%Y-%m-%d'),
-                    tool.tool_type.block_1, record.reading_1, record.validation_status,  # Updated field names
-                    tool.tool_type.block_2, record.reading_2, record.validation_status,
-                    tool.tool_type.block_3, record.reading_3, record.validation_status,
-                    tool.tool_type.tolerance, record.validation_status,  # Assuming validation status is final result
-                    record.technician.name
-                ]
-                
-                for col_index, value in enumerate(row_data):
-                    item = QTableWidgetItem(str(value))
-                    item.setTextAlignment(Qt.AlignCenter)
-
-                    # Apply color for Pass/Fail
-                    if value == 'Pass':
-                        item.setForeground(Qt.green)
-                    elif value == 'Fail':
-                        item.setForeground(Qt.red)
-
-                    self.table.setItem(row_index, col_index, item)
-
-            if not records:
-                QMessageBox.information(self, "No Records", "No validation records for the selected date range.")
-
-            db_gen.close()
-
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Error loading records:\n{str(e)}")
+        self.tool_info_label.setText(f"Tool Serial Number: {serial} | Tool Type: {tool.tool_type.tool_name}")
+        self.model.load(
+            queries.get_tool_history_page, serial, tool.tool_type_id, start_date, end_date,
+            action="ToolValidationRecordsPage.load_history",
+        )
+
+    def on_first_page_loaded(self, count):
+        if not count:
+            QMessageBox.information(self, "No Records", "No validation records for the selected date range.")
+
+    def show_load_error(self, error):
+        QMessageBox.critical(self, "Database Error", f"Error loading records:\n{str(error)}")
 
     def open_dashboard(self):
-        from pages.dashboard import DashboardPage
-        self.page = DashboardPage()
-        self.page.show()
-        self.close()
+        navigate("dashboard")
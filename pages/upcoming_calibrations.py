@@ -0,0 +1,101 @@
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox, QCheckBox,
+    QTableView, QHeaderView, QMessageBox
+)
+from PySide6.QtCore import Qt
+from datetime import date
+from database import queries
+from utils.records_model import PagedRecordsModel
+from utils.workers import get_db_executor
+from utils.router import navigate
+
+
+class UpcomingCalibrationsPage(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Upcoming Calibrations")
+
+        self.layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("Upcoming Calibrations")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 20px; font-weight: bold;")
+        self.layout.addWidget(title)
+
+        # Window: due in the next N days, optionally with tools already overdue
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Due within"))
+        self.days_input = QSpinBox()
+        self.days_input.setRange(1, 366)
+        self.days_input.setValue(30)
+        self.days_input.setSuffix(" days")
+        filter_layout.addWidget(self.days_input)
+        self.overdue_checkbox = QCheckBox("Include overdue")
+        self.overdue_checkbox.setChecked(True)
+        filter_layout.addWidget(self.overdue_checkbox)
+        filter_layout.addStretch()
+        self.load_button = QPushButton("Load")
+        self.load_button.clicked.connect(self.load_tools)
+        filter_layout.addWidget(self.load_button)
+        self.layout.addLayout(filter_layout)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.summary_label)
+
+        # Table: soonest first, paged in as the user scrolls
+        self.model = PagedRecordsModel(
+            ["Serial Number", "Tool Type", "Status", "Last Calibration", "Calibration Due", "Days Left"],
+            bold_columns=[4],
+            parent=self,
+        )
+        self.model.load_failed.connect(self.show_load_error)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.layout.addWidget(self.table)
+
+        # Back to Dashboard Button
+        self.dashboard_button = QPushButton("Back to Dashboard")
+        self.dashboard_button.clicked.connect(self.open_dashboard)
+        self.layout.addWidget(self.dashboard_button)
+
+        self.setLayout(self.layout)
+
+    def on_enter(self):
+        # "Days left" is relative to today, so reload on every visit
+        self.load_tools()
+
+    def load_tools(self):
+        today = date.today()
+        within_days = self.days_input.value()
+        include_overdue = self.overdue_checkbox.isChecked()
+
+        self.model.load(
+            queries.get_upcoming_calibrations_page, today, within_days, include_overdue,
+            action="UpcomingCalibrationsPage.load_tools",
+        )
+        get_db_executor().submit(
+            queries.count_calibration_due, today, within_days,
+            on_result=lambda counts: self.show_summary(within_days, include_overdue, *counts),
+            on_error=self.show_load_error,
+            busy_widgets=[self.load_button],
+            owner=self,
+            action="UpcomingCalibrationsPage.count",
+        )
+
+    def show_summary(self, within_days, include_overdue, due_soon, overdue):
+        text = f"{due_soon} tool(s) due within {within_days} days"
+        if include_overdue:
+            text += f", {overdue} overdue"
+        self.summary_label.setText(text)
+
+    def show_load_error(self, error):
+        QMessageBox.critical(self, "Database Error", f"Error loading tools:\n{str(error)}")
+
+    def open_dashboard(self):
+        navigate("dashboard")
@@ -3,20 +3,31 @@ from PySide6.QtWidgets import (
     QPushButton, QMessageBox, QGridLayout
 )
 from PySide6.QtCore import Qt, QTimer
-from database.db import get_db
-from models.models import ToolRegistration, ValidationRecord
+from database import queries
+from utils.workers import get_db_executor
+from utils.journal_flusher import get_journal_flusher
+from utils.journal_status import JournalStatusLabel
+from utils.serial_completer import SerialCompleter
 from utils.app_context import app_context
+from utils.tolerance import evaluate_one, parse_reading
 from datetime import date
-from dateutil.relativedelta import relativedelta
+from database.calibration import send_by
+import time
+from utils.router import navigate
+
+# A prefetched snapshot older than this is looked up again on Enter
+PREFETCH_MAX_AGE = 30  # seconds
 
 
 class ValidationPage(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Tool Calibration Validation")
-        self.setFixedSize(1000, 600)
 
         self.tool = None
+        self._prefetched = None      # (serial, day, snapshot, fetched_at)
+        self._prefetching = None     # serial of the prefetch in flight
+        self._show_prefetch = False  # Enter was pressed while it was in flight
 
         layout = QVBoxLayout()
         layout.setContentsMargins(50, 30, 50, 30)
@@ -32,12 +43,14 @@ class ValidationPage(QMainWindow):
         self.serial_input = QLineEdit()
         self.serial_input.setPlaceholderText("Enter Tool Serial Number")
 
-        # Timer for delay in search
+        # Timer for delay in search: once typing pauses, suggest serials and
+        # prefetch the tool so Enter can show it without a round trip
         self.search_timer = QTimer(self)
         self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.search_tool)
+        self.search_timer.setInterval(150)
+        self.serial_completer = SerialCompleter(self.serial_input, timer=self.search_timer)
+        self.serial_completer.settled.connect(self.prefetch_tool)
 
-        # Trigger timer when user types
         self.serial_input.returnPressed.connect(self.search_tool)
 
         self.status_display = QLabel("")
@@ -104,6 +117,10 @@ class ValidationPage(QMainWindow):
         self.result_label = QLabel("")
         layout.addWidget(self.result_label)
 
+        # Submissions journaled locally but not yet on the server
+        self.pending_label = JournalStatusLabel()
+        layout.addWidget(self.pending_label)
+
         # Buttons
         button_layout = QHBoxLayout()
         self.check_button = QPushButton("Check Pass/Fail")
@@ -127,13 +144,72 @@ class ValidationPage(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+        self.journal_flusher = get_journal_flusher()
+        self.pending_label.refresh()
+
+    def prefetch_tool(self, serial):
+        if not serial or not self.serial_completer.may_exist(serial):
+            return
+        today = date.today()
+        if self._prefetching == serial or self._fresh_prefetch(serial, today):
+            return
+
+        self._prefetching = serial
+        self._show_prefetch = False
+        get_db_executor().submit(
+            queries.get_tool_snapshot, serial, today,
+            on_result=lambda snapshot: self.on_prefetched(serial, today, snapshot),
+            on_error=lambda e: self.on_prefetch_failed(serial, e),
+            owner=self,
+            action="ValidationPage.prefetch_tool",
+        )
+
+    def on_prefetched(self, serial, today, snapshot):
+        if self._prefetching != serial:
+            return
+        self._prefetching = None
+        self._prefetched = (serial, today, snapshot, time.monotonic())
+        if self._show_prefetch:
+            self.search_tool()
+
+    def on_prefetch_failed(self, serial, error):
+        if self._prefetching != serial:
+            return
+        self._prefetching = None
+        if self._show_prefetch:
+            QMessageBox.critical(self, "Database Error", f"Error looking up tool:\n{str(error)}")
+
+    def _fresh_prefetch(self, serial, today):
+        if self._prefetched is None:
+            return False
+        prefetched_serial, day, _, fetched_at = self._prefetched
+        return prefetched_serial == serial and day == today and time.monotonic() - fetched_at < PREFETCH_MAX_AGE
+
     def search_tool(self):
-        messages = []
-        styles = []
         serial = self.serial_input.text().strip()
-        db = next(get_db())
-        self.tool = db.query(ToolRegistration).filter_by(serial_number=serial).first()
+        today = date.today()
+        self.search_timer.stop()
 
+        if self._fresh_prefetch(serial, today):
+            snapshot = self._prefetched[2]
+            self._prefetched = None  # use once; the tool changes when it is validated
+            self.show_tool_status(today, snapshot)
+            return
+        if self._prefetching == serial:
+            self._show_prefetch = True  # shown as soon as the prefetch lands
+            return
+
+        get_db_executor().submit(
+            queries.get_tool_snapshot, serial, today,
+            on_result=lambda snapshot: self.show_tool_status(today, snapshot),
+            on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Error looking up tool:\n{str(e)}"),
+            busy_cursor=True,  # the technician pressed Enter and is waiting
+            owner=self,
+            action="ValidationPage.search_tool",
+        )
+
+    def show_tool_status(self, today, snapshot):
+        self.tool = snapshot
         self.submit_button.setEnabled(True)  # enable by default
         if not self.tool:
             self.status_display.setText("Tool not found.")
@@ -141,16 +217,16 @@ class ValidationPage(QMainWindow):
             self.clear_fields()
             return
 
-        today = date.today()
-        validation_today = (
-            db.query(ValidationRecord)
-            .filter_by(serial_number=serial, validation_date=today)
-            .first()
+        # Validations still in the local journal count as done today
+        pending_status = self.journal_flusher.journal.latest_pending_status(self.tool.serial_number, today)
+        validated_today = self.tool.validated_today or pending_status is not None
+        latest_today_status = pending_status or (
+            self.tool.latest_validation_status if self.tool.latest_validation_date == today else None
         )
 
         # Start collecting status messages
         status_messages = []
-        six_months_later = self.tool.last_calibration + relativedelta(months=6)
+        six_months_later = self.tool.calibration_due
         # First check tool condition
         if self.tool.tool_status == "Retired":
             status_messages.append("❌ This tool is retired.")
@@ -158,17 +234,9 @@ class ValidationPage(QMainWindow):
         elif self.tool.tool_status == "Sent for Calibration":
             status_messages.append("🔧 This tool is under calibration.")
             self.submit_button.setEnabled(False)
-        elif validation_today:
-            # Get the most recent validation record (latest date)
-            latest_record = (
-                db.query(ValidationRecord)
-                .filter_by(serial_number=serial)
-                .order_by(ValidationRecord.validation_date.desc())
-                .first()
-            )
-
-            if latest_record and latest_record.validation_date == today:
-                if validation_today.validation_status == "Fail":
+        elif validated_today:
+            if latest_today_status is not None:
+                if latest_today_status == "Fail":
                     status_messages.append("⚠️ This tool failed validation today.")
                     # allow revalidation only if this is the latest record
                     self.submit_button.setEnabled(True)
@@ -179,7 +247,7 @@ class ValidationPage(QMainWindow):
                 status_messages.append("✅ This tool has been validated today.")
                 self.submit_button.setEnabled(False)
 
-        elif today > six_months_later:
+        elif six_months_later and today > six_months_later:
                 status_messages.append(
                     f"⛔ This tool is overdue for calibration. Tool was last calibrated on {self.tool.last_calibration.strftime('%Y-%m-%d')}."
                 )
@@ -189,7 +257,7 @@ class ValidationPage(QMainWindow):
 
         # Now check calibration deadline
         if self.tool.last_calibration and self.tool.tool_status not in ["Retired", "Sent for Calibration"]:
-            five_months_later = self.tool.last_calibration + relativedelta(months=5)
+            five_months_later = send_by(self.tool.last_calibration)
             
             if today > five_months_later:
                 status_messages.append(
@@ -227,44 +295,24 @@ class ValidationPage(QMainWindow):
             return
 
         try:
-            readings = [float(r.text()) if r.text() else None for r in self.reading_inputs]
+            readings = [parse_reading(r.text()) if r.text() else None for r in self.reading_inputs]
         except ValueError:
             QMessageBox.warning(self, "Error", "Please enter valid numeric readings.")
             return
 
         tool_type = self.tool.tool_type
         blocks = [tool_type.block_1, tool_type.block_2, tool_type.block_3]
-        tol = tool_type.tolerance
+        results, final = evaluate_one(readings, blocks, tool_type.tolerance)
 
-        results = []
-        for i in range(3):
-            block = blocks[i]
-            if block is None:
-                self.reading_result_labels[i].setText("N/A")
-                self.reading_result_labels[i].setStyleSheet("color: gray; font-weight: bold;")
-                continue
-
-            low = block - tol
-            high = block + tol
-            reading = readings[i]
-            if reading is None:
-                self.reading_result_labels[i].setText("N/A")
-                self.reading_result_labels[i].setStyleSheet("color: gray; font-weight: bold;")
-                continue
-
-            if low <= reading <= high:
-                results.append("Pass")
-                self.reading_result_labels[i].setText("Pass")
-                self.reading_result_labels[i].setStyleSheet("color: green; font-weight: bold;")
-            else:
-                results.append("Fail")
-                self.reading_result_labels[i].setText("Fail")
-                self.reading_result_labels[i].setStyleSheet("color: red; font-weight: bold;")
+        colors = {"Pass": "green", "Fail": "red", None: "gray"}
+        for i, result in enumerate(results):
+            self.reading_result_labels[i].setText(result or "N/A")
+            self.reading_result_labels[i].setStyleSheet(f"color: {colors[result]}; font-weight: bold;")
 
-        final = "Pass" if all(r == "Pass" for r in results) else "Fail"
         color = "green" if final == "Pass" else "red"
         self.result_label.setText(f"Result: {final}")
         self.result_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        return final
 
     def submit_validation(self):
         if not self.tool:
@@ -285,42 +333,52 @@ class ValidationPage(QMainWindow):
                     if not val:
                         QMessageBox.warning(self, "Error", f"Reading for Block {i+1} is required.")
                         return
-                    readings.append(float(val))
+                    readings.append(parse_reading(val))
         except ValueError:
             QMessageBox.warning(self, "Error", "Invalid numeric readings.")
             return
 
-        self.check_pass_fail()
-        status_text = self.result_label.text()
-        if not status_text.startswith("Result:"):
+        final_status = self.check_pass_fail()
+        if final_status is None:
             QMessageBox.warning(self, "Error", "Please check pass/fail before submitting.")
             return
 
-        final_status = "Pass" if "Pass" in status_text and "Fail" not in status_text else "Fail"
-
         technician = app_context.get_logged_in_user()
         if not technician:
             QMessageBox.warning(self, "Error", "No technician logged in.")
             return
 
-        db = next(get_db())
-        record = ValidationRecord(
-            serial_number=self.tool.serial_number,
-            validation_date=date.today(),
-            technician_id=technician.technician_id,
-            reading_1=readings[0],
-            reading_2=readings[1],
-            reading_3=readings[2],
-            validation_status=final_status,
-        )
-        db.add(record)
-        db.commit()
-        QMessageBox.information(self, "Success", "Validation record submitted.")
+        # Journaled locally and uploaded in the background, so a slow server never blocks the next scan
+        try:
+            self.journal_flusher.submit([{
+                "serial_number": self.tool.serial_number,
+                "validation_date": date.today(),
+                "technician_id": technician.technician_id,
+                "reading_1": readings[0],
+                "reading_2": readings[1],
+                "reading_3": readings[2],
+                "validation_status": final_status,
+            }])
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save validation locally:\n{str(e)}")
+            return
+
+        serial = self.tool.serial_number
+        self.clear_fields()
+        self.status_display.setText(f"✅ Validation for {serial} saved ({final_status}).")
+        self.status_display.setStyleSheet("color: white;")
+        self.serial_input.setFocus()
+
+    def on_enter(self):
+        # Start each visit with an empty form, ready to scan
         self.clear_fields()
+        self.serial_input.setFocus()
 
     def clear_fields(self):
         self.serial_input.clear()
         self.tool = None
+        self._prefetched = None
+        self._show_prefetch = False
         self.result_label.clear()
         self.status_display.clear()
         for i in range(3):
@@ -330,7 +388,4 @@ class ValidationPage(QMainWindow):
             self.tolerance_labels[i].clear()
 
     def open_dashboard(self):
-        self.close()
-        from pages.dashboard import DashboardPage
-        self.dashboard = DashboardPage()
-        self.dashboard.show()
+        navigate("dashboard")
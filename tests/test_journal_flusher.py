@@ -0,0 +1,36 @@
+import threading
+from datetime import date
+from PySide6.QtCore import Qt
+from database import db as database_db
+from database.journal import SubmissionJournal
+from utils.journal_flusher import JournalFlusher
+
+
+def test_failing_upload_emits_upload_failed(tmp_path, monkeypatch):
+    # A server database without the schema: every upload attempt fails
+    monkeypatch.setenv("QC_DB_URL", f"sqlite:///{tmp_path / 'server.db'}")
+    monkeypatch.setattr(database_db, "_engine", None)
+
+    journal = SubmissionJournal(str(tmp_path / "journal.db"))
+    journal.append([{
+        "serial_number": "SN1", "validation_date": date.today(), "technician_id": 1,
+        "reading_1": 1.0, "reading_2": None, "reading_3": None, "validation_status": "Pass",
+    }])
+    flusher = JournalFlusher(journal, max_backoff=1)
+    messages = []
+    failed = threading.Event()
+
+    def on_failed(message):
+        messages.append(message)
+        failed.set()
+
+    # Emitted on the flusher thread; no event loop runs here to queue it
+    flusher.upload_failed.connect(on_failed, Qt.DirectConnection)
+    flusher.start()
+    try:
+        assert failed.wait(10), "upload_failed was not emitted"
+        assert messages[0]
+    finally:
+        flusher.stop()
+    assert journal.counts()[0] == 1  # still journaled for the next attempt
+    journal.close()
@@ -0,0 +1,21 @@
+from database.reading_ingest import read_readings
+
+
+def test_header_after_leading_blank_lines(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("\n\nSerial,R2,R1\nSN1,2.5,1.5\n\nSN2,,3.0\n", encoding="utf-8")
+
+    assert list(read_readings(str(path))) == [
+        (4, "SN1", [1.5, 2.5, None]),
+        (6, "SN2", [3.0, None, None]),
+    ]
+
+
+def test_without_header_every_row_is_data(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("\nSN1,1.5,2.5\nSN2,nan\n", encoding="utf-8")
+
+    assert list(read_readings(str(path))) == [
+        (2, "SN1", [1.5, 2.5, None]),
+        (3, "SN2", "reading is not a number"),
+    ]
@@ -0,0 +1,51 @@
+import math
+import numpy as np
+import pytest
+from utils.tolerance import FAIL, NA, PASS, evaluate, evaluate_one, parse_reading
+
+BLOCKS = [10.0, 20.0, None]
+TOLERANCE = 0.5
+
+
+def test_readings_within_tolerance_pass():
+    results, final = evaluate_one([10.2, 19.5, None], BLOCKS, TOLERANCE)
+    assert results == ["Pass", "Pass", None]
+    assert final == "Pass"
+
+
+def test_reading_outside_tolerance_fails():
+    results, final = evaluate_one([10.6, 20.0, None], BLOCKS, TOLERANCE)
+    assert results == ["Fail", "Pass", None]
+    assert final == "Fail"
+
+
+def test_missing_reading_is_not_applicable():
+    results, final = evaluate_one([10.0, None, None], BLOCKS, TOLERANCE)
+    assert results == ["Pass", None, None]
+    assert final == "Pass"
+
+
+@pytest.mark.parametrize("bad", [math.nan, math.inf, -math.inf])
+def test_non_finite_reading_never_passes(bad):
+    results, final = evaluate_one([bad, 20.0, None], BLOCKS, TOLERANCE)
+    assert results[0] == "Fail"
+    assert final == "Fail"
+
+
+@pytest.mark.parametrize("bad", [math.nan, math.inf])
+def test_non_finite_reading_never_passes_vectorized(bad):
+    readings = np.array([[bad, 20.0, np.nan], [10.0, 20.0, np.nan]])
+    blocks = np.array([[10.0, 20.0, np.nan], [10.0, 20.0, np.nan]])
+    evaluation = evaluate(readings, blocks, [TOLERANCE, TOLERANCE])
+    assert evaluation.block_results.tolist() == [[FAIL, PASS, NA], [PASS, PASS, NA]]
+    assert evaluation.passed.tolist() == [False, True]
+
+
+@pytest.mark.parametrize("text", ["nan", "NaN", "inf", "-inf", "Infinity", "abc"])
+def test_parse_reading_rejects_non_finite_text(text):
+    with pytest.raises(ValueError):
+        parse_reading(text)
+
+
+def test_parse_reading_accepts_numbers():
+    assert parse_reading(" 10.25 ") == 10.25
@@ -0,0 +1,27 @@
+"""Application log, written to logs/app.log under app_dir().
+
+A windowed (PyInstaller) build has no console, so errors that are not
+shown to the user, such as background jobs with no error handler, are
+logged here instead of printed.
+"""
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+from database.config import app_dir
+
+
+def setup_logging(path=None):
+    """Route the "qc" loggers to a rotating file; call once at startup."""
+    logger = logging.getLogger("qc")
+    if logger.handlers:
+        return logger
+    path = path or os.path.join(app_dir(), "logs", "app.log")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=1_000_000, backupCount=5, encoding="utf-8")
+    except OSError:
+        handler = logging.StreamHandler()  # read-only install folder: better than nothing
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    return logger
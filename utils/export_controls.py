@@ -0,0 +1,95 @@
+import os
+import threading
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QProgressBar, QFileDialog, QMessageBox
+from database import export
+from utils.workers import get_db_executor
+
+CSV_FILTER = "CSV files (*.csv)"
+PARQUET_FILTER = "Parquet files (*.parquet)"
+
+
+class ExportControls(QWidget):
+    """Export button, progress bar and cancel button for a records page.
+
+    query_factory() returns (query, suggested file name) for what the page
+    currently shows, or None after telling the user what is missing. The
+    export runs as a DbExecutor job streaming rows to disk, so the page
+    stays responsive whatever the size.
+    """
+
+    def __init__(self, query_factory, action, parent=None):
+        super().__init__(parent)
+        self.query_factory = query_factory
+        self.action = action
+        self._cancel = None
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.export_button = QPushButton("Export…")
+        self.export_button.clicked.connect(self.start_export)
+        layout.addWidget(self.export_button)
+
+        self.progress = QProgressBar()
+        self.progress.setVisible(False)
+        layout.addWidget(self.progress)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_export)
+        layout.addWidget(self.cancel_button)
+
+    def start_export(self):
+        request = self.query_factory()
+        if request is None:
+            return
+        query, file_name = request
+
+        filters = CSV_FILTER + (";;" + PARQUET_FILTER if export.parquet_available() else "")
+        path, selected_filter = QFileDialog.getSaveFileName(self, "Export Records", file_name + ".csv", filters)
+        if not path:
+            return
+        fmt = "parquet" if selected_filter == PARQUET_FILTER else "csv"
+        if os.path.splitext(path)[1].lower() != "." + fmt:
+            path += "." + fmt
+
+        self._cancel = threading.Event()
+        self.progress.setRange(0, 0)  # busy until the row count is known
+        self.progress.setVisible(True)
+        self.cancel_button.setVisible(True)
+        self.cancel_button.setEnabled(True)
+        get_db_executor().submit(
+            export.export_records, query, path, fmt,
+            cancelled=self._cancel.is_set,
+            on_progress=self.show_progress,
+            on_result=self.on_exported,
+            on_error=self.on_export_failed,
+            busy_widgets=[self.export_button],
+            owner=self,
+            action=self.action,
+        )
+
+    def show_progress(self, done, total):
+        self.progress.setRange(0, max(total, 1))
+        self.progress.setValue(done)
+
+    def cancel_export(self):
+        if self._cancel:
+            self._cancel.set()
+            self.cancel_button.setEnabled(False)
+
+    def _finish(self):
+        self.progress.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self._cancel = None
+
+    def on_exported(self, result):
+        self._finish()
+        if result.cancelled:
+            QMessageBox.information(self, "Export Cancelled", "The export was cancelled; no file was written.")
+        else:
+            QMessageBox.information(self, "Export Complete", f"Exported {result.rows} record(s) to\n{result.path}")
+
+    def on_export_failed(self, error):
+        self._finish()
+        QMessageBox.critical(self, "Export Failed", f"Error exporting records:\n{str(error)}")
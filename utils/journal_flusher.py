@@ -0,0 +1,105 @@
+import os
+import threading
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication
+from database import queries
+from database.config import app_dir, load_database_settings
+from database.db import session_scope
+from database.instrumentation import action_tag
+from database.journal import SubmissionJournal
+
+
+class JournalFlusher(QObject):
+    """Uploads journaled validations to the server on a background thread.
+
+    submit() only writes the local journal and wakes the flusher, so it
+    returns in milliseconds whatever the server is doing. The flusher
+    uploads in batches; when the server is slow or unreachable it backs
+    off (1 s doubling up to max_backoff) and retries, and it also sweeps
+    the journal every idle_poll seconds to pick up records left over from
+    an earlier run. counts_changed(waiting, rejected) is delivered on the
+    GUI thread whenever the journal changes; flushed(count) after each batch
+    is committed on the server; upload_failed(message) when an upload
+    attempt fails and will be retried.
+    """
+
+    counts_changed = Signal(int, int)
+    flushed = Signal(int)
+    upload_failed = Signal(str)
+
+    def __init__(self, journal, batch_size=200, max_backoff=60, idle_poll=30, parent=None):
+        super().__init__(parent)
+        self.journal = journal
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self.idle_poll = idle_poll
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="journal-flusher", daemon=True)
+
+    def start(self):
+        self._wake.set()  # upload anything left over from an earlier run straight away
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def submit(self, records):
+        """Journal records durably and schedule their upload; returns their submission_ids."""
+        submission_ids = self.journal.append(records)
+        self._emit_counts()
+        self._wake.set()
+        return submission_ids
+
+    def counts(self):
+        return self.journal.counts()
+
+    def _emit_counts(self):
+        self.counts_changed.emit(*self.journal.counts())
+
+    def _run(self):
+        delay = 0
+        while not self._stop.is_set():
+            self._wake.wait(delay or self.idle_poll)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._flush()
+                delay = 0
+            except Exception as e:
+                # Server slow or unreachable: keep everything journaled and retry later
+                delay = min(max(1, delay * 2), self.max_backoff)
+                self.upload_failed.emit(str(e))
+            self._emit_counts()
+
+    def _flush(self):
+        while not self._stop.is_set():
+            records = self.journal.pending(self.batch_size)
+            if not records:
+                return
+            with action_tag("JournalFlusher.flush"), session_scope() as db:
+                errors = queries.add_journaled_records(db, records)
+            # Only after the commit: a crash before this point re-sends, and the server skips duplicates
+            self.journal.remove([r["submission_id"] for r in records if r["submission_id"] not in errors])
+            if errors:
+                self.journal.reject(errors)
+            self._emit_counts()
+            if len(records) > len(errors):
+                self.flushed.emit(len(records) - len(errors))
+
+
+_flusher = None
+
+
+def get_journal_flusher():
+    """Process-wide flusher, started on first use (needs a running QApplication)."""
+    global _flusher
+    if _flusher is None:
+        path = load_database_settings().journal_path or os.path.join(app_dir(), "pending_validations.db")
+        _flusher = JournalFlusher(SubmissionJournal(path))
+        _flusher.start()
+        QApplication.instance().aboutToQuit.connect(_flusher.stop)
+    return _flusher
@@ -0,0 +1,44 @@
+from PySide6.QtWidgets import QLabel
+from utils.journal_flusher import get_journal_flusher
+
+
+class JournalStatusLabel(QLabel):
+    """Validations journaled on this station but not yet on the server.
+
+    Shows how many are waiting to upload (and why the last upload failed,
+    until one succeeds) and how many the server rejected; hidden while the
+    journal is empty. Call refresh() once the label is in its page's layout.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWordWrap(True)
+        self.setVisible(False)
+        self.upload_error = ""  # why the last upload attempt failed, until one succeeds
+        self.journal_flusher = get_journal_flusher()
+        self.journal_flusher.counts_changed.connect(self.show_pending_count)
+        self.journal_flusher.upload_failed.connect(self.show_upload_error)
+        self.journal_flusher.flushed.connect(self.clear_upload_error)
+
+    def refresh(self):
+        self.show_pending_count(*self.journal_flusher.counts())
+
+    def show_upload_error(self, message):
+        self.upload_error = message.splitlines()[0] if message else "unknown error"
+        self.refresh()
+
+    def clear_upload_error(self, count):
+        self.upload_error = ""
+        self.refresh()
+
+    def show_pending_count(self, waiting, rejected):
+        messages = []
+        if waiting:
+            messages.append(f"⏳ {waiting} validation(s) waiting to upload")
+            if self.upload_error:
+                messages.append(f"upload failing, will retry: {self.upload_error}")
+        if rejected:
+            messages.append(f"❌ {rejected} validation(s) rejected by the server")
+        self.setText("   ".join(messages))
+        self.setStyleSheet("color: red;" if rejected else "color: orange;")
+        self.setVisible(bool(messages))
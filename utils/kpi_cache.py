@@ -0,0 +1,100 @@
+import time
+from datetime import date, datetime
+from functools import partial
+from typing import NamedTuple
+from database import queries
+from utils.workers import get_db_executor
+
+
+class Kpis(NamedTuple):
+    validated_today: int
+    failed_today: int
+    due_soon: int
+    overdue: int
+    under_calibration: int
+
+
+class KpiCache:
+    """Dashboard KPIs, loaded in the background and shared by every dashboard.
+
+    A load issues the aggregate queries as separate DbExecutor jobs so they
+    run in parallel; the result is kept for max_age seconds, so going back
+    to the dashboard many times per shift only queries once per interval.
+    Requests made while a load is running wait for that load. Everything
+    here runs on the GUI thread (the executor delivers results there).
+    """
+
+    def __init__(self, max_age=120, due_within_days=30):
+        self.max_age = max_age
+        self.due_within_days = due_within_days
+        self._kpis = None
+        self._loaded_at = 0.0
+        self.updated = None  # wall-clock time of the last load, for display
+        self._waiters = []
+        self._parts = {}
+        self._failed = False
+        self._generation = 0  # results of an abandoned (failed) load are ignored
+
+    def cached(self):
+        """The KPIs if loaded and fresh, else None (never touches the database)."""
+        if self._kpis is not None and time.monotonic() - self._loaded_at < self.max_age:
+            return self._kpis
+        return None
+
+    def load(self, on_result, on_error=None, force=False):
+        """Call on_result(Kpis) with fresh values, querying only if the cache is stale (or force)."""
+        kpis = None if force else self.cached()
+        if kpis is not None:
+            on_result(kpis)
+            return
+        self._waiters.append((on_result, on_error))
+        if len(self._waiters) > 1:
+            return  # already loading
+
+        today = date.today()
+        jobs = {
+            "validations": (queries.count_validations_today, today),
+            "due": (queries.count_calibration_due, today, self.due_within_days),
+            "calibration": (queries.count_under_calibration,),
+        }
+        self._generation += 1
+        self._parts = {}
+        self._failed = False
+        executor = get_db_executor()
+        for name, (fn, *args) in jobs.items():
+            executor.submit(fn, *args,
+                            on_result=partial(self._on_part, self._generation, name, len(jobs)),
+                            on_error=partial(self._on_part_failed, self._generation),
+                            action=f"DashboardPage.{fn.__name__}")
+
+    def _on_part(self, generation, name, expected, value):
+        if generation != self._generation:
+            return
+        self._parts[name] = value
+        if len(self._parts) == expected and not self._failed:
+            validated, failed = self._parts["validations"]
+            due_soon, overdue = self._parts["due"]
+            self._kpis = Kpis(validated, failed, due_soon, overdue, self._parts["calibration"])
+            self._loaded_at = time.monotonic()
+            self.updated = datetime.now()
+            for on_result, _ in self._take_waiters():
+                on_result(self._kpis)
+
+    def _on_part_failed(self, generation, error):
+        # Report the first failure only; the other jobs' results are dropped
+        if generation != self._generation or self._failed:
+            return
+        self._failed = True
+        for _, on_error in self._take_waiters():
+            if on_error:
+                on_error(error)
+
+    def _take_waiters(self):
+        waiters, self._waiters = self._waiters, []
+        return waiters
+
+    def invalidate(self):
+        self._kpis = None
+
+
+kpi_cache = KpiCache()
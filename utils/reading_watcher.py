@@ -0,0 +1,201 @@
+import csv
+import os
+import shutil
+import time
+from collections import deque
+from datetime import date, datetime
+from typing import NamedTuple
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from database import reading_ingest
+from database.config import load_database_settings
+from utils.app_context import app_context
+from utils.journal_flusher import get_journal_flusher
+from utils.workers import get_db_executor
+
+PROCESSED_DIR = "processed"
+REJECTED_DIR = "rejected"
+
+
+class IngestLogEntry(NamedTuple):
+    time: datetime
+    file_name: str
+    saved: int
+    rejected: int
+    message: str
+
+
+class ReadingFolderWatcher(QObject):
+    """Turns instrument export files dropped into a folder into validations.
+
+    New files are noticed through QFileSystemWatcher, with a periodic scan
+    as a fallback for network shares that do not report changes. A file is
+    only picked up once its size and modification time have stayed the
+    same for one scan, so half-written exports are left alone. Each file is
+    parsed and judged as a DbExecutor job (database/reading_ingest.py); the
+    file is moved to processed/ and the accepted records then go into the
+    submission journal, which uploads them in the background. Rejected
+    lines are written to rejected/<file>.rejected.csv. If the server
+    cannot be reached the file stays where it is and is retried.
+    """
+
+    file_ingested = Signal(object)  # IngestLogEntry
+    running_changed = Signal(bool)
+
+    def __init__(self, folder, poll_ms=5000, parent=None):
+        super().__init__(parent)
+        self.folder = folder
+        self.log = deque(maxlen=200)
+        self._sizes = {}        # file -> (size, mtime) at the previous scan
+        self._in_flight = set()
+        self._fs_watcher = None
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.setInterval(500)  # coalesce bursts of change notifications
+        self._scan_timer.timeout.connect(self.scan)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_ms)
+        self._poll_timer.timeout.connect(self.scan)
+
+    def is_running(self):
+        return self._poll_timer.isActive()
+
+    def start(self):
+        if self.is_running():
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        self._fs_watcher = QFileSystemWatcher([self.folder], self)
+        self._fs_watcher.directoryChanged.connect(lambda _: self._scan_timer.start())
+        self._poll_timer.start()
+        self.running_changed.emit(True)
+        self.scan()
+
+    def stop(self):
+        self._poll_timer.stop()
+        self._scan_timer.stop()
+        if self._fs_watcher is not None:
+            self._fs_watcher.deleteLater()
+            self._fs_watcher = None
+        self.running_changed.emit(False)
+
+    def scan(self):
+        try:
+            names = [
+                name for name in os.listdir(self.folder)
+                if name.lower().endswith(reading_ingest.FILE_EXTENSIONS)
+                and os.path.isfile(os.path.join(self.folder, name))
+            ]
+        except OSError as e:
+            self._record("", 0, 0, f"Cannot read folder: {e}")
+            return
+
+        sizes = {}
+        unsettled = False
+        for name in names:
+            path = os.path.join(self.folder, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # moved away meanwhile
+            sizes[path] = (stat.st_size, stat.st_mtime)
+            if path in self._in_flight:
+                continue
+            if self._sizes.get(path) != sizes[path]:
+                unsettled = True  # new or still being written: look again shortly
+                continue
+            self._ingest(path)
+        self._sizes = sizes
+        if unsettled:
+            self._scan_timer.start()
+
+    def _ingest(self, path):
+        technician = app_context.get_logged_in_user()
+        if technician is None:
+            return  # readings are attributed to the logged-in technician
+        self._in_flight.add(path)
+        flusher = get_journal_flusher()
+        get_db_executor().submit(
+            reading_ingest.ingest_file, path, technician.technician_id, date.today(),
+            flusher.journal.latest_pending_status,
+            on_result=lambda result: self._on_ingested(path, result),
+            on_error=lambda e: self._on_failed(path, e),
+            owner=self,
+            action="ReadingFolderWatcher.ingest",
+        )
+
+    def _on_ingested(self, path, result):
+        name = os.path.basename(path)
+        try:
+            self._finish_file(path, name, result)
+        finally:
+            self._in_flight.discard(path)
+            self._sizes.pop(path, None)
+
+    def _finish_file(self, path, name, result):
+        # Move the file out first: if the instrument software still has it locked,
+        # nothing has been queued yet and the file is simply read again later
+        try:
+            processed = shutil.move(path, self._target(PROCESSED_DIR, name))
+        except OSError as e:
+            self._record(name, 0, 0, f"Will retry, cannot move the file: {e}")
+            return
+        try:
+            if result.records:
+                get_journal_flusher().submit(result.records)
+        except Exception as e:
+            # Nothing was queued; put the file back so it is read again
+            try:
+                shutil.move(processed, path)
+            except OSError:
+                pass
+            self._record(name, 0, 0, f"Failed: {e}")
+            return
+
+        saved, rejected = len(result.records), len(result.rejected)
+        if result.rejected:
+            try:
+                reading_ingest.write_rejected(self._target(REJECTED_DIR, name + ".rejected.csv"), result.rejected)
+            except OSError as e:
+                self._record(name, saved, rejected, f"Could not write the rejected lines: {e}")
+                return
+        self._record(name, saved, rejected, "")
+
+    def _on_failed(self, path, error):
+        self._in_flight.discard(path)
+        name = os.path.basename(path)
+        if isinstance(error, (ValueError, csv.Error)):
+            # Not an instrument file we can read: set it aside instead of retrying forever
+            try:
+                shutil.move(path, self._target(REJECTED_DIR, name))
+            except OSError:
+                pass
+            self._record(name, 0, 0, f"Unreadable, moved to {REJECTED_DIR}: {error}")
+        else:
+            self._record(name, 0, 0, f"Will retry: {error}")
+
+    def _target(self, subfolder, name):
+        folder = os.path.join(self.folder, subfolder)
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, name)
+        if os.path.exists(target):
+            stem, ext = os.path.splitext(name)
+            target = os.path.join(folder, f"{stem}_{time.strftime('%Y%m%d-%H%M%S')}{ext}")
+        return target
+
+    def _record(self, name, saved, rejected, message):
+        entry = IngestLogEntry(datetime.now(), name, saved, rejected, message)
+        self.log.appendleft(entry)
+        self.file_ingested.emit(entry)
+
+
+_watcher = None
+
+
+def get_reading_watcher():
+    """Process-wide watcher of the configured ingest folder (needs a running QApplication), or None."""
+    global _watcher
+    if _watcher is None:
+        settings = load_database_settings()
+        if not settings.ingest_folder:
+            return None
+        _watcher = ReadingFolderWatcher(settings.ingest_folder, poll_ms=settings.ingest_poll_seconds * 1000)
+    return _watcher
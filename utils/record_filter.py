@@ -0,0 +1,106 @@
+from PySide6.QtCore import QSortFilterProxyModel, QModelIndex, QTimer
+
+# Joins a row's cells in the search index so a match cannot span two columns
+_CELL_SEPARATOR = "\x1f"
+
+
+class RecordFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive "any column contains" filter backed by a precomputed index.
+
+    Each source row's cells are lowercased and joined once, when the row
+    arrives, so a search is a single substring test per row instead of
+    rendering and lowercasing every cell on every keystroke. Narrowing a
+    search (typing more characters) only re-tests rows that matched the
+    previous text. search() is debounced so a burst of keystrokes costs
+    one filter pass.
+
+    The source may be a lazily paged model (PagedRecordsModel) holding only
+    the rows scrolled to so far. While a search is active the proxy keeps
+    calling fetchMore() until the source has no more pages, so matches
+    beyond the loaded rows are found too.
+    """
+
+    def __init__(self, parent=None, debounce_ms=200):
+        super().__init__(parent)
+        self._index = []          # lowercase row text, by source row
+        self._needle = ""
+        self._matches = None      # source rows matching _needle, None = all rows
+        self._pending_text = ""
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._apply_pending)
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            old.rowsInserted.disconnect(self._on_rows_inserted)
+            old.modelReset.disconnect(self._rebuild_index)
+        # Connected before the proxy's own handlers so the index is updated
+        # before the proxy filters newly inserted rows
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.modelReset.connect(self._rebuild_index)
+        super().setSourceModel(model)
+        self._rebuild_index()
+
+    # Search index
+    def _row_text(self, row):
+        model = self.sourceModel()
+        if hasattr(model, "row"):
+            # PagedRecordsModel: read the row tuple directly instead of going through data()
+            values = model.row(row)
+        else:
+            values = [model.index(row, col).data() for col in range(model.columnCount())]
+        return _CELL_SEPARATOR.join(str(value) for value in values).lower()
+
+    def _rebuild_index(self):
+        model = self.sourceModel()
+        self._index = [self._row_text(row) for row in range(model.rowCount())]
+        self._matches = None if not self._needle else self._scan(range(len(self._index)), self._needle)
+
+    def _on_rows_inserted(self, parent, first, last):
+        # Runs before the proxy maps the new rows, so they are filtered correctly
+        new_rows = range(first, last + 1)
+        self._index[first:first] = [self._row_text(row) for row in new_rows]
+        if self._matches is not None:
+            self._matches.update(self._scan(new_rows, self._needle))
+            # The page has landed; ask for the next one once the insert is done
+            QTimer.singleShot(0, self._fetch_rest)
+
+    def _fetch_rest(self):
+        """While searching, page in the rest of the source so unloaded rows can match."""
+        model = self.sourceModel()
+        if self._needle and model is not None and model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+
+    def _scan(self, rows, needle):
+        index = self._index
+        return {row for row in rows if needle in index[row]}
+
+    # Filtering
+    def search(self, text):
+        """Debounced: apply text after the user pauses typing."""
+        self._pending_text = text
+        self._timer.start()
+
+    def search_now(self, text):
+        self._timer.stop()
+        self._pending_text = text
+        self._apply_pending()
+
+    def _apply_pending(self):
+        needle = self._pending_text.strip().lower()
+        if needle == self._needle:
+            return
+        if not needle:
+            self._matches = None
+        elif self._matches is not None and needle.startswith(self._needle):
+            self._matches = self._scan(self._matches, needle)  # narrowing: only previous matches can match
+        else:
+            self._matches = self._scan(range(len(self._index)), needle)
+        self._needle = needle
+        self.invalidateRowsFilter()
+        self._fetch_rest()
+
+    def filterAcceptsRow(self, source_row, source_parent=QModelIndex()):
+        return self._matches is None or source_row in self._matches
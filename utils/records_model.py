@@ -0,0 +1,145 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QBrush, QFont
+from utils.workers import get_db_executor
+
+# Shared across every cell and every model instance instead of one per item
+_brushes = {}
+_fonts = {}
+
+
+def status_brush(value):
+    if value not in _brushes:
+        _brushes[value] = QBrush(Qt.green if value == "Pass" else Qt.red)
+    return _brushes[value]
+
+
+def bold_font():
+    if "bold" not in _fonts:
+        font = QFont()
+        font.setBold(True)
+        _fonts["bold"] = font
+    return _fonts["bold"]
+
+
+class PagedRecordsModel(QAbstractTableModel):
+    """Read-only table model that pages rows in from the database on demand.
+
+    load(page_query, *args) resets the model and fetches the first page.
+    page_query(db, *args, after_key, limit) must return a list of
+    (key, row_tuple) pairs ordered by key; the last key of each page is
+    passed back as after_key for the next one (keyset pagination). Pages
+    are fetched on the DbExecutor whenever the view scrolls near the end,
+    so only rows the user has actually scrolled to are ever held.
+    """
+
+    first_page_loaded = Signal(int)
+    load_failed = Signal(object)
+
+    def __init__(self, headers, status_columns=(), bold_columns=(), page_size=200, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.status_columns = set(status_columns)
+        self.bold_columns = set(bold_columns)
+        self.page_size = page_size
+        self.action = "PagedRecordsModel.fetch"
+        self._rows = []
+        self._query = None
+        self._last_key = None
+        self._exhausted = True
+        self._loading = False
+        self._generation = 0
+
+    # Loading
+    def load(self, page_query, *args, action=None):
+        self.beginResetModel()
+        self._rows = []
+        self._query = (page_query, args)
+        self._last_key = None
+        self._exhausted = False
+        self._loading = False
+        self._generation += 1  # drop pages still in flight for the previous query
+        self.endResetModel()
+        if action:
+            self.action = action
+        self._fetch_page()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._query = None
+        self._exhausted = True
+        self._generation += 1
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._fetch_page()
+
+    def _fetch_page(self):
+        page_query, args = self._query
+        generation = self._generation
+        is_first = self._last_key is None
+        self._loading = True
+        get_db_executor().submit(
+            page_query, *args,
+            after_key=self._last_key, limit=self.page_size,
+            on_result=lambda page: self._append_page(generation, is_first, page),
+            on_error=lambda e: self._on_error(generation, e),
+            owner=self,
+            action=self.action,
+        )
+
+    def _append_page(self, generation, is_first, page):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._exhausted = len(page) < self.page_size
+        if page:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(row for _, row in page)
+            self.endInsertRows()
+            self._last_key = page[-1][0]
+        if is_first:
+            self.first_page_loaded.emit(len(page))
+
+    def _on_error(self, generation, error):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._exhausted = True
+        self.load_failed.emit(error)
+
+    # Model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def row(self, row):
+        return self._rows[row]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return str(self._rows[index.row()][column])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole and column in self.status_columns:
+            value = self._rows[index.row()][column]
+            if value in ("Pass", "Fail"):
+                return status_brush(value)
+        if role == Qt.FontRole and column in self.bold_columns:
+            return bold_font()
+        return None
@@ -0,0 +1,117 @@
+import importlib
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QMainWindow, QStackedWidget
+from utils.workers import get_db_executor
+
+# Page name -> (module, class). Modules are imported on first visit only.
+PAGES = {
+    "login": ("pages.login", "LoginPage"),
+    "register": ("pages.register", "RegisterPage"),
+    "dashboard": ("pages.dashboard", "DashboardPage"),
+    "tool_management": ("pages.tool_management", "ToolManagementPage"),
+    "validation": ("pages.validation", "ValidationPage"),
+    "batch_validation": ("pages.batch_validation", "BatchValidationPage"),
+    "instrument_readings": ("pages.instrument_readings", "InstrumentReadingsPage"),
+    "tool_validation_records": ("pages.tool_validation_records", "ToolValidationRecordsPage"),
+    "daily_calibration_records": ("pages.daily_calibration_records", "DailyCalibrationRecordsPage"),
+    "upcoming_calibrations": ("pages.upcoming_calibrations", "UpcomingCalibrationsPage"),
+    "add_tool_type": ("pages.tool_type_add", "AddToolTypePage"),
+    "update_tool_type": ("pages.tool_type_update", "UpdateToolTypePage"),
+    "register_tool": ("pages.tool_register", "RegisterToolPage"),
+    "update_tool": ("pages.tool_update", "UpdateToolPage"),
+    "import_tools": ("pages.tool_import", "ImportToolsPage"),
+    "mass_calibration": ("pages.mass_calibration", "MassCalibrationPage"),
+}
+
+
+class MainWindow(QMainWindow):
+    """The application's only top-level window; pages are stacked inside it.
+
+    navigate(name) imports and builds a page the first time it is visited
+    and reuses that instance afterwards, so moving between pages only swaps
+    the visible widget. Pages may define on_enter() (called every time the
+    page is shown; refresh anything that can go stale here rather than in
+    __init__) and on_leave() (called when another page replaces it).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("QC Calibration")
+        self.setMinimumSize(1000, 600)
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+        self.pages = {}
+        self.current = None
+        self._retired = []  # dropped pages waiting for their background jobs to finish
+        self._waiting_for_jobs = False
+
+    def page(self, name):
+        """The cached instance of a page, built on first use."""
+        if name not in self.pages:
+            module_name, class_name = PAGES[name]
+            page = getattr(importlib.import_module(module_name), class_name)()
+            self.stack.addWidget(page)
+            self.pages[name] = page
+        return self.pages[name]
+
+    def navigate(self, name):
+        previous = self.pages.get(self.current)
+        page = self.page(name)
+        if previous is not None and previous is not page and hasattr(previous, "on_leave"):
+            previous.on_leave()
+        self.current = name
+        self.stack.setCurrentWidget(page)
+        self.setWindowTitle(page.windowTitle() or "QC Calibration")
+        if hasattr(page, "on_enter"):
+            page.on_enter()
+        return page
+
+    def reset(self, keep=()):
+        """Drop every cached page except those named in keep (e.g. on logout)."""
+        for name in list(self.pages):
+            if name in keep:
+                continue
+            page = self.pages.pop(name)
+            self.stack.removeWidget(page)
+            page.hide()
+            self._retired.append(page)
+        if self.current not in self.pages:
+            self.current = None
+        self._delete_retired()
+
+    def _delete_retired(self):
+        # Database jobs a page started may still call back into it (results,
+        # next pages, KPI loads), so dropped pages are only deleted once the
+        # executor has nothing in flight
+        executor = get_db_executor()
+        if executor.is_busy():
+            if not self._waiting_for_jobs:
+                executor.busy_changed.connect(self._on_executor_busy)
+                self._waiting_for_jobs = True
+            return
+        if self._waiting_for_jobs:
+            executor.busy_changed.disconnect(self._on_executor_busy)
+            self._waiting_for_jobs = False
+        pages, self._retired = self._retired, []
+        for page in pages:
+            page.deleteLater()
+
+    def _on_executor_busy(self, busy):
+        if not busy:
+            # Emitted just before the last job's callback runs, which may start another job
+            QTimer.singleShot(0, self._delete_retired)
+
+
+_window = None
+
+
+def get_main_window():
+    """Process-wide shell window, created on first use (needs a running QApplication)."""
+    global _window
+    if _window is None:
+        _window = MainWindow()
+    return _window
+
+
+def navigate(name):
+    return get_main_window().navigate(name)
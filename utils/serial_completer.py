@@ -0,0 +1,91 @@
+import logging
+from PySide6.QtCore import QObject, QStringListModel, QTimer, Qt, Signal
+from PySide6.QtWidgets import QCompleter
+from database.reference_cache import reference_cache
+from utils.workers import get_db_executor
+
+logger = logging.getLogger("qc.serial_completer")
+
+
+class SerialCompleter(QObject):
+    """Debounced serial number autocomplete for a QLineEdit.
+
+    After the user pauses typing, suggestions are taken from the reference
+    cache's in-memory prefix index (loaded in the background on first use)
+    and shown in a QCompleter popup. settled(text) is emitted after every
+    pause or completion pick, so pages can prefetch whatever they will
+    need when Enter is pressed.
+
+    Pass an existing single-shot timer to reuse it for the debounce.
+    """
+
+    settled = Signal(str)
+
+    def __init__(self, line_edit, timer=None, debounce_ms=150, limit=50):
+        super().__init__(line_edit)
+        self.line_edit = line_edit
+        self.limit = limit
+        self._loading = False
+
+        self.model = QStringListModel(self)
+        self.completer = QCompleter(self.model, self)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.PopupCompletion)
+        line_edit.setCompleter(self.completer)
+
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(debounce_ms)
+        self.timer = timer
+        self.timer.timeout.connect(self._on_settled)
+        line_edit.textEdited.connect(self.timer.start)
+        self.completer.activated.connect(self._on_activated)
+
+    def may_exist(self, serial):
+        """False only if the loaded index says there is no such serial."""
+        matches = reference_cache.serials_with_prefix(serial, limit=1)
+        return matches is None or matches == [serial]
+
+    def _on_settled(self):
+        text = self.line_edit.text().strip()
+        if text:
+            self._update_matches(text)
+        self.settled.emit(text)
+
+    def _on_activated(self, text):
+        self.timer.stop()
+        self.settled.emit(text)
+
+    def _update_matches(self, text):
+        matches = reference_cache.serials_with_prefix(text, self.limit)
+        if matches is None:
+            self._load_index()
+            return
+        self.model.setStringList(matches)
+        if matches and self.line_edit.hasFocus() and matches != [text]:
+            self.completer.setCompletionPrefix(text)
+            self.completer.complete()
+
+    def _load_index(self):
+        if self._loading:
+            return
+        self._loading = True
+        get_db_executor().submit(
+            reference_cache.serial_numbers,
+            on_result=lambda serials: self._on_index_loaded(),
+            on_error=self._on_index_failed,
+            owner=self,
+            action="SerialCompleter.load_index",
+        )
+
+    def _on_index_loaded(self):
+        self._loading = False
+        text = self.line_edit.text().strip()
+        if text:
+            self._update_matches(text)
+
+    def _on_index_failed(self, error):
+        # No suggestions, but lookups on Enter still work
+        self._loading = False
+        logger.warning("Failed to load serial numbers for autocomplete: %s", error)
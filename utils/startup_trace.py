@@ -0,0 +1,66 @@
+"""Startup milestones for benchmarks/startup_benchmark.py.
+
+When QC_STARTUP_TRACE names a file, main.py records wall-clock times for
+each startup step, writes them there as JSON once the login window has
+painted and the database layer has finished loading, and quits. Without
+the variable every call here is a no-op.
+"""
+import json
+import os
+import sys
+import time
+from PySide6.QtCore import QObject, QEvent
+from PySide6.QtWidgets import QApplication
+
+TRACE_ENV = "QC_STARTUP_TRACE"
+
+# Packages that should not be imported before the login window is on screen
+HEAVY_PACKAGES = ("sqlalchemy", "numpy", "openpyxl", "pyarrow", "psycopg2", "models")
+
+_path = os.environ.get(TRACE_ENV)
+_marks = {}
+_info = {}
+_paint_filter = None
+
+
+def enabled():
+    return bool(_path)
+
+
+def mark(name, at=None):
+    if _path and name not in _marks:
+        _marks[name] = at if at is not None else time.time()
+
+
+class _FirstPaintFilter(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            mark("first_paint")
+            _info["modules_at_first_paint"] = len(sys.modules)
+            _info["heavy_before_first_paint"] = sorted(p for p in HEAVY_PACKAGES if p in sys.modules)
+            _finish_if_done()
+        return False
+
+
+def watch_first_paint(widget):
+    global _paint_filter
+    if _path:
+        _paint_filter = _FirstPaintFilter()
+        widget.installEventFilter(_paint_filter)
+
+
+def database_loaded(ok):
+    """The background preload of the database layer finished (ok=False: connecting failed)."""
+    mark("database_ready" if ok else "database_failed")
+    _finish_if_done()
+
+
+def _finish_if_done():
+    if not _path or "first_paint" not in _marks:
+        return
+    if "database_ready" not in _marks and "database_failed" not in _marks:
+        return
+    with open(_path, "w") as f:
+        json.dump({"marks": _marks, **_info}, f, indent=2)
+    QApplication.quit()
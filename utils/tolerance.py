@@ -0,0 +1,76 @@
+"""Pass/fail evaluation of block readings against tool type tolerances.
+
+Works on whole arrays at once: row i holds one validation's three block
+readings, the tool type's three block values and its tolerance. A block
+passes when block - tolerance <= reading <= block + tolerance. Blocks the
+tool type does not define (NaN block) or that have no reading (the
+optional missing mask) are not applicable (NA) and do not affect the
+overall result, which passes when no applicable block failed. A NaN or
+infinite reading is never within tolerance.
+
+The validation form evaluates a single row via evaluate_one(); batch
+re-evaluation (database/reevaluate.py) feeds chunks of historical records.
+"""
+import math
+from typing import NamedTuple
+import numpy as np
+
+BLOCKS = 3
+
+# Per-block result codes
+FAIL = 0
+PASS = 1
+NA = -1
+
+
+class Evaluation(NamedTuple):
+    block_results: np.ndarray  # int8 (n, BLOCKS) of PASS / FAIL / NA
+    passed: np.ndarray         # bool (n,)
+
+
+def parse_reading(text):
+    """A typed or imported reading as a float; ValueError unless it is a finite number
+    (float() alone accepts "nan" and "inf")."""
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"reading is not a finite number: {text!r}")
+    return value
+
+
+def as_float_array(values, shape=None):
+    """None -> NaN; keeps float arrays as they are."""
+    array = np.asarray(values, dtype=np.float64)
+    return array.reshape(shape) if shape is not None else array
+
+
+def evaluate(readings, blocks, tolerances, missing=None):
+    """readings and blocks: (n, BLOCKS) floats, NaN for blocks the tool type lacks;
+    tolerances: (n,); missing: (n, BLOCKS) bools, True where no reading was taken."""
+    readings = as_float_array(readings)
+    blocks = as_float_array(blocks)
+    tolerances = as_float_array(tolerances)[:, np.newaxis]
+    missing = np.zeros(blocks.shape, dtype=bool) if missing is None else np.asarray(missing, dtype=bool)
+
+    # Same arithmetic as the bounds shown on the validation form, so a
+    # reading exactly on a displayed bound gets the same result
+    low = blocks - tolerances
+    high = blocks + tolerances
+    applicable = ~(np.isnan(blocks) | missing)
+    within = np.isfinite(readings) & (low <= readings) & (readings <= high)
+
+    block_results = np.where(applicable, np.where(within, PASS, FAIL), NA).astype(np.int8)
+    passed = ~np.any(block_results == FAIL, axis=1)
+    return Evaluation(block_results, passed)
+
+
+def evaluate_one(readings, blocks, tolerance):
+    """Single validation: returns (["Pass"/"Fail"/None per block], "Pass"/"Fail")."""
+    evaluation = evaluate(
+        as_float_array(readings, (1, BLOCKS)),
+        as_float_array(blocks, (1, BLOCKS)),
+        [tolerance],
+        missing=[[reading is None for reading in readings]],
+    )
+    labels = {PASS: "Pass", FAIL: "Fail", NA: None}
+    block_labels = [labels[int(code)] for code in evaluation.block_results[0]]
+    return block_labels, "Pass" if evaluation.passed[0] else "Fail"
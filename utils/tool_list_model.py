@@ -0,0 +1,130 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from database.calibration import calibration_due
+
+SELECT_COLUMN = 0
+SERIAL_COLUMN = 1
+
+
+class CheckableToolsModel(QAbstractTableModel):
+    """Tool list with a check box per row, for the mass calibration page.
+
+    Checked state lives in a set of serial numbers, not in the rows or the
+    view, so it survives filtering (done by a proxy on top) and reloads.
+    After an update, update_tools()/remove_tools() patch only the rows that
+    changed instead of reloading the whole list.
+    """
+
+    headers = ["Select", "Serial Number", "Status", "Last Calibration Date", "Calibration Due"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []          # [serial, status, last_calibration, calibration_due]
+        self._row_by_serial = {}
+        self.selected = set()
+
+    # Loading
+    def set_tools(self, tools):
+        """Replace the rows; checks on tools that are still listed are kept."""
+        self.beginResetModel()
+        self._rows = [
+            [tool.serial_number, tool.tool_status, tool.last_calibration, tool.calibration_due] for tool in tools
+        ]
+        self._reindex()
+        self.selected &= self._row_by_serial.keys()
+        self.endResetModel()
+
+    def _reindex(self):
+        self._row_by_serial = {row[0]: i for i, row in enumerate(self._rows)}
+
+    # Checked state
+    def selected_serials(self):
+        # In table order, so updates are applied in the order the user sees
+        return [row[0] for row in self._rows if row[0] in self.selected]
+
+    def set_checked(self, serials, checked):
+        serials = [s for s in serials if s in self._row_by_serial]
+        if checked:
+            self.selected.update(serials)
+        else:
+            self.selected.difference_update(serials)
+        self._emit_changed(serials, SELECT_COLUMN, SELECT_COLUMN)
+
+    # Patching after an update
+    def update_tools(self, serials, new_status=None, new_date=None):
+        changed = []
+        for serial in serials:
+            row = self._row_by_serial.get(serial)
+            if row is None:
+                continue
+            if new_status:
+                self._rows[row][1] = new_status
+            if new_date:
+                self._rows[row][2] = new_date
+                self._rows[row][3] = calibration_due(new_date)
+            changed.append(serial)
+        self._emit_changed(changed, SELECT_COLUMN, len(self.headers) - 1)
+
+    def remove_tools(self, serials):
+        rows = sorted((self._row_by_serial[s] for s in serials if s in self._row_by_serial), reverse=True)
+        # Remove contiguous runs from the bottom up so earlier row numbers stay valid
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        self.selected.difference_update(serials)
+        self._reindex()
+
+    def _emit_changed(self, serials, first_column, last_column):
+        rows = [self._row_by_serial[s] for s in serials]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), first_column), self.index(max(rows), last_column))
+
+    # Model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == SELECT_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        serial, status, last_calibration, due = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.CheckStateRole and column == SELECT_COLUMN:
+            return Qt.Checked if serial in self.selected else Qt.Unchecked
+        if role == Qt.DisplayRole:
+            if column == SERIAL_COLUMN:
+                return serial
+            if column == 2:
+                return status
+            if column == 3:
+                return last_calibration.strftime("%Y-%m-%d") if last_calibration else "N/A"
+            if column == 4:
+                return due.strftime("%Y-%m-%d") if due else "N/A"
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != SELECT_COLUMN:
+            return False
+        serial = self._rows[index.row()][0]
+        if Qt.CheckState(value) == Qt.Checked:
+            self.selected.add(serial)
+        else:
+            self.selected.discard(serial)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
@@ -0,0 +1,186 @@
+import itertools
+import logging
+import shiboken6
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot, Qt
+from PySide6.QtWidgets import QApplication
+
+
+class _JobSignals(QObject):
+    # (job_id, result) / (job_id, exception) / (job_id, (done, total))
+    succeeded = Signal(int, object)
+    failed = Signal(int, object)
+    progressed = Signal(int, object)
+
+
+class _DbJob(QRunnable):
+    """Runs fn(db, *args, **kwargs) inside its own session scope on a pool thread.
+
+    With reports_progress, fn also gets a progress(done, total) callback
+    that forwards to the GUI thread.
+    """
+
+    def __init__(self, job_id, action, fn, args, kwargs, reports_progress=False):
+        super().__init__()
+        self.job_id = job_id
+        self.action = action
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _JobSignals()
+        if reports_progress:
+            self.kwargs["progress"] = self._report_progress
+
+    def _report_progress(self, done, total):
+        self.signals.progressed.emit(self.job_id, (done, total))
+
+    def run(self):
+        try:
+            # Imported here rather than at module level so that the login window
+            # can paint before SQLAlchemy is loaded; the first job pays for it,
+            # on a pool thread
+            from database.db import session_scope
+            from database.instrumentation import action_tag
+            with action_tag(self.action), session_scope() as db:
+                result = self.fn(db, *self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, e)
+        else:
+            self.signals.succeeded.emit(self.job_id, result)
+
+
+logger = logging.getLogger("qc.workers")
+
+
+def _callback_owner(*callbacks):
+    # Callbacks that are bound methods of a QObject belong to it; lambdas
+    # need the owner passed explicitly
+    for callback in callbacks:
+        owner = getattr(callback, "__self__", None)
+        if isinstance(owner, QObject):
+            return owner
+    return None
+
+
+class DbExecutor(QObject):
+    """Shared worker pool for database jobs.
+
+    Jobs run off the GUI thread, at most max_jobs at a time; their callbacks
+    are always invoked back on the GUI thread. busy_changed(True) is emitted
+    while any job is running. The application shows a busy cursor only for
+    jobs the user is waiting on: those that pass busy_widgets, or
+    busy_cursor=True. Background jobs (prefetch, autocomplete, paging)
+    leave the cursor alone.
+
+    Usage:
+        db_executor.submit(queries.load_tools, tool_type_id,
+                           on_result=lambda tools: self.display_tools(tool_type_id, tools),
+                           on_error=self.show_error,
+                           busy_widgets=[self.update_button],
+                           owner=self,
+                           action="MassCalibrationPage.load_tools")
+
+    owner is the QObject the callbacks belong to; if it has been deleted by
+    the time the job finishes, the callbacks are dropped instead of raising
+    "Internal C++ object already deleted". It defaults to the object of the
+    first callback that is a bound method, so pass it whenever a callback
+    is a lambda or partial.
+
+    Passing on_progress makes the job receive a progress(done, total)
+    keyword argument; each call is delivered to on_progress(done, total).
+    """
+
+    busy_changed = Signal(bool)
+
+    def __init__(self, max_jobs=4, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_jobs)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._cursor_jobs = set()  # job ids showing the busy cursor
+
+    def submit(self, fn, *args, on_result=None, on_error=None, on_progress=None, busy_widgets=(),
+               busy_cursor=None, owner=None, action=None, **kwargs):
+        """Queue fn(db, *args, **kwargs); action names the issuing page in SQL diagnostics."""
+        job_id = next(self._ids)
+        job = _DbJob(job_id, action or fn.__name__, fn, args, kwargs, reports_progress=on_progress is not None)
+        # Queued connections: the slots run in this object's (the GUI) thread
+        job.signals.succeeded.connect(self._on_succeeded, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_failed, Qt.QueuedConnection)
+        job.signals.progressed.connect(self._on_progressed, Qt.QueuedConnection)
+
+        for widget in busy_widgets:
+            widget.setEnabled(False)
+        if owner is None:
+            owner = _callback_owner(on_result, on_error, on_progress)
+        self._pending[job_id] = (job.signals, on_result, on_error, on_progress, list(busy_widgets), owner)
+        if busy_cursor if busy_cursor is not None else bool(busy_widgets):
+            if not self._cursor_jobs:
+                QApplication.setOverrideCursor(Qt.BusyCursor)
+            self._cursor_jobs.add(job_id)
+        if len(self._pending) == 1:
+            self.busy_changed.emit(True)
+
+        self.pool.start(job)
+        return job_id
+
+    def is_busy(self):
+        return bool(self._pending)
+
+    def wait_for_done(self, msecs=-1):
+        """Block until all queued jobs have run (used at shutdown)."""
+        return self.pool.waitForDone(msecs)
+
+    def _finish(self, job_id):
+        """Returns (on_result, on_error), or (None, None) if the owner has been deleted."""
+        signals, on_result, on_error, _, busy_widgets, owner = self._pending.pop(job_id)
+        for widget in busy_widgets:
+            try:
+                widget.setEnabled(True)
+            except RuntimeError:
+                pass  # widget was deleted while the job ran
+        if job_id in self._cursor_jobs:
+            self._cursor_jobs.discard(job_id)
+            if not self._cursor_jobs:
+                QApplication.restoreOverrideCursor()
+        if not self._pending:
+            self.busy_changed.emit(False)
+        if owner is not None and not shiboken6.isValid(owner):
+            return None, None
+        return on_result, on_error
+
+    @Slot(int, object)
+    def _on_succeeded(self, job_id, result):
+        on_result, _ = self._finish(job_id)
+        if on_result:
+            on_result(result)
+
+    @Slot(int, object)
+    def _on_progressed(self, job_id, done_total):
+        # A progress signal can still be queued behind the job's final result
+        pending = self._pending.get(job_id)
+        if not pending or not pending[3]:
+            return
+        owner = pending[5]
+        if owner is None or shiboken6.isValid(owner):
+            pending[3](*done_total)
+
+    @Slot(int, object)
+    def _on_failed(self, job_id, error):
+        has_handler = self._pending[job_id][2] is not None
+        _, on_error = self._finish(job_id)
+        if on_error:
+            on_error(error)
+        elif not has_handler:
+            logger.error("Background database job failed: %s", error, exc_info=error)
+
+
+_executor = None
+
+
+def get_db_executor():
+    """Process-wide executor, created on first use (needs a running QApplication)."""
+    global _executor
+    if _executor is None:
+        _executor = DbExecutor()
+    return _executor